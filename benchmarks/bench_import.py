@@ -0,0 +1,112 @@
+"""
+Import-time benchmark for the CLI entry modules.
+
+Imports each module in a fresh interpreter with `python -X importtime`,
+reports the cumulative import time (median of several runs) and the
+slowest third-party packages it pulled in, and checks that none of the
+heavy packages that should load lazily were imported.
+
+Usage:
+    python -m benchmarks.bench_import
+    python -m benchmarks.bench_import --repeat 5 src.agents.about_graph
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+
+ENTRY_MODULES = [
+    "src.agents.about_graph",
+    "src.agents.about_graph_parallel",
+    "src.agents.run_batch_production",
+    "src.agents.run_batch_async",
+]
+
+# Packages that must only load when a model call or graph run needs them
+LAZY_PACKAGES = ("langextract", "langgraph", "pandas", "IPython")
+
+
+def import_profile(module: str) -> Dict[str, int]:
+    """
+    Import a module in a fresh interpreter and collect import times.
+
+    The child gets an unreachable MinIO endpoint, so an import that
+    touches the network fails instead of passing slowly.
+
+    Args:
+        module: Module to import
+
+    Returns:
+        {imported module name: cumulative import time in microseconds}
+    """
+    env = dict(os.environ, MINIO_ENDPOINT="127.0.0.1:9", PYTHONPATH=str(ROOT))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def run_once(module: str, repeat: int) -> Dict:
+    """
+    Measure one module.
+
+    Args:
+        module: Module to import
+        repeat: Fresh interpreters to start
+
+    Returns:
+        Median import time, heaviest packages and lazy packages loaded
+    """
+    profiles = [import_profile(module) for _ in range(repeat)]
+    last = profiles[-1]
+    top_level = {
+        name: value
+        for name, value in last.items()
+        if "." not in name and not name.startswith("src")
+    }
+    return {
+        "module": module,
+        "median_ms": statistics.median(p[module] for p in profiles) / 1000,
+        "heaviest": sorted(top_level.items(), key=lambda kv: -kv[1])[:3],
+        "lazy_loaded": sorted(
+            {name.split(".")[0] for name in last} & set(LAZY_PACKAGES)
+        ),
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("modules", nargs="*", default=ENTRY_MODULES)
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per module")
+    args = parser.parse_args(argv)
+
+    print(f"{'module':<36} {'median':>9}  heaviest packages")
+    for module in args.modules:
+        r = run_once(module, args.repeat)
+        heaviest = ", ".join(f"{n} {v / 1000:.0f}ms" for n, v in r["heaviest"])
+        print(f"{r['module']:<36} {r['median_ms']:>7.0f}ms  {heaviest}")
+        if r["lazy_loaded"]:
+            print(f"  ⚠️  loaded eagerly: {', '.join(r['lazy_loaded'])}")
+
+
+if __name__ == "__main__":
+    main()
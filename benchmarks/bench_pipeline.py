@@ -0,0 +1,397 @@
+"""
+End-to-end throughput benchmark for every runner.
+
+Each configuration runs in its own subprocess on top of an in-memory MinIO
+and the fake LLM backend, so peak RSS and module-level state are isolated.
+Reports files/sec, per-stage p50/p95/p99 latency and peak RSS, and writes
+all results to a JSON file that can be compared across commits.
+
+Usage:
+    python -m benchmarks.bench_pipeline
+    python -m benchmarks.bench_pipeline --runners production async \\
+        --counts 100 1000 10000 100000 --workers 5 20 50
+    python -m benchmarks.bench_pipeline --compare old.json new.json
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+RUNNERS = ("production", "async", "graph", "graph-parallel", "simple")
+
+# Runners that process one object at a time ignore extraction_max_workers
+SEQUENTIAL_RUNNERS = ("graph", "simple")
+
+PREFIX = "scraped-content/"
+BUCKET = "bench"
+RESULTS_DIR = Path(__file__).parent / "results"
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _child_env(args: argparse.Namespace, workers: int, log_file: str) -> Dict:
+    """Settings for one benchmark subprocess (environment overrides .env)."""
+    env = dict(os.environ)
+    env.update(
+        {
+            "MINIO_BUCKET_NAME": BUCKET,
+            "EXTRACTION_MAX_WORKERS": str(workers),
+            "EXTRACTION_CACHE_ENABLED": "false",
+            "EXTRACTION_BATCH_ENABLED": "false",
+            "SKIP_INDEX_PATH": "",
+            "RATE_LIMIT_REQUESTS_PER_MINUTE": str(args.rpm),
+            "RATE_LIMIT_DELAY_BETWEEN_REQUESTS": "0",
+            "RATE_LIMIT_TOKENS_PER_MINUTE": "0",
+            "EXTRACTION_RETRY_DELAY": "0",
+            "LOG_LEVEL": args.log_level,
+            "LOG_FILE": log_file,
+            "PYTHONPATH": str(ROOT),
+        }
+    )
+    return env
+
+
+def run_configuration(
+    args: argparse.Namespace, runner: str, count: int, workers: int
+) -> Dict:
+    """
+    Run one (runner, object count, workers) configuration in a subprocess.
+
+    Args:
+        args: Parsed command-line arguments
+        runner: One of RUNNERS
+        count: Number of markdown objects in the bucket
+        workers: extraction_max_workers for the run
+
+    Returns:
+        Result dictionary
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        # The child runs in the temp dir, so runner outputs with relative
+        # paths (logs/extraction_stats.json, cache/) stay out of the repo
+        if (ROOT / ".env").exists():
+            shutil.copy(ROOT / ".env", tmp)
+        result_path = os.path.join(tmp, "result.json")
+        cmd = [
+            sys.executable,
+            "-m",
+            "benchmarks.bench_pipeline",
+            "--child",
+            runner,
+            "--child-count",
+            str(count),
+            "--child-output",
+            result_path,
+            "--doc-chars",
+            str(args.doc_chars),
+            "--llm-distribution",
+            args.llm_distribution,
+            "--llm-latency",
+            str(args.llm_latency),
+            "--llm-sigma",
+            str(args.llm_sigma),
+            "--llm-error-rate",
+            str(args.llm_error_rate),
+            "--storage-latency",
+            str(args.storage_latency),
+        ]
+        base = {"runner": runner, "objects": count, "workers": workers}
+        try:
+            proc = subprocess.run(
+                cmd,
+                env=_child_env(args, workers, os.path.join(tmp, "bench.log")),
+                cwd=tmp,
+                check=False,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                timeout=args.timeout,
+                text=True,
+            )
+        except subprocess.TimeoutExpired:
+            return {**base, "status": "timeout"}
+
+        if proc.returncode != 0 or not os.path.exists(result_path):
+            return {**base, "status": "failed", "stderr": proc.stderr[-2000:]}
+
+        with open(result_path, encoding="utf-8") as f:
+            return {**base, "status": "ok", **json.load(f)}
+
+
+def _install_fakes(args: argparse.Namespace):
+    """
+    Patch MinIO and LangExtract with instrumented in-process stand-ins.
+
+    Must run before any runner module is imported, since about_graph
+    creates its MinIO client at import time.
+
+    Returns:
+        StageTimer collecting per-stage latencies
+    """
+    import langextract as lx
+
+    import src.modules.minio_manager as minio_module
+    from benchmarks.fakes import InMemoryMinio, StageTimer
+    from src.modules.llm_backends import FakeExtractionBackend
+
+    timer = StageTimer()
+
+    InMemoryMinio.reset()
+    InMemoryMinio.latency = args.storage_latency
+    InMemoryMinio.timer = timer
+    InMemoryMinio.seed(BUCKET, args.child_count, args.doc_chars, PREFIX)
+    minio_module.Minio = InMemoryMinio
+
+    manager = minio_module.MinIOManager
+    manager.download_object = timer.timed("download", manager.download_object)
+    manager.upload_json = timer.timed("upload", manager.upload_json)
+    manager.object_exists = timer.timed("stat", manager.object_exists)
+
+    # Both extractor generations call lx.extract, so simulate the LLM there
+    backend = FakeExtractionBackend(
+        latency_distribution=args.llm_distribution,
+        latency_mean=args.llm_latency,
+        latency_sigma=args.llm_sigma,
+        error_rate=args.llm_error_rate,
+        seed=0,
+    )
+
+    def fake_extract(text_or_documents, prompt_description, examples, **kwargs):
+        return backend.extract(
+            text_or_documents,
+            prompt_description,
+            examples,
+            kwargs.get("max_char_buffer"),
+        )
+
+    lx.extract = timer.timed("llm", fake_extract)
+    return timer
+
+
+def _run_runner(runner: str):
+    """Import and run one runner's entry point."""
+    if runner == "production":
+        from src.agents.run_batch_production import run_batch_extraction_parallel
+
+        run_batch_extraction_parallel()
+    elif runner == "async":
+        from src.agents.run_batch_async import main
+
+        main()
+    elif runner == "graph":
+        from src.agents.about_graph import main
+
+        main([])
+    elif runner == "graph-parallel":
+        from src.agents.about_graph_parallel import main
+
+        main()
+    elif runner == "simple":
+        from src.agents.run_about_extraction import run_batch_about_extraction
+
+        run_batch_about_extraction()
+    else:
+        raise ValueError(f"Unknown runner: {runner}")
+
+
+def run_child(args: argparse.Namespace):
+    """Benchmark one runner in this process and write the result JSON."""
+    timer = _install_fakes(args)
+
+    from benchmarks.fakes import InMemoryMinio
+
+    start = time.perf_counter()
+    _run_runner(args.child)
+    elapsed = time.perf_counter() - start
+
+    results = [
+        key
+        for key in InMemoryMinio._keys.get(BUCKET, [])
+        if key.endswith(".about.json")
+    ]
+    peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    with open(args.child_output, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "elapsed_seconds": round(elapsed, 3),
+                "files_per_second": round(args.child_count / elapsed, 2),
+                "results_written": len(results),
+                "peak_rss_mb": round(peak_rss_kb / 1024, 1),
+                "stages_ms": timer.percentiles(),
+            },
+            f,
+        )
+
+
+def _git_commit() -> Optional[str]:
+    with contextlib.suppress(Exception):
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    return None
+
+
+def _print_result(r: Dict):
+    if r["status"] != "ok":
+        print(f"{r['runner']:>10} {r['objects']:>8} {r['workers']:>7}  {r['status']}")
+        return
+
+    stages = r["stages_ms"]
+    llm = stages.get("llm", {})
+    download = stages.get("download", {})
+    print(
+        f"{r['runner']:>10} {r['objects']:>8} {r['workers']:>7} "
+        f"{r['files_per_second']:>10.1f} "
+        f"{llm.get('p50', 0):>8.1f} {llm.get('p99', 0):>8.1f} "
+        f"{download.get('p99', 0):>9.2f} {r['peak_rss_mb']:>8.1f}"
+    )
+
+
+def run_sweep(args: argparse.Namespace):
+    """Run every configuration and write the JSON report."""
+    commit = _git_commit()
+    output = Path(
+        args.output
+        or RESULTS_DIR
+        / f"pipeline_{commit or 'nogit'}_{datetime.now():%Y%m%d-%H%M%S}.json"
+    )
+
+    print(
+        f"{'runner':>10} {'objects':>8} {'workers':>7} {'files/s':>10} "
+        f"{'llm p50':>8} {'llm p99':>8} {'dl p99':>9} {'rss MB':>8}"
+    )
+    results: List[Dict] = []
+    for runner in args.runners:
+        worker_counts = [1] if runner in SEQUENTIAL_RUNNERS else args.workers
+        for count in args.counts:
+            for workers in worker_counts:
+                result = run_configuration(args, runner, count, workers)
+                results.append(result)
+                _print_result(result)
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    report = {
+        "commit": commit,
+        "timestamp": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {
+            "doc_chars": args.doc_chars,
+            "llm_distribution": args.llm_distribution,
+            "llm_latency": args.llm_latency,
+            "llm_sigma": args.llm_sigma,
+            "llm_error_rate": args.llm_error_rate,
+            "storage_latency": args.storage_latency,
+            "rpm": args.rpm,
+        },
+        "results": results,
+    }
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {output}")
+
+
+def compare(old_path: str, new_path: str):
+    """Print files/sec of two reports side by side."""
+    with open(old_path, encoding="utf-8") as f:
+        old = json.load(f)
+    with open(new_path, encoding="utf-8") as f:
+        new = json.load(f)
+
+    def index(report: Dict) -> Dict:
+        return {
+            (r["runner"], r["objects"], r["workers"]): r
+            for r in report["results"]
+            if r["status"] == "ok"
+        }
+
+    old_results, new_results = index(old), index(new)
+    print(f"{old.get('commit')} -> {new.get('commit')}")
+    print(
+        f"{'runner':>10} {'objects':>8} {'workers':>7} "
+        f"{'old f/s':>9} {'new f/s':>9} {'change':>8}"
+    )
+    for key in sorted(old_results.keys() & new_results.keys()):
+        before = old_results[key]["files_per_second"]
+        after = new_results[key]["files_per_second"]
+        change = (after / before - 1) * 100 if before else 0.0
+        print(
+            f"{key[0]:>10} {key[1]:>8} {key[2]:>7} "
+            f"{before:>9.1f} {after:>9.1f} {change:>+7.1f}%"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runners", nargs="+", choices=RUNNERS, default=RUNNERS)
+    parser.add_argument(
+        "--counts", type=int, nargs="+", default=[100, 1000], help="Object counts"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[5, 20],
+        help="extraction_max_workers values (parallel runners only)",
+    )
+    parser.add_argument(
+        "--doc-chars", type=int, default=6000, help="Approximate page size"
+    )
+    parser.add_argument(
+        "--llm-distribution",
+        default="lognormal",
+        choices=("fixed", "uniform", "exponential", "lognormal"),
+    )
+    parser.add_argument(
+        "--llm-latency", type=float, default=0.02, help="Mean LLM latency (s)"
+    )
+    parser.add_argument("--llm-sigma", type=float, default=0.5)
+    parser.add_argument("--llm-error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--storage-latency", type=float, default=0.0, help="Per MinIO call (s)"
+    )
+    parser.add_argument(
+        "--rpm",
+        type=int,
+        default=10_000_000,
+        help="RateLimiter requests per minute (default: effectively unlimited)",
+    )
+    parser.add_argument("--log-level", default="WARNING")
+    parser.add_argument(
+        "--timeout", type=float, default=1800, help="Seconds per configuration"
+    )
+    parser.add_argument("--output", help="Result file (default: benchmarks/results/)")
+    parser.add_argument(
+        "--compare", nargs=2, metavar=("OLD", "NEW"), help="Compare two reports"
+    )
+
+    # Internal: run a single configuration in this process
+    parser.add_argument("--child", choices=RUNNERS, help=argparse.SUPPRESS)
+    parser.add_argument("--child-count", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--child-output", help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+    elif args.child:
+        run_child(args)
+    else:
+        run_sweep(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Microbenchmark for RateLimiter throughput under thread contention.
+
+Runs N worker threads that call wait_if_needed() in a tight loop and
+compares the achieved request rate to the configured ceiling.
+
+Usage:
+    python -m benchmarks.bench_rate_limiter
+    python -m benchmarks.bench_rate_limiter --rpm 6000 --duration 10 --workers 5 20 100
+"""
+
+import argparse
+import threading
+import time
+from typing import Dict, List
+
+from src.modules.retry_handler import RateLimiter
+
+
+def run_once(requests_per_minute: int, workers: int, duration: float) -> Dict:
+    """
+    Measure achieved throughput for one worker count.
+
+    Args:
+        requests_per_minute: Configured ceiling
+        workers: Number of concurrent threads
+        duration: Measurement window in seconds
+
+    Returns:
+        Dictionary with achieved rate and ratio to the ceiling
+    """
+    limiter = RateLimiter(
+        requests_per_minute=requests_per_minute, delay_between_requests=0
+    )
+    # Start from an empty bucket so the initial burst doesn't inflate the rate
+    limiter._requests.tokens = 0
+
+    counts: List[int] = [0] * workers
+    waits: List[float] = [0.0] * workers
+    start = time.monotonic()
+    deadline = start + duration
+
+    def worker(idx: int):
+        while True:
+            waits[idx] += limiter.wait_if_needed()
+            if time.monotonic() > deadline:
+                break
+            counts[idx] += 1
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(workers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    ceiling = requests_per_minute / 60
+    achieved = sum(counts) / duration
+    return {
+        "workers": workers,
+        "ceiling_per_second": ceiling,
+        "achieved_per_second": achieved,
+        "ratio": achieved / ceiling,
+        "min_per_worker": min(counts),
+        "max_per_worker": max(counts),
+        "avg_wait_seconds": sum(waits) / max(sum(counts), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rpm", type=int, default=3000, help="Requests per minute")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per run")
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[5, 20, 100], help="Worker counts"
+    )
+    args = parser.parse_args()
+
+    print(f"RateLimiter ceiling: {args.rpm} req/min ({args.rpm / 60:.1f} req/s)")
+    print(f"{'workers':>8} {'achieved/s':>11} {'ratio':>7} {'min/max per worker':>20}")
+    for workers in args.workers:
+        r = run_once(args.rpm, workers, args.duration)
+        print(
+            f"{r['workers']:>8} {r['achieved_per_second']:>11.2f} {r['ratio']:>7.3f} "
+            f"{r['min_per_worker']:>9}/{r['max_per_worker']:<10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,415 @@
+"""
+In-process MinIO stand-in and instrumentation for the pipeline benchmarks.
+
+InMemoryMinio implements the subset of the minio.Minio client API that
+MinIOManager uses, so the real MinIOManager, skip index and runners run
+unchanged on top of it. StageTimer collects per-stage latencies from the
+instrumented MinIOManager methods and the simulated LLM (see
+src.modules.llm_backends.FakeExtractionBackend).
+"""
+
+import bisect
+import hashlib
+import io
+import queue
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import quote_plus
+
+from minio.datatypes import Object
+from minio.error import S3Error
+
+FILLER = (
+    "Willkommen in unserer Praxis. Wir bieten moderne Behandlungen, "
+    "persönliche Beratung und flexible Termine für die ganze Familie.\n"
+)
+
+IMPRESSUM_TEMPLATE = """
+## Impressum
+
+Angaben gemäß § 5 TMG:
+Muster Praxis {n} GmbH
+Musterstraße {n}, 10115 Berlin
+
+Vertreten durch den Geschäftsführer: Dr. Max Muster {n}
+
+Telefon: +49 30 {n:07d}
+Telefax: +49 30 {n:07d}-9
+E-Mail: m.muster{n}@praxis-{n}.de
+Internet: www.praxis-{n}.de
+"""
+
+
+def sample_markdown(n: int, chars: int) -> str:
+    """
+    Build a scraped page with filler around an Impressum block.
+
+    Args:
+        n: Document number (makes every page unique)
+        chars: Approximate total page size
+
+    Returns:
+        Markdown text
+    """
+    impressum = IMPRESSUM_TEMPLATE.format(n=n)
+    filler_chars = max(chars - len(impressum), 0)
+    before = FILLER * (filler_chars // 2 // len(FILLER))
+    after = FILLER * (filler_chars // 2 // len(FILLER))
+    return f"# Praxis {n}\n\n{before}{impressum}\n{after}"
+
+
+def _percentile_ms(ordered: List[float], p: float) -> float:
+    """Nearest-rank percentile of sorted latencies, in milliseconds."""
+    idx = min(int(p / 100 * len(ordered)), len(ordered) - 1)
+    return round(ordered[idx] * 1000, 3)
+
+
+class StageTimer:
+    """
+    Thread-safe collection of per-stage latencies in seconds.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+
+    def record(self, stage: str, seconds: float):
+        """Record one latency sample."""
+        with self._lock:
+            self.samples[stage].append(seconds)
+
+    def timed(self, stage: str, func):
+        """Wrap `func` so every call is recorded under `stage`."""
+
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(stage, time.perf_counter() - start)
+
+        wrapper.__wrapped__ = func
+        return wrapper
+
+    def percentiles(self) -> Dict[str, Dict[str, float]]:
+        """
+        Summarize every stage.
+
+        Returns:
+            {stage: {count, p50, p95, p99, max}} with latencies in milliseconds
+        """
+        summary = {}
+        with self._lock:
+            for stage, values in self.samples.items():
+                ordered = sorted(values)
+                if not ordered:
+                    continue
+
+                summary[stage] = {
+                    "count": len(ordered),
+                    "p50": _percentile_ms(ordered, 50),
+                    "p95": _percentile_ms(ordered, 95),
+                    "p99": _percentile_ms(ordered, 99),
+                    "max": round(ordered[-1] * 1000, 3),
+                }
+        return summary
+
+
+class _Response:
+    """Minimal urllib3-style response returned by get_object()."""
+
+    def __init__(self, data: bytes):
+        self._stream = io.BytesIO(data)
+        self.headers = {"etag": f'"{hashlib.md5(data).hexdigest()}"'}
+
+    def read(self) -> bytes:
+        return self._stream.read()
+
+    def close(self):
+        pass
+
+    def release_conn(self):
+        pass
+
+
+def _no_such_key(bucket_name: str, object_name: str) -> S3Error:
+    return S3Error(
+        None,
+        "NoSuchKey",
+        "Object does not exist",
+        f"/{bucket_name}/{object_name}",
+        None,
+        None,
+        bucket_name=bucket_name,
+        object_name=object_name,
+    )
+
+
+def _precondition_failed(bucket_name: str, object_name: str) -> S3Error:
+    return S3Error(
+        None,
+        "PreconditionFailed",
+        "At least one of the pre-conditions you specified did not hold",
+        f"/{bucket_name}/{object_name}",
+        None,
+        None,
+        bucket_name=bucket_name,
+        object_name=object_name,
+    )
+
+
+class _EventStream:
+    """Notification stream of InMemoryMinio (s3:ObjectCreated:Put events)."""
+
+    def __init__(self, bucket_name: str, prefix: str, suffix: str):
+        self.bucket_name = bucket_name
+        self.prefix = prefix
+        self.suffix = suffix
+        self._events: queue.Queue = queue.Queue()
+
+    def publish(self, bucket_name: str, object_name: str, data: bytes):
+        if bucket_name != self.bucket_name:
+            return
+        if not object_name.startswith(self.prefix):
+            return
+        if not object_name.endswith(self.suffix):
+            return
+        record = {
+            "eventName": "s3:ObjectCreated:Put",
+            "eventTime": datetime.now(timezone.utc).isoformat(),
+            "s3": {
+                "object": {
+                    "key": quote_plus(object_name, safe="/"),
+                    "size": len(data),
+                    "eTag": hashlib.md5(data).hexdigest(),
+                }
+            },
+        }
+        self._events.put({"Records": [record]})
+
+    def __iter__(self):
+        while True:
+            event = self._events.get()
+            if event is None:
+                return
+            yield event
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        with InMemoryMinio._lock:
+            if self in InMemoryMinio._listeners:
+                InMemoryMinio._listeners.remove(self)
+        self._events.put(None)
+
+
+class InMemoryMinio:
+    """
+    Thread-safe in-memory replacement for minio.Minio.
+
+    All instances share one store, like clients of the same server. Keys are
+    kept sorted so listings page with start_after exactly like S3.
+    """
+
+    _lock = threading.Lock()
+    _buckets: Dict[str, Dict[str, bytes]] = {}
+    _keys: Dict[str, List[str]] = {}
+    _metadata: Dict[Tuple[str, str], Dict[str, str]] = {}
+    _listeners: List["_EventStream"] = []
+
+    # Optional per-call delay in seconds to mimic network round trips
+    latency = 0.0
+    timer: Optional[StageTimer] = None
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    @classmethod
+    def reset(cls):
+        """Drop all buckets and objects."""
+        with cls._lock:
+            cls._buckets = {}
+            cls._keys = {}
+            cls._metadata = {}
+            cls._listeners = []
+
+    @classmethod
+    def seed(cls, bucket_name: str, count: int, chars: int, prefix: str):
+        """
+        Fill a bucket with `count` generated markdown pages.
+
+        Args:
+            bucket_name: Bucket to fill
+            count: Number of markdown objects
+            chars: Approximate size of each page
+            prefix: Key prefix (e.g. "scraped-content/")
+        """
+        with cls._lock:
+            store = cls._buckets.setdefault(bucket_name, {})
+            for n in range(count):
+                key = f"{prefix}site-{n:07d}/impressum.md"
+                store[key] = sample_markdown(n, chars).encode("utf-8")
+            cls._keys[bucket_name] = sorted(store)
+
+    def _pause(self):
+        if self.latency:
+            time.sleep(self.latency)
+
+    def bucket_exists(self, bucket_name: str) -> bool:
+        return bucket_name in self._buckets
+
+    def make_bucket(self, bucket_name: str):
+        with self._lock:
+            self._buckets.setdefault(bucket_name, {})
+            self._keys.setdefault(bucket_name, [])
+
+    def _page(
+        self, bucket_name: str, prefix: str, start_after: Optional[str], size: int
+    ) -> List[Object]:
+        """Return up to `size` objects after `start_after`, like one S3 page."""
+        start = time.perf_counter()
+        self._pause()
+        with self._lock:
+            keys = self._keys.get(bucket_name, [])
+            idx = bisect.bisect_left(keys, prefix)
+            if start_after:
+                idx = max(idx, bisect.bisect_right(keys, start_after))
+            page = []
+            for key in keys[idx : idx + size]:
+                if not key.startswith(prefix):
+                    break
+                data = self._buckets[bucket_name][key]
+                metadata = self._metadata.get((bucket_name, key))
+                page.append(
+                    Object(
+                        bucket_name,
+                        key,
+                        last_modified=datetime.now(timezone.utc),
+                        etag=hashlib.md5(data).hexdigest(),
+                        size=len(data),
+                        metadata={
+                            f"X-Amz-Meta-{name.title()}": value
+                            for name, value in metadata.items()
+                        }
+                        if metadata
+                        else None,
+                    )
+                )
+        if self.timer is not None:
+            self.timer.record("list", time.perf_counter() - start)
+        return page
+
+    def _iterate(
+        self,
+        bucket_name: str,
+        prefix: Optional[str],
+        start_after: Optional[str],
+        page_size: int,
+    ) -> Iterator[Object]:
+        prefix = prefix or ""
+        marker = start_after
+        while True:
+            page = self._page(bucket_name, prefix, marker, page_size)
+            yield from page
+            if len(page) < page_size:
+                return
+            marker = page[-1].object_name
+
+    def list_objects(
+        self,
+        bucket_name: str,
+        prefix: Optional[str] = None,
+        recursive: bool = False,
+        start_after: Optional[str] = None,
+        **kwargs,
+    ) -> Iterator[Object]:
+        return self._iterate(bucket_name, prefix, start_after, 1000)
+
+    def _list_objects(
+        self,
+        bucket_name: str,
+        delimiter: Optional[str] = None,
+        encoding_type: Optional[str] = None,
+        max_keys: Optional[int] = None,
+        prefix: Optional[str] = None,
+        start_after: Optional[str] = None,
+        **kwargs,
+    ) -> Iterator[Object]:
+        return self._iterate(bucket_name, prefix, start_after, max_keys or 1000)
+
+    def get_object(self, bucket_name: str, object_name: str, **kwargs) -> _Response:
+        self._pause()
+        try:
+            return _Response(self._buckets[bucket_name][object_name])
+        except KeyError:
+            raise _no_such_key(bucket_name, object_name) from None
+
+    def stat_object(self, bucket_name: str, object_name: str, **kwargs) -> Object:
+        self._pause()
+        data = self._buckets.get(bucket_name, {}).get(object_name)
+        if data is None:
+            raise _no_such_key(bucket_name, object_name)
+        return Object(bucket_name, object_name, size=len(data))
+
+    def put_object(
+        self, bucket_name: str, object_name: str, data, length: int, **kwargs
+    ):
+        self._pause()
+        payload = data.read(length)
+        with self._lock:
+            store = self._buckets.setdefault(bucket_name, {})
+            if object_name not in store:
+                bisect.insort(self._keys.setdefault(bucket_name, []), object_name)
+            store[object_name] = payload
+            if kwargs.get("metadata"):
+                self._metadata[(bucket_name, object_name)] = dict(kwargs["metadata"])
+            else:
+                self._metadata.pop((bucket_name, object_name), None)
+            listeners = list(self._listeners)
+        for stream in listeners:
+            stream.publish(bucket_name, object_name, payload)
+
+    def _put_object(
+        self,
+        bucket_name: str,
+        object_name: str,
+        data: bytes,
+        headers: Optional[Dict[str, str]] = None,
+        query_params=None,
+    ) -> SimpleNamespace:
+        """Single-part PUT honouring If-Match / If-None-Match atomically."""
+        self._pause()
+        headers = headers or {}
+        with self._lock:
+            store = self._buckets.setdefault(bucket_name, {})
+            current = store.get(object_name)
+            if headers.get("If-None-Match") == "*" and current is not None:
+                raise _precondition_failed(bucket_name, object_name)
+            if "If-Match" in headers:
+                if current is None:
+                    raise _no_such_key(bucket_name, object_name)
+                if headers["If-Match"].strip('"') != hashlib.md5(current).hexdigest():
+                    raise _precondition_failed(bucket_name, object_name)
+            if current is None:
+                bisect.insort(self._keys.setdefault(bucket_name, []), object_name)
+            store[object_name] = bytes(data)
+        return SimpleNamespace(etag=hashlib.md5(data).hexdigest())
+
+    def remove_object(self, bucket_name: str, object_name: str, **kwargs):
+        self._pause()
+        with self._lock:
+            if self._buckets.get(bucket_name, {}).pop(object_name, None) is not None:
+                self._keys[bucket_name].remove(object_name)
+
+    def listen_bucket_notification(
+        self, bucket_name: str, prefix: str = "", suffix: str = "", events=(), **kwargs
+    ) -> "_EventStream":
+        stream = _EventStream(bucket_name, prefix, suffix)
+        with self._lock:
+            self._listeners.append(stream)
+        return stream
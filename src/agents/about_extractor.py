@@ -5,16 +5,18 @@ This module uses Google's LangExtract library to extract structured
 company information from German Impressum and About pages.
 """
 
+import functools
 import os
 import textwrap
-from typing import Optional
-
-import langextract as lx
+from typing import Any, List, Optional
 
 from src.config.settings import settings
 from src.models.schemas import CompanyInfoLite
+from src.modules.lazy_import import lazy_import
 from src.modules.minio_manager import MinIOManager
 
+lx = lazy_import("langextract")
+
 # German business extraction prompt
 ABOUT_PROMPT = textwrap.dedent(
     """
@@ -43,82 +45,98 @@ ABOUT_PROMPT = textwrap.dedent(
 )
 
 
-# Few-shot examples for better extraction accuracy
-EXAMPLES = [
-    lx.data.ExampleData(
-        text=(
-            "Impressum\nMustermann GmbH\n"
-            "Geschäftsführer: Hans Müller\n"
-            "E-Mail: h.mueller@mustermann.de"
+@functools.cache
+def get_examples() -> List[Any]:
+    """
+    Build the few-shot examples for better extraction accuracy.
+
+    Built on first use so that importing this module does not load
+    langextract; also available as the module attribute EXAMPLES.
+
+    Returns:
+        List of lx.data.ExampleData
+    """
+    return [
+        lx.data.ExampleData(
+            text=(
+                "Impressum\nMustermann GmbH\n"
+                "Geschäftsführer: Hans Müller\n"
+                "E-Mail: h.mueller@mustermann.de"
+            ),
+            extractions=[
+                lx.data.Extraction(
+                    extraction_class="company_info",
+                    extraction_text="Mustermann GmbH\nGeschäftsführer: Hans Müller\nE-Mail: h.mueller@mustermann.de",
+                    attributes={
+                        "owner_name": "Hans Müller",
+                        "position": "Geschäftsführer",
+                        "company_name": "Mustermann GmbH",
+                        "email": "h.mueller@mustermann.de",
+                        "phone": "",
+                        "fax": "",
+                        "website": "",
+                        "profession": "",
+                        "sector": "",
+                    },
+                )
+            ],
         ),
-        extractions=[
-            lx.data.Extraction(
-                extraction_class="company_info",
-                extraction_text="Mustermann GmbH\nGeschäftsführer: Hans Müller\nE-Mail: h.mueller@mustermann.de",
-                attributes={
-                    "owner_name": "Hans Müller",
-                    "position": "Geschäftsführer",
-                    "company_name": "Mustermann GmbH",
-                    "email": "h.mueller@mustermann.de",
-                    "phone": "",
-                    "fax": "",
-                    "website": "",
-                    "profession": "",
-                    "sector": "",
-                },
-            )
-        ],
-    ),
-    lx.data.ExampleData(
-        text=(
-            "Angaben gemäß § 5 TMG: Zahnärztin Dr. Claudia Becker, "
-            "Telefon: (0441) 560015-0, Telefax: (0441) 560015-4, "
-            "E-Mail: praxis@dr-claudia-becker.de, Internet: www.dr-claudia-becker.de"
+        lx.data.ExampleData(
+            text=(
+                "Angaben gemäß § 5 TMG: Zahnärztin Dr. Claudia Becker, "
+                "Telefon: (0441) 560015-0, Telefax: (0441) 560015-4, "
+                "E-Mail: praxis@dr-claudia-becker.de, Internet: www.dr-claudia-becker.de"
+            ),
+            extractions=[
+                lx.data.Extraction(
+                    extraction_class="company_info",
+                    extraction_text="Zahnärztin Dr. Claudia Becker",
+                    attributes={
+                        "owner_name": "Claudia Becker",
+                        "position": "Zahnärztin",
+                        "company_name": "",
+                        "email": "praxis@dr-claudia-becker.de",
+                        "phone": "(0441) 560015-0",
+                        "fax": "(0441) 560015-4",
+                        "website": "www.dr-claudia-becker.de",
+                        "profession": "Dr. med. dent.",
+                        "sector": "Dentistry",
+                    },
+                )
+            ],
         ),
-        extractions=[
-            lx.data.Extraction(
-                extraction_class="company_info",
-                extraction_text="Zahnärztin Dr. Claudia Becker",
-                attributes={
-                    "owner_name": "Claudia Becker",
-                    "position": "Zahnärztin",
-                    "company_name": "",
-                    "email": "praxis@dr-claudia-becker.de",
-                    "phone": "(0441) 560015-0",
-                    "fax": "(0441) 560015-4",
-                    "website": "www.dr-claudia-becker.de",
-                    "profession": "Dr. med. dent.",
-                    "sector": "Dentistry",
-                },
-            )
-        ],
-    ),
-    lx.data.ExampleData(
-        text=(
-            "Rechtsanwaltskanzlei Schmidt & Partner\n"
-            "Inhaber: RA Dr. jur. Michael Schmidt\n"
-            "Kontakt: m.schmidt@ra-schmidt.de\n"
-            "Tel: +49 30 123456"
+        lx.data.ExampleData(
+            text=(
+                "Rechtsanwaltskanzlei Schmidt & Partner\n"
+                "Inhaber: RA Dr. jur. Michael Schmidt\n"
+                "Kontakt: m.schmidt@ra-schmidt.de\n"
+                "Tel: +49 30 123456"
+            ),
+            extractions=[
+                lx.data.Extraction(
+                    extraction_class="company_info",
+                    extraction_text="Rechtsanwaltskanzlei Schmidt & Partner",
+                    attributes={
+                        "owner_name": "Michael Schmidt",
+                        "position": "Inhaber",
+                        "company_name": "Rechtsanwaltskanzlei Schmidt & Partner",
+                        "email": "m.schmidt@ra-schmidt.de",
+                        "phone": "+49 30 123456",
+                        "fax": "",
+                        "website": "",
+                        "profession": "Rechtsanwalt Dr. jur.",
+                        "sector": "Legal",
+                    },
+                )
+            ],
         ),
-        extractions=[
-            lx.data.Extraction(
-                extraction_class="company_info",
-                extraction_text="Rechtsanwaltskanzlei Schmidt & Partner",
-                attributes={
-                    "owner_name": "Michael Schmidt",
-                    "position": "Inhaber",
-                    "company_name": "Rechtsanwaltskanzlei Schmidt & Partner",
-                    "email": "m.schmidt@ra-schmidt.de",
-                    "phone": "+49 30 123456",
-                    "fax": "",
-                    "website": "",
-                    "profession": "Rechtsanwalt Dr. jur.",
-                    "sector": "Legal",
-                },
-            )
-        ],
-    ),
-]
+    ]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "EXAMPLES":
+        return get_examples()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class AboutExtractor:
@@ -134,12 +152,19 @@ class AboutExtractor:
             model_id: LLM model to use (defaults to settings.langextract_model)
         """
         self.model_id = model_id or settings.langextract_model
-        self.minio = MinIOManager()
+        self._minio: Optional[MinIOManager] = None
 
         # Set up API key for Gemini
         if settings.google_api_key:
             os.environ["GOOGLE_API_KEY"] = settings.google_api_key
 
+    @property
+    def minio(self) -> MinIOManager:
+        """MinIO manager for extract_from_minio_object, created on first use."""
+        if self._minio is None:
+            self._minio = MinIOManager()
+        return self._minio
+
     def extract_from_markdown_text(self, text: str) -> Optional[CompanyInfoLite]:
         """
         Extract company information from markdown text.
@@ -158,7 +183,7 @@ class AboutExtractor:
             result = lx.extract(
                 text_or_documents=text,
                 prompt_description=ABOUT_PROMPT,
-                examples=EXAMPLES,
+                examples=get_examples(),
                 model_id=self.model_id,
                 fence_output=True,  # Recommended for OpenAI models
                 use_schema_constraints=False,
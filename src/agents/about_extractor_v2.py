@@ -4,21 +4,63 @@ Production-ready LangExtract-based German business information extractor.
 Enhanced with retry logic, error handling, rate limiting, and statistics.
 """
 
+import asyncio
+import functools
 import os
 import textwrap
 import time
-from typing import Any, Optional
-
-import langextract as lx
+from concurrent.futures import Executor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 from src.config.settings import settings
 from src.models.schemas import CompanyInfoLite
+from src.modules.adaptive_concurrency import adaptive_concurrency_from_settings
+from src.modules.contact_extractor import (
+    extract_contact_fields,
+    parse_field_list,
+)
+from src.modules.document_batcher import (
+    PackedBatch,
+    attribute_extractions,
+    pack_documents,
+)
+from src.modules.extraction_cache import (
+    ExtractionCache,
+    cache_key,
+    config_fingerprint,
+    extraction_cache_from_settings,
+)
+from src.modules.impressum_locator import locate_impressum
+from src.modules.lazy_import import lazy_import
+from src.modules.llm_backends import backend_from_settings
 from src.modules.logger import logger
 from src.modules.minio_manager import MinIOManager
-from src.modules.retry_handler import rate_limiter, retry_with_backoff
-
-# German business extraction prompt
-ABOUT_PROMPT = textwrap.dedent(
+from src.modules.retry_handler import (
+    estimate_tokens,
+    rate_limiter,
+    retry_with_backoff,
+)
+from src.modules.statistics import ExtractionStatistics
+from src.modules.tracing import span
+
+lx = lazy_import("langextract")
+
+# Attributes requested from the LLM, in prompt order
+FIELD_DESCRIPTIONS = {
+    "owner_name": "Name des Inhabers/Geschäftsführers",
+    "position": "Position (z.B. Geschäftsführer, Inhaber)",
+    "company_name": "Firmenname",
+    "email": "E-Mail-Adresse (bevorzuge persönliche E-Mails)",
+    "phone": "Telefonnummer",
+    "fax": "Faxnummer",
+    "website": "Website-URL",
+    "profession": "Berufsbezeichnung (z.B. Dr. med. dent., Rechtsanwalt)",
+    "sector": "Branche (z.B. Dentistry, Legal, Consulting)",
+}
+
+_PROMPT_TEMPLATE = textwrap.dedent(
     """
     Du bist ein deutscher Business-Informations-Extraktor.
     Extrahiere Firmen-/Praxisdaten aus Impressum / Kontakt / About-Us Texten.
@@ -32,87 +74,132 @@ ABOUT_PROMPT = textwrap.dedent(
 
     Gib eine Liste von Extractions zurück mit Klasse "company_info"
     und folgenden Attributen:
-    - owner_name: Name des Inhabers/Geschäftsführers
-    - position: Position (z.B. Geschäftsführer, Inhaber)
-    - company_name: Firmenname
-    - email: E-Mail-Adresse (bevorzuge persönliche E-Mails)
-    - phone: Telefonnummer
-    - fax: Faxnummer
-    - website: Website-URL
-    - profession: Berufsbezeichnung (z.B. Dr. med. dent., Rechtsanwalt)
-    - sector: Branche (z.B. Dentistry, Legal, Consulting)
 """
 )
 
 
-# Few-shot examples for better extraction accuracy
-EXAMPLES = [
-    lx.data.ExampleData(
-        text="Impressum\nMustermann GmbH\nGeschäftsführer: Hans Müller\nE-Mail: h.mueller@mustermann.de",
-        extractions=[
-            lx.data.Extraction(
-                extraction_class="company_info",
-                extraction_text="Mustermann GmbH\nGeschäftsführer: Hans Müller\nE-Mail: h.mueller@mustermann.de",
-                attributes={
-                    "owner_name": "Hans Müller",
-                    "position": "Geschäftsführer",
-                    "company_name": "Mustermann GmbH",
-                    "email": "h.mueller@mustermann.de",
-                    "phone": "",
-                    "fax": "",
-                    "website": "",
-                    "profession": "",
-                    "sector": "",
-                },
-            )
-        ],
-    ),
-    lx.data.ExampleData(
-        text="Angaben gemäß § 5 TMG: Zahnärztin Dr. Claudia Becker, "
-        "Telefon: (0441) 560015-0, Telefax: (0441) 560015-4, "
-        "E-Mail: praxis@dr-claudia-becker.de, Internet: www.dr-claudia-becker.de",
-        extractions=[
-            lx.data.Extraction(
-                extraction_class="company_info",
-                extraction_text="Zahnärztin Dr. Claudia Becker",
-                attributes={
-                    "owner_name": "Claudia Becker",
-                    "position": "Zahnärztin",
-                    "company_name": "",
-                    "email": "praxis@dr-claudia-becker.de",
-                    "phone": "(0441) 560015-0",
-                    "fax": "(0441) 560015-4",
-                    "website": "www.dr-claudia-becker.de",
-                    "profession": "Dr. med. dent.",
-                    "sector": "Dentistry",
-                },
-            )
-        ],
-    ),
-    lx.data.ExampleData(
-        text="Rechtsanwaltskanzlei Schmidt & Partner\n"
-        "Inhaber: RA Dr. jur. Michael Schmidt\n"
-        "Kontakt: m.schmidt@ra-schmidt.de\n"
-        "Tel: +49 30 123456",
-        extractions=[
-            lx.data.Extraction(
-                extraction_class="company_info",
-                extraction_text="Rechtsanwaltskanzlei Schmidt & Partner",
-                attributes={
-                    "owner_name": "Michael Schmidt",
-                    "position": "Inhaber",
-                    "company_name": "Rechtsanwaltskanzlei Schmidt & Partner",
-                    "email": "m.schmidt@ra-schmidt.de",
-                    "phone": "+49 30 123456",
-                    "fax": "",
-                    "website": "",
-                    "profession": "Rechtsanwalt Dr. jur.",
-                    "sector": "Legal",
-                },
-            )
-        ],
-    ),
-]
+def build_about_prompt(fields: Optional[Iterable[str]] = None) -> str:
+    """
+    Build the extraction prompt for a subset of attributes.
+
+    Args:
+        fields: Attributes to request (default: all of FIELD_DESCRIPTIONS)
+
+    Returns:
+        Prompt description for LangExtract
+    """
+    fields = list(fields) if fields is not None else list(FIELD_DESCRIPTIONS)
+    attributes = "".join(f"- {f}: {FIELD_DESCRIPTIONS[f]}\n" for f in fields)
+    return _PROMPT_TEMPLATE + attributes
+
+
+# German business extraction prompt
+ABOUT_PROMPT = build_about_prompt()
+
+# Prompt for several documents packed into one call (see document_batcher)
+BATCH_PROMPT = ABOUT_PROMPT + textwrap.dedent(
+    """
+    Der Text enthält mehrere Dokumente, jeweils eingeleitet durch
+    "=== DOKUMENT n ===". Gib für jedes Dokument höchstens eine Extraction
+    zurück und nutze dafür nur Text aus genau diesem Dokument.
+"""
+)
+
+
+@functools.cache
+def get_examples() -> List[Any]:
+    """
+    Build the few-shot examples for better extraction accuracy.
+
+    Built on first use so that importing this module does not load
+    langextract; also available as the module attribute EXAMPLES.
+
+    Returns:
+        List of lx.data.ExampleData
+    """
+    return [
+        lx.data.ExampleData(
+            text="Impressum\nMustermann GmbH\nGeschäftsführer: Hans Müller\nE-Mail: h.mueller@mustermann.de",
+            extractions=[
+                lx.data.Extraction(
+                    extraction_class="company_info",
+                    extraction_text="Mustermann GmbH\nGeschäftsführer: Hans Müller\nE-Mail: h.mueller@mustermann.de",
+                    attributes={
+                        "owner_name": "Hans Müller",
+                        "position": "Geschäftsführer",
+                        "company_name": "Mustermann GmbH",
+                        "email": "h.mueller@mustermann.de",
+                        "phone": "",
+                        "fax": "",
+                        "website": "",
+                        "profession": "",
+                        "sector": "",
+                    },
+                )
+            ],
+        ),
+        lx.data.ExampleData(
+            text="Angaben gemäß § 5 TMG: Zahnärztin Dr. Claudia Becker, "
+            "Telefon: (0441) 560015-0, Telefax: (0441) 560015-4, "
+            "E-Mail: praxis@dr-claudia-becker.de, Internet: www.dr-claudia-becker.de",
+            extractions=[
+                lx.data.Extraction(
+                    extraction_class="company_info",
+                    extraction_text="Zahnärztin Dr. Claudia Becker",
+                    attributes={
+                        "owner_name": "Claudia Becker",
+                        "position": "Zahnärztin",
+                        "company_name": "",
+                        "email": "praxis@dr-claudia-becker.de",
+                        "phone": "(0441) 560015-0",
+                        "fax": "(0441) 560015-4",
+                        "website": "www.dr-claudia-becker.de",
+                        "profession": "Dr. med. dent.",
+                        "sector": "Dentistry",
+                    },
+                )
+            ],
+        ),
+        lx.data.ExampleData(
+            text="Rechtsanwaltskanzlei Schmidt & Partner\n"
+            "Inhaber: RA Dr. jur. Michael Schmidt\n"
+            "Kontakt: m.schmidt@ra-schmidt.de\n"
+            "Tel: +49 30 123456",
+            extractions=[
+                lx.data.Extraction(
+                    extraction_class="company_info",
+                    extraction_text="Rechtsanwaltskanzlei Schmidt & Partner",
+                    attributes={
+                        "owner_name": "Michael Schmidt",
+                        "position": "Inhaber",
+                        "company_name": "Rechtsanwaltskanzlei Schmidt & Partner",
+                        "email": "m.schmidt@ra-schmidt.de",
+                        "phone": "+49 30 123456",
+                        "fax": "",
+                        "website": "",
+                        "profession": "Rechtsanwalt Dr. jur.",
+                        "sector": "Legal",
+                    },
+                )
+            ],
+        ),
+    ]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "EXAMPLES":
+        return get_examples()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@dataclass
+class _PendingDocument:
+    """A trimmed document that still needs an LLM call."""
+
+    text: str
+    local_fields: Dict[str, str]
+    prompt: str
+    key: Optional[str]
 
 
 class AboutExtractorV2:
@@ -124,55 +211,361 @@ class AboutExtractorV2:
     - Rate limiting
     - Error handling and logging
     - Performance tracking
+    - Content-addressed result cache
+    - Impressum section trimming before the LLM call
+    - Regex fast path for contact fields (LLM asked only for the rest)
+    - Optional packing of several small documents into one LLM call
     """
 
-    def __init__(self, model_id: Optional[str] = None):
+    def __init__(
+        self,
+        model_id: Optional[str] = None,
+        stats: Optional[ExtractionStatistics] = None,
+        cache: Optional[ExtractionCache] = None,
+        backend: Optional[Any] = None,
+    ):
         """
         Initialize the extractor.
 
         Args:
             model_id: LLM model to use (defaults to settings.langextract_model)
+            stats: Statistics tracker for cache hit/miss reporting
+            cache: Extraction cache (defaults to the one configured in settings)
+            backend: Model backend (defaults to the one configured in settings)
         """
         self.model_id = model_id or settings.langextract_model
-        self.minio = MinIOManager()
+        self._minio: Optional[MinIOManager] = None
+        self.stats = stats
+        self.cache = cache if cache is not None else extraction_cache_from_settings()
+        self.backend = backend or backend_from_settings(self.model_id)
+        # Local backends have no provider quota, so only the in-flight limit adapts
+        self.concurrency = adaptive_concurrency_from_settings(
+            rate_limiter if self.backend.rate_limited else None, stats
+        )
+        # Keyed on the backend's model so fake results never reach real runs
+        self.fingerprint = config_fingerprint(
+            ABOUT_PROMPT, get_examples(), self.backend.model_id
+        )
+        self._fingerprints: Dict[str, str] = {ABOUT_PROMPT: self.fingerprint}
+        self.skip_llm_fields = parse_field_list(
+            settings.contact_fast_path_skip_llm_fields
+        )
+        self.prompt_tokens = estimate_tokens(
+            ABOUT_PROMPT + "".join(example.text for example in get_examples())
+        )
 
         # Set up API key for Gemini
         if settings.google_api_key:
             os.environ["GOOGLE_API_KEY"] = settings.google_api_key
 
-        logger.info(f"Initialized AboutExtractorV2 with model: {self.model_id}")
+        logger.info(f"Initialized AboutExtractorV2 with model: {self.backend.model_id}")
+
+    @property
+    def minio(self) -> MinIOManager:
+        """MinIO manager for extract_from_minio_object, created on first use."""
+        if self._minio is None:
+            self._minio = MinIOManager()
+        return self._minio
+
+    def _stage(self, stage: str):
+        """Time a block as a pipeline stage if statistics are tracked."""
+        if self.stats is None:
+            return nullcontext()
+        return self.stats.time_stage(stage)
+
+    def _invoke_model(
+        self,
+        text: str,
+        prompt: str = ABOUT_PROMPT,
+        max_char_buffer: Optional[int] = None,
+    ) -> Optional[Any]:
+        """
+        Send one extraction request to the model backend.
+
+        Args:
+            text: Text to extract from
+            prompt: Prompt description (full or reduced to unresolved fields)
+            max_char_buffer: Chunk size override (packed batches must not be
+                split, or one batch would cost several requests)
+
+        Returns:
+            ExtractionResult or None
+        """
+        if self.concurrency is None:
+            return self._call_backend(text, prompt, max_char_buffer)
+
+        with span("concurrency.wait"), self._stage("concurrency_wait"):
+            self.concurrency.acquire()
+        start = time.perf_counter()
+        error = None
+        try:
+            return self._call_backend(text, prompt, max_char_buffer)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self.concurrency.release(time.perf_counter() - start, error)
+
+    def _call_backend(
+        self, text: str, prompt: str, max_char_buffer: Optional[int]
+    ) -> Optional[Any]:
+        """Call the backend inside its trace span and stage timer."""
+        with span("llm.call", model=self.backend.model_id, chars=len(text)):
+            with self._stage("llm_call"):
+                return self.backend.extract(
+                    text, prompt, get_examples(), max_char_buffer
+                )
 
     @retry_with_backoff(exceptions=(Exception,))
-    def _call_langextract(self, text: str) -> Optional[Any]:
+    def _call_langextract(
+        self,
+        text: str,
+        prompt: str = ABOUT_PROMPT,
+        max_char_buffer: Optional[int] = None,
+    ) -> Optional[Any]:
         """
         Call LangExtract API with retry logic.
 
         Args:
             text: Text to extract from
+            prompt: Prompt description
+            max_char_buffer: Chunk size override
+
+        Returns:
+            ExtractionResult or None
+        """
+        # Apply rate limiting (prompt and examples are sent with every request)
+        if self.backend.rate_limited:
+            with span("rate_limit.wait"), self._stage("rate_limit_wait"):
+                rate_limiter.wait_if_needed(estimate_tokens(text) + self.prompt_tokens)
+
+        return self._invoke_model(text, prompt, max_char_buffer)
+
+    @retry_with_backoff(exceptions=(Exception,))
+    async def _acall_langextract(
+        self,
+        text: str,
+        prompt: str = ABOUT_PROMPT,
+        executor: Optional[Executor] = None,
+    ) -> Optional[Any]:
+        """
+        Call LangExtract API from asyncio with retry logic.
+
+        Rate-limit waits and retry backoff happen on the event loop; only the
+        blocking HTTP call itself runs on the executor.
+
+        Args:
+            text: Text to extract from
+            prompt: Prompt description
+            executor: Executor for the blocking call (default loop executor)
 
         Returns:
             ExtractionResult or None
         """
-        # Apply rate limiting
-        rate_limiter.wait_if_needed()
+        if self.backend.rate_limited:
+            with span("rate_limit.wait"), self._stage("rate_limit_wait"):
+                await rate_limiter.async_wait_if_needed(
+                    estimate_tokens(text) + self.prompt_tokens
+                )
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self._invoke_model, text, prompt)
+
+    def _cache_key(self, text: str, prompt: str) -> Optional[str]:
+        """
+        Build the cache key of a text extracted with a given prompt.
+
+        Args:
+            text: Markdown content
+            prompt: Prompt the result is produced with
+
+        Returns:
+            Cache key, or None if caching is disabled
+        """
+        if self.cache is None:
+            return None
+
+        fingerprint = self._fingerprints.get(prompt)
+        if fingerprint is None:
+            fingerprint = config_fingerprint(
+                prompt, get_examples(), self.backend.model_id
+            )
+            self._fingerprints[prompt] = fingerprint
+        return cache_key(text, fingerprint)
+
+    def _lookup_cache(
+        self, text: str, prompt: str = ABOUT_PROMPT, fallback_prompt: str = ""
+    ) -> Tuple[Optional[str], Optional[CompanyInfoLite]]:
+        """
+        Look up a previous extraction for equivalent text.
+
+        Args:
+            text: Markdown content
+            prompt: Prompt the result would be produced with
+            fallback_prompt: Prompt whose results are also accepted (the
+                batch prompt, for documents that may be packed)
+
+        Returns:
+            Tuple of (cache key or None if caching is disabled, cached result)
+        """
+        key = self._cache_key(text, prompt)
+        if key is None:
+            return None, None
+
+        cached = self.cache.get(key)
+        if cached is None and fallback_prompt:
+            cached = self.cache.get(self._cache_key(text, fallback_prompt))
+        if cached is None:
+            if self.stats:
+                self.stats.record_cache_miss()
+            return key, None
+
+        value, llm_seconds = cached
+        if self.stats:
+            self.stats.record_cache_hit(llm_seconds)
+        company_info = CompanyInfoLite.model_validate_json(value)
+        logger.info(
+            f"💾 Cache hit: {company_info.company_name or company_info.owner_name}"
+        )
+        return key, company_info
+
+    def _finish(
+        self,
+        key: Optional[str],
+        result: Optional[Any],
+        elapsed: float,
+        local_fields: Optional[Dict[str, str]] = None,
+    ) -> Optional[CompanyInfoLite]:
+        """
+        Parse an LLM result, merge locally resolved fields and cache it.
+
+        Args:
+            key: Cache key from _lookup_cache()
+            result: ExtractionResult returned by LangExtract
+            elapsed: Seconds the LLM call took
+            local_fields: Contact fields resolved by the regex fast path
+
+        Returns:
+            CompanyInfoLite object or None
+        """
+        logger.debug(f"LangExtract call took {elapsed:.2f}s")
+
+        company_info = self._merge_local(self._parse_result(result), local_fields)
+        if company_info and key:
+            self.cache.put(key, company_info.model_dump_json(), elapsed)
+
+        return company_info
+
+    def _extract_pending(self, pending: _PendingDocument) -> Optional[CompanyInfoLite]:
+        """
+        Run a single-document LLM call for an already prepared document.
+
+        Args:
+            pending: Trimmed text, local fields, prompt and cache key
+
+        Returns:
+            CompanyInfoLite object or None
+        """
+        try:
+            start_time = time.time()
+            result = self._call_langextract(pending.text, pending.prompt)
+            return self._finish(
+                pending.key, result, time.time() - start_time, pending.local_fields
+            )
+
+        except Exception as e:
+            logger.error(f"Extraction error: {e}", exc_info=True)
+            raise
+
+    def _resolve_locally(self, text: str) -> Tuple[Dict[str, str], str]:
+        """
+        Resolve contact fields with regexes and build the prompt for the rest.
+
+        Args:
+            text: Text that would be sent to the LLM
+
+        Returns:
+            Tuple of (non-empty local fields, prompt for the unresolved fields)
+        """
+        if not settings.contact_fast_path_enabled:
+            return {}, ABOUT_PROMPT
+
+        local_fields = {k: v for k, v in extract_contact_fields(text).items() if v}
+        if not local_fields:
+            return {}, ABOUT_PROMPT
 
-        result = lx.extract(
-            text_or_documents=text,
-            prompt_description=ABOUT_PROMPT,
-            examples=EXAMPLES,
-            model_id=self.model_id,
-            fence_output=True,
-            use_schema_constraints=False,
+        remaining = [f for f in FIELD_DESCRIPTIONS if f not in local_fields]
+        return local_fields, build_about_prompt(remaining)
+
+    def _can_skip_llm(self, local_fields: Dict[str, str]) -> bool:
+        """
+        Check whether every configured skip field was resolved locally.
+
+        Args:
+            local_fields: Contact fields resolved by the regex fast path
+
+        Returns:
+            True if the LLM call can be skipped
+        """
+        skip = (
+            bool(self.skip_llm_fields) and self.skip_llm_fields <= local_fields.keys()
         )
+        if self.stats and settings.contact_fast_path_enabled:
+            self.stats.record_fast_path(len(local_fields), skip)
+        if skip:
+            logger.info(f"🏎️  Resolved {sorted(local_fields)} locally, skipping LLM")
+        return skip
+
+    @staticmethod
+    def _merge_local(
+        company_info: Optional[CompanyInfoLite], local_fields: Optional[Dict[str, str]]
+    ) -> Optional[CompanyInfoLite]:
+        """
+        Overlay regex-resolved contact fields on an LLM result.
+
+        Args:
+            company_info: Parsed LLM result (may be None)
+            local_fields: Non-empty contact fields resolved locally
+
+        Returns:
+            Merged CompanyInfoLite, or None if neither source found anything
+        """
+        if not local_fields:
+            return company_info
+        if company_info is None:
+            return CompanyInfoLite(**local_fields)
+        return company_info.model_copy(update=local_fields)
+
+    def _prepare_text(self, text: str, source: Optional[str]) -> str:
+        """
+        Trim markdown to its legal-notice sections if the locator is enabled.
 
-        return result
+        Args:
+            text: Markdown content
+            source: Object name used for per-file statistics
 
-    def extract_from_markdown_text(self, text: str) -> Optional[CompanyInfoLite]:
+        Returns:
+            Text to send to the LLM
+        """
+        if not settings.impressum_locator_enabled:
+            return text
+
+        trimmed = locate_impressum(text)
+        if self.stats:
+            self.stats.record_trim(source or "<text>", len(text), len(trimmed))
+        if len(trimmed) < len(text):
+            logger.debug(f"Impressum locator kept {len(trimmed)}/{len(text)} chars")
+        return trimmed
+
+    def extract_from_markdown_text(
+        self, text: str, source: Optional[str] = None
+    ) -> Optional[CompanyInfoLite]:
         """
         Extract company information from markdown text.
 
         Args:
             text: Markdown content to extract from
+            source: Object name the text came from (for statistics)
 
         Returns:
             CompanyInfoLite object or None if extraction failed
@@ -181,46 +574,242 @@ class AboutExtractorV2:
             logger.warning("Text too short for extraction")
             return None
 
+        pending, done = self._prepare_document(text, source)
+        if pending is None:
+            return done
+
+        return self._extract_pending(pending)
+
+    def _prepare_document(
+        self, text: str, source: Optional[str], batched: bool = False
+    ) -> Tuple[Optional[_PendingDocument], Optional[CompanyInfoLite]]:
+        """
+        Trim, resolve contact fields locally and consult the cache.
+
+        Args:
+            text: Markdown content
+            source: Object name the text came from (for statistics)
+            batched: The document may be packed, so results of the batch
+                prompt are accepted from the cache as well
+
+        Returns:
+            Tuple of (document still needing the LLM or None, final result)
+        """
+        text = self._prepare_text(text, source)
+        local_fields, prompt = self._resolve_locally(text)
+        if self._can_skip_llm(local_fields):
+            return None, CompanyInfoLite(**local_fields)
+
+        key, cached = self._lookup_cache(text, prompt, BATCH_PROMPT if batched else "")
+        if cached:
+            return None, cached
+
+        return _PendingDocument(text, local_fields, prompt, key), None
+
+    def extract_batch(
+        self,
+        documents: Sequence[Tuple[str, str]],
+        max_chars: Optional[int] = None,
+        max_docs: Optional[int] = None,
+    ) -> Dict[str, Union[CompanyInfoLite, None, Exception]]:
+        """
+        Extract several documents, packing small ones into shared LLM calls.
+
+        Documents whose extraction cannot be attributed unambiguously are
+        retried with their own call.
+
+        Args:
+            documents: (source object name, markdown) pairs
+            max_chars: Character budget per packed call
+            max_docs: Maximum documents per packed call
+
+        Returns:
+            Dictionary of source -> CompanyInfoLite, None (no data) or the
+            exception that made its extraction fail
+        """
+        max_chars = max_chars or settings.extraction_batch_max_chars
+        max_docs = max_docs or settings.extraction_batch_max_docs
+
+        results: Dict[str, Union[CompanyInfoLite, None, Exception]] = {}
+        pending: Dict[str, _PendingDocument] = {}
+        for source, text in documents:
+            if not text or len(text.strip()) < 10:
+                logger.warning(f"Text too short for extraction: {source}")
+                results[source] = None
+                continue
+
+            prepared, done = self._prepare_document(text, source, batched=True)
+            if prepared is None:
+                results[source] = done
+            else:
+                pending[source] = prepared
+
+        batches = pack_documents(
+            [(source, doc.text) for source, doc in pending.items()],
+            max_chars,
+            max_docs,
+        )
+        for batch in batches:
+            if len(batch) == 1:
+                fallback = batch.sources
+            else:
+                fallback = self._extract_packed(batch, pending, results)
+
+            for source in fallback:
+                try:
+                    results[source] = self._extract_pending(pending[source])
+                except Exception as e:
+                    results[source] = e
+
+        return results
+
+    def _extract_packed(
+        self,
+        batch: PackedBatch,
+        pending: Dict[str, _PendingDocument],
+        results: Dict[str, Union[CompanyInfoLite, None, Exception]],
+    ) -> List[str]:
+        """
+        Send one packed batch and store the attributable results.
+
+        Args:
+            batch: Packed documents
+            pending: Prepared documents by source
+            results: Result dictionary to fill in
+
+        Returns:
+            Sources that need a per-document fallback call
+        """
         try:
             start_time = time.time()
-            result = self._call_langextract(text)
+            result = self._call_langextract(
+                batch.text, BATCH_PROMPT, max_char_buffer=len(batch.text)
+            )
             elapsed = time.time() - start_time
+        except Exception as e:
+            logger.warning(f"Batch of {len(batch)} failed, retrying singly: {e}")
+            if self.stats:
+                self.stats.record_batch(len(batch), len(batch))
+            return list(batch.sources)
+
+        extractions = result.extractions if result and result.extractions else []
+        resolved, ambiguous = attribute_extractions(batch, extractions, "company_info")
+        if self.stats:
+            self.stats.record_batch(len(batch), len(ambiguous))
+        logger.debug(
+            f"Batch of {len(batch)} took {elapsed:.2f}s, {len(ambiguous)} ambiguous"
+        )
 
-            logger.debug(f"LangExtract call took {elapsed:.2f}s")
-
-            # LangExtract returns extraction objects
-            if not result or not result.extractions:
-                logger.warning("No extractions found")
-                return None
+        for source in batch.sources:
+            if source in ambiguous:
+                continue
+            doc = pending[source]
+            extraction = resolved.get(source)
+            company_info = self._merge_local(
+                self._parse_extraction(extraction) if extraction else None,
+                doc.local_fields,
+            )
+            if company_info and doc.key:
+                # Keyed by the batch prompt, so single calls never get them
+                self.cache.put(
+                    self._cache_key(doc.text, BATCH_PROMPT),
+                    company_info.model_dump_json(),
+                    elapsed / len(batch),
+                )
+            results[source] = company_info
+
+        return [source for source in batch.sources if source in ambiguous]
+
+    async def aextract_from_markdown_text(
+        self,
+        text: str,
+        executor: Optional[Executor] = None,
+        source: Optional[str] = None,
+    ) -> Optional[CompanyInfoLite]:
+        """
+        Asynchronously extract company information from markdown text.
 
-            # Find the first company_info extraction
-            for ext in result.extractions:
-                if ext.extraction_class == "company_info":
-                    attrs = ext.attributes or {}
-
-                    company_info = CompanyInfoLite(
-                        owner_name=attrs.get("owner_name", "") or "",
-                        position=attrs.get("position", "") or "",
-                        company_name=attrs.get("company_name", "") or "",
-                        email=attrs.get("email", "") or "",
-                        phone=attrs.get("phone", "") or "",
-                        fax=attrs.get("fax", "") or "",
-                        website=attrs.get("website", "") or "",
-                        profession=attrs.get("profession", "") or "",
-                        sector=attrs.get("sector", "") or "",
-                    )
-
-                    logger.info(
-                        f"✓ Extracted: {company_info.company_name or company_info.owner_name}"
-                    )
-                    return company_info
+        Args:
+            text: Markdown content to extract from
+            executor: Executor for the blocking LLM call
+            source: Object name the text came from (for statistics)
 
+        Returns:
+            CompanyInfoLite object or None if extraction failed
+        """
+        if not text or len(text.strip()) < 10:
+            logger.warning("Text too short for extraction")
             return None
 
+        pending, done = self._prepare_document(text, source)
+        if pending is None:
+            return done
+
+        try:
+            start_time = time.time()
+            result = await self._acall_langextract(
+                pending.text, pending.prompt, executor
+            )
+            return self._finish(
+                pending.key, result, time.time() - start_time, pending.local_fields
+            )
+
         except Exception as e:
             logger.error(f"Extraction error: {e}", exc_info=True)
             raise
 
+    def _parse_result(self, result: Optional[Any]) -> Optional[CompanyInfoLite]:
+        """
+        Convert a LangExtract result into CompanyInfoLite.
+
+        Args:
+            result: ExtractionResult returned by LangExtract
+
+        Returns:
+            CompanyInfoLite object or None if no company_info extraction exists
+        """
+        # LangExtract returns extraction objects
+        if not result or not result.extractions:
+            logger.warning("No extractions found")
+            return None
+
+        # Find the first company_info extraction
+        for ext in result.extractions:
+            if ext.extraction_class == "company_info":
+                return self._parse_extraction(ext)
+
+        return None
+
+    def _parse_extraction(self, ext: Any) -> CompanyInfoLite:
+        """
+        Convert a single company_info extraction into CompanyInfoLite.
+
+        Args:
+            ext: LangExtract Extraction with company attributes
+
+        Returns:
+            CompanyInfoLite object
+        """
+        attrs = ext.attributes or {}
+
+        with self._stage("validation"):
+            company_info = CompanyInfoLite(
+                owner_name=attrs.get("owner_name", "") or "",
+                position=attrs.get("position", "") or "",
+                company_name=attrs.get("company_name", "") or "",
+                email=attrs.get("email", "") or "",
+                phone=attrs.get("phone", "") or "",
+                fax=attrs.get("fax", "") or "",
+                website=attrs.get("website", "") or "",
+                profession=attrs.get("profession", "") or "",
+                sector=attrs.get("sector", "") or "",
+            )
+
+        logger.info(
+            f"✓ Extracted: {company_info.company_name or company_info.owner_name}"
+        )
+        return company_info
+
     def extract_from_minio_object(self, object_name: str) -> Optional[CompanyInfoLite]:
         """
         Extract company information from a MinIO object.
@@ -240,7 +829,7 @@ class AboutExtractorV2:
                 logger.error(f"Failed to download: {object_name}")
                 return None
 
-            return self.extract_from_markdown_text(markdown)
+            return self.extract_from_markdown_text(markdown, source=object_name)
 
         except Exception as e:
             logger.error(f"Error processing {object_name}: {e}", exc_info=True)
@@ -2,19 +2,42 @@
 LangGraph-based workflow orchestration for extraction pipeline.
 
 This module implements a state-based graph workflow that:
-1. Lists all markdown files from MinIO
+1. Streams markdown files from MinIO
 2. Fetches each markdown file
 3. Extracts company information using LangExtract
 4. Saves results as JSON back to MinIO
-"""
 
-from typing import List, Optional, TypedDict
+The state only holds the current item and a listing cursor. Nodes return
+partial updates, counters are merged by a reducer, and the markdown body is
+dropped as soon as it has been extracted, so each superstep (and each
+checkpoint) stays the same size however large the bucket is.
+
+With GRAPH_CHECKPOINT_PATH (or --checkpoint-path) set, every superstep is
+saved to SQLite and an interrupted run continues with --resume.
+
+Importing the module has no side effects: LangGraph is loaded when the graph
+is built, and the MinIO and extractor instances are created by main().
+"""
 
-from langgraph.graph import END, StateGraph
+import argparse
+from typing import TYPE_CHECKING, Annotated, Dict, Iterator, List, Optional, TypedDict
 
 from src.agents.about_extractor import AboutExtractor
+from src.config.settings import settings
 from src.models.schemas import CompanyInfoLite
+from src.modules.graph_checkpoints import (
+    latest_thread_id,
+    new_thread_id,
+    open_checkpointer,
+    thread_config,
+)
+from src.modules.graph_reducers import merge_stats
 from src.modules.minio_manager import MinIOManager
+from src.modules.skip_index import CompletedIndex, completed_index_from_settings
+from src.modules.tracing import tracing_from_settings
+
+if TYPE_CHECKING:
+    from langgraph.graph.state import CompiledStateGraph
 
 
 class ScrapeState(TypedDict, total=False):
@@ -22,72 +45,113 @@ class ScrapeState(TypedDict, total=False):
     State definition for the extraction workflow.
     """
 
-    objects: List[str]  # List of markdown object names
-    index: int  # Current processing index
+    cursor: Optional[str]  # Last finished object (listing resumes after it)
     current_object: Optional[str]  # Current object being processed
     markdown: Optional[str]  # Current markdown content
     company_info: Optional[CompanyInfoLite]  # Extracted company info
-    stats: dict  # Processing statistics
+    result: Optional[Dict[str, str]]  # Outcome of the last finished object
+    listing_done: bool  # True once the listing is exhausted
+    stats: Annotated[Dict[str, int], merge_stats]  # Counter deltas, summed
 
 
-# Initialize global instances
-minio_mgr = MinIOManager()
-extractor = AboutExtractor()
+# Global instances, created by init_clients()
+minio_mgr: Optional[MinIOManager] = None
+extractor: Optional[AboutExtractor] = None
 
+# Index of existing results, built once by node_list_objects
+completed_index: Optional[CompletedIndex] = None
 
-def node_list_objects(state: ScrapeState) -> ScrapeState:
-    """
-    Node 1: List all markdown files from MinIO.
-    """
-    print("📁 Listing markdown files from MinIO...")
+# Lazy listing opened by node_list_objects; kept out of the state
+listing: Optional[Iterator[dict]] = None
 
-    objs = minio_mgr.list_objects(prefix="scraped-content/", recursive=True, limit=20)
-    md_objects = [o["object_name"] for o in objs if o["object_name"].endswith(".md")]
+# Marks --resume/--discard given without a thread id
+LATEST = "latest"
 
-    print(f"✓ Found {len(md_objects)} markdown files")
 
+def init_clients():
+    """Create the MinIO and extractor instances unless already set."""
+    global minio_mgr, extractor
+
+    if minio_mgr is None:
+        minio_mgr = MinIOManager()
+    if extractor is None:
+        extractor = AboutExtractor()
+
+
+def _finish(obj_name: str, status: str) -> ScrapeState:
+    """Build the update that closes one object and advances the cursor."""
+    counter = "errors" if status == "error" else status
     return {
-        **state,
-        "objects": md_objects,
-        "index": 0,
-        "stats": {"total": len(md_objects), "success": 0, "skipped": 0, "errors": 0},
+        "cursor": obj_name,
+        "current_object": None,
+        "markdown": None,
+        "company_info": None,
+        "result": {"object": obj_name, "status": status},
+        "stats": {counter: 1},
     }
 
 
+def _open_listing(cursor: Optional[str]):
+    """Open the listing after `cursor` and build the skip index."""
+    global completed_index, listing
+
+    print("📁 Streaming markdown files from MinIO...")
+
+    listing = minio_mgr.iter_objects(
+        prefix="scraped-content/",
+        suffix=".md",
+        start_after=cursor,
+        page_size=settings.listing_page_size,
+    )
+
+    # AboutExtractor stores no provenance, so incremental mode does not apply
+    completed_index = completed_index_from_settings(minio_mgr)
+
+
+def node_list_objects(state: ScrapeState) -> ScrapeState:
+    """
+    Node 1: Open a lazy listing of markdown files from MinIO.
+    """
+    _open_listing(state.get("cursor"))
+    return {"stats": {}}
+
+
 def node_fetch_markdown(state: ScrapeState) -> ScrapeState:
     """
-    Node 2: Fetch markdown content for current object.
+    Node 2: Take the next object from the listing and fetch its markdown.
     """
-    objects = state.get("objects", [])
-    idx = state.get("index", 0)
+    # A run resumed from a checkpoint starts here, after its cursor
+    if listing is None:
+        _open_listing(state.get("cursor"))
 
-    if idx >= len(objects):
-        return state  # No more objects to process
+    obj = next(listing, None)
+    if obj is None:
+        return {"listing_done": True}  # No more objects to process
 
-    obj_name = objects[idx]
-    print(f"\n[{idx + 1}/{len(objects)}] Processing: {obj_name}")
+    obj_name = obj["object_name"]
+    number = state.get("stats", {}).get("total", 0) + 1
+    print(f"\n[{number}] Processing: {obj_name}")
 
     # Check if JSON already exists
     json_path = obj_name.replace(".md", ".about.json")
-    if minio_mgr.object_exists(json_path):
-        print(f"⏭️  Skipping (already exists): {json_path}")
-        stats = state.get("stats", {})
-        stats["skipped"] = stats.get("skipped", 0) + 1
+    if completed_index is not None:
+        already_done = json_path in completed_index
+    else:
+        already_done = minio_mgr.object_exists(json_path)
 
-        return {
-            **state,
-            "current_object": obj_name,
-            "markdown": None,  # Skip extraction
-            "stats": stats,
-        }
+    if already_done:
+        print(f"⏭️  Skipping (already exists): {json_path}")
+        update = _finish(obj_name, "skipped")
+        update["stats"] = {"total": 1, "skipped": 1}
+        return update
 
     # Download markdown
     md = minio_mgr.download_object(obj_name, as_text=True)
 
     return {
-        **state,
         "current_object": obj_name,
         "markdown": md,
+        "stats": {"total": 1},
     }
 
 
@@ -99,23 +163,12 @@ def node_extract_company(state: ScrapeState) -> ScrapeState:
 
     if not md:
         # Skipped or failed download
-        return {
-            **state,
-            "company_info": None,
-        }
+        return {"company_info": None}
 
-    # Extract company info
+    # Extract company info; the markdown is not needed past this node
     info = extractor.extract_from_markdown_text(md)
 
-    if not info:
-        stats = state.get("stats", {})
-        stats["errors"] = stats.get("errors", 0) + 1
-        return {**state, "company_info": None, "stats": stats}
-
-    return {
-        **state,
-        "company_info": info,
-    }
+    return {"markdown": None, "company_info": info}
 
 
 def node_save_result(state: ScrapeState) -> ScrapeState:
@@ -124,60 +177,46 @@ def node_save_result(state: ScrapeState) -> ScrapeState:
     """
     obj_name = state.get("current_object")
     info = state.get("company_info")
+    json_path = obj_name.replace(".md", ".about.json")
 
-    if not obj_name:
-        return state
-
-    # If no info extracted or skipped, just increment index
     if not info:
-        idx = state.get("index", 0) + 1
-        return {
-            **state,
-            "index": idx,
-            "markdown": None,
-            "company_info": None,
-        }
+        # Failed download or extraction
+        return _finish(obj_name, "error")
 
     # Save JSON
-    json_path = obj_name.replace(".md", ".about.json")
     data = info.model_dump()
     success = minio_mgr.upload_json(json_path, data)
 
-    # Update stats
-    stats = state.get("stats", {})
-    if success:
-        stats["success"] = stats.get("success", 0) + 1
-    else:
-        stats["errors"] = stats.get("errors", 0) + 1
+    if not success:
+        return _finish(obj_name, "error")
 
-    # Move to next object
-    idx = state.get("index", 0) + 1
+    if completed_index is not None:
+        completed_index.add(json_path)
+    return _finish(obj_name, "success")
 
-    return {
-        **state,
-        "index": idx,
-        "markdown": None,
-        "company_info": None,
-        "stats": stats,
-    }
 
-
-def should_continue(state: ScrapeState) -> str:
+def after_fetch(state: ScrapeState) -> str:
     """
-    Conditional edge: Continue processing or end.
+    Conditional edge: Extract the fetched object, fetch the next one or end.
     """
-    objects = state.get("objects", [])
-    idx = state.get("index", 0)
+    from langgraph.graph import END
 
-    if idx < len(objects):
-        return "fetch_markdown"
-    return END
+    if state.get("listing_done"):
+        return END
+    if state.get("current_object"):
+        return "extract_company"
+    return "fetch_markdown"  # Skipped
 
 
-def build_graph() -> StateGraph:
+def build_graph(checkpointer=None) -> "CompiledStateGraph":
     """
     Build and compile the extraction workflow graph.
+
+    Args:
+        checkpointer: Optional checkpoint store that makes runs resumable
     """
+    from langgraph.graph import END, StateGraph
+
     graph = StateGraph(ScrapeState)
 
     # Add nodes
@@ -191,31 +230,110 @@ def build_graph() -> StateGraph:
 
     # Add edges
     graph.add_edge("list_objects", "fetch_markdown")
-    graph.add_edge("fetch_markdown", "extract_company")
-    graph.add_edge("extract_company", "save_result")
-
-    # Add conditional edge for looping
     graph.add_conditional_edges(
-        "save_result",
-        should_continue,
+        "fetch_markdown",
+        after_fetch,
         {
+            "extract_company": "extract_company",
             "fetch_markdown": "fetch_markdown",
             END: END,
         },
     )
+    graph.add_edge("extract_company", "save_result")
+
+    # Loop back for the next object
+    graph.add_edge("save_result", "fetch_markdown")
+
+    return graph.compile(checkpointer=checkpointer)
+
 
-    return graph.compile()
+def _resolve_thread(checkpointer, app, args) -> Optional[str]:
+    """Pick the thread to run and drop a discarded one."""
+    if args.discard:
+        thread_id = (
+            latest_thread_id(checkpointer) if args.discard == LATEST else args.discard
+        )
+        if thread_id:
+            checkpointer.delete_thread(thread_id)
+            print(f"🗑️  Discarded run {thread_id}")
+        return None
 
+    if args.resume:
+        thread_id = (
+            latest_thread_id(checkpointer) if args.resume == LATEST else args.resume
+        )
+        if thread_id and app.get_state(thread_config(thread_id)).next:
+            return thread_id
+        print("ℹ️  No interrupted run to resume, starting a new one")
+        return None
 
-def main():
+    thread_id = latest_thread_id(checkpointer)
+    if thread_id and app.get_state(thread_config(thread_id)).next:
+        print(f"⚠️  Run {thread_id} was interrupted; use --resume or --discard")
+    return None
+
+
+def main(argv: Optional[List[str]] = None):
     """
     Run the extraction workflow.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
     """
+    parser = argparse.ArgumentParser(description="LangGraph extraction workflow")
+    parser.add_argument(
+        "--checkpoint-path",
+        default=settings.graph_checkpoint_path,
+        help="SQLite checkpoint file (enables resume)",
+    )
+    action = parser.add_mutually_exclusive_group()
+    action.add_argument(
+        "--resume",
+        nargs="?",
+        const=LATEST,
+        metavar="THREAD_ID",
+        help="continue an interrupted run (default: the latest)",
+    )
+    action.add_argument(
+        "--discard",
+        nargs="?",
+        const=LATEST,
+        metavar="THREAD_ID",
+        help="delete an interrupted run and start over (default: the latest)",
+    )
+    args = parser.parse_args(argv)
+
+    if (args.resume or args.discard) and not args.checkpoint_path:
+        parser.error("--resume/--discard need --checkpoint-path")
+
     print("🚀 Starting LangGraph extraction workflow...")
     print()
+    tracing_from_settings()
+    init_clients()
+
+    # Each file takes three supersteps, so lift LangGraph's default limit of 25
+    config = {"recursion_limit": settings.graph_recursion_limit}
 
-    app = build_graph()
-    final_state = app.invoke({})
+    if not args.checkpoint_path:
+        final_state = build_graph().invoke({"stats": {}}, config=config)
+    else:
+        checkpointer = open_checkpointer(args.checkpoint_path)
+        app = build_graph(checkpointer)
+
+        thread_id = _resolve_thread(checkpointer, app, args)
+        if thread_id:
+            print(f"⏯️  Resuming run {thread_id}")
+            final_state = app.invoke(None, config=thread_config(thread_id, **config))
+        else:
+            thread_id = new_thread_id()
+            print(f"🧵 Run {thread_id} (checkpoints: {args.checkpoint_path})")
+            final_state = app.invoke(
+                {"stats": {}}, config=thread_config(thread_id, **config)
+            )
+
+        # Finished runs have nothing left to resume
+        checkpointer.delete_thread(thread_id)
+        checkpointer.conn.close()
 
     # Print summary
     stats = final_state.get("stats", {})
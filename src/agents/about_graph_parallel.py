@@ -0,0 +1,250 @@
+"""
+Parallel fan-out LangGraph workflow for the extraction pipeline.
+
+Unlike about_graph.py, which walks the listing one object at a time (three
+supersteps per file), this graph works in waves:
+
+1. list_objects streams the next page of markdown files from MinIO
+2. every object of the page is fanned out to its own process_object branch
+   with Send (map)
+3. per-branch counters are merged by the merge_stats reducer (reduce) and
+   the graph loops back for the next page
+
+Each wave costs two supersteps regardless of its size, and the number of
+branches running at once is capped by LangGraph's max_concurrency.
+
+As in about_graph.py, LangGraph is loaded when the graph is built and the
+MinIO and extractor instances are created by main(), not at import.
+"""
+
+from typing import TYPE_CHECKING, Annotated, Any, Dict, List, Optional, TypedDict, Union
+
+from src.agents.about_extractor_v2 import AboutExtractorV2
+from src.agents.run_batch_production import process_single_file
+from src.config.settings import settings
+from src.modules.graph_reducers import merge_stats
+from src.modules.logger import logger
+from src.modules.minio_manager import MinIOManager
+from src.modules.skip_index import CompletedIndex, completed_index_from_settings
+from src.modules.statistics import ExtractionStatistics
+from src.modules.tracing import span, tracing_from_settings
+
+if TYPE_CHECKING:
+    from langgraph.graph.state import CompiledStateGraph
+
+
+class ParallelScrapeState(TypedDict, total=False):
+    """
+    State of the fan-out workflow.
+    """
+
+    cursor: Optional[str]  # Last listed object name (listing resumes after it)
+    wave: List[Dict[str, Any]]  # Listing entries of the current wave
+    listing_done: bool  # True once the listing is exhausted
+    stats: Annotated[Dict[str, int], merge_stats]  # Counters merged per branch
+
+
+class ObjectTask(TypedDict):
+    """
+    Payload sent to one process_object branch.
+    """
+
+    object_name: str
+    source: Dict[str, Any]  # Listing entry (etag, last_modified)
+
+
+# Global instances; the clients are created by init_clients()
+stats = ExtractionStatistics()
+minio_mgr: Optional[MinIOManager] = None
+extractor: Optional[AboutExtractorV2] = None
+
+# Index of existing results, built once by the first list_objects call
+completed_index: Optional[CompletedIndex] = None
+
+# Maps process_single_file statuses to stats counters
+_STATUS_COUNTERS = {"success": "success", "skipped": "skipped", "error": "errors"}
+
+
+def init_clients():
+    """Create the MinIO and extractor instances unless already set."""
+    global minio_mgr, extractor
+
+    if minio_mgr is None:
+        minio_mgr = MinIOManager(stats=stats)
+    if extractor is None:
+        extractor = AboutExtractorV2(stats=stats)
+
+
+def node_list_objects(state: ParallelScrapeState) -> ParallelScrapeState:
+    """
+    Node 1: List the next wave of markdown files from MinIO.
+    """
+    global completed_index
+
+    if completed_index is None:
+        completed_index = completed_index_from_settings(
+            minio_mgr, fingerprint=extractor.fingerprint
+        )
+
+    # Each wave reopens the listing, so fetch no more keys than it takes
+    page_size = settings.graph_wave_size
+    if settings.listing_page_size:
+        page_size = min(settings.listing_page_size, page_size)
+
+    wave = []
+    for obj in minio_mgr.iter_objects(
+        prefix="scraped-content/",
+        suffix=".md",
+        start_after=state.get("cursor"),
+        page_size=page_size,
+    ):
+        wave.append(obj)
+        if len(wave) >= settings.graph_wave_size:
+            break
+
+    stats.record_listed(len(wave))
+    if wave:
+        logger.info(f"📁 Listed {len(wave)} markdown files after {state.get('cursor')}")
+
+    return {
+        "wave": wave,
+        "cursor": wave[-1]["object_name"] if wave else state.get("cursor"),
+        "listing_done": len(wave) < settings.graph_wave_size,
+        "stats": {"total": len(wave)},
+    }
+
+
+def node_process_object(task: ObjectTask) -> ParallelScrapeState:
+    """
+    Node 2 (one branch per object): fetch, extract and save one file.
+    """
+    with span("file", object=task["object_name"]):
+        result = process_single_file(
+            extractor,
+            minio_mgr,
+            task["object_name"],
+            stats,
+            completed_index,
+            source=task["source"],
+        )
+    return {"stats": {_STATUS_COUNTERS[result["status"]]: 1}}
+
+
+def node_next_wave(state: ParallelScrapeState) -> ParallelScrapeState:
+    """
+    Node 3: Join point after every branch of a wave has finished.
+    """
+    counters = state.get("stats", {})
+    done = counters.get("success", 0) + counters.get("skipped", 0)
+    done += counters.get("errors", 0)
+    logger.info(f"[{done}/{counters.get('total', 0)}] wave complete")
+    return {}
+
+
+def fan_out(state: ParallelScrapeState) -> Union[str, list]:
+    """
+    Conditional edge: Send every object of the wave to its own branch.
+
+    Returns END or a list of Send packets (LangGraph resolves this
+    annotation at build time, so it cannot name the lazily imported Send).
+    """
+    from langgraph.graph import END
+    from langgraph.types import Send
+
+    wave = state.get("wave", [])
+    if not wave:
+        return END
+    return [
+        Send("process_object", {"object_name": obj["object_name"], "source": obj})
+        for obj in wave
+    ]
+
+
+def should_continue(state: ParallelScrapeState) -> str:
+    """
+    Conditional edge: List the next wave or end.
+    """
+    from langgraph.graph import END
+
+    if state.get("listing_done"):
+        return END
+    return "list_objects"
+
+
+def build_parallel_graph() -> "CompiledStateGraph":
+    """
+    Build and compile the fan-out extraction workflow graph.
+    """
+    from langgraph.graph import END, StateGraph
+
+    graph = StateGraph(ParallelScrapeState)
+
+    # Add nodes
+    graph.add_node("list_objects", node_list_objects)
+    graph.add_node("process_object", node_process_object)
+    graph.add_node("next_wave", node_next_wave)
+
+    # Set entry point
+    graph.set_entry_point("list_objects")
+
+    # Map: one branch per listed object
+    graph.add_conditional_edges("list_objects", fan_out, ["process_object", END])
+
+    # Reduce: all branches of a wave join before the next listing page
+    graph.add_edge("process_object", "next_wave")
+    graph.add_conditional_edges(
+        "next_wave",
+        should_continue,
+        {
+            "list_objects": "list_objects",
+            END: END,
+        },
+    )
+
+    return graph.compile()
+
+
+def main():
+    """
+    Run the fan-out extraction workflow.
+    """
+    max_concurrency = settings.graph_max_concurrency or settings.extraction_max_workers
+
+    logger.info("🚀 Starting parallel LangGraph extraction workflow...")
+    logger.info(f"📊 Model: {settings.langextract_model}")
+    logger.info(f"👥 Max Concurrency: {max_concurrency}")
+    logger.info(f"🌊 Wave Size: {settings.graph_wave_size}")
+    print()
+
+    tracing_from_settings()
+    init_clients()
+    app = build_parallel_graph()
+    try:
+        final_state = app.invoke(
+            {"stats": {}},
+            config={
+                "recursion_limit": settings.graph_recursion_limit,
+                "max_concurrency": max_concurrency,
+            },
+        )
+    finally:
+        if completed_index is not None:
+            completed_index.close()
+
+    # Print summary
+    counters = final_state.get("stats", {})
+    print("\n" + "=" * 60)
+    print("📊 Extraction Summary:")
+    print(f"  ✅ Successful: {counters.get('success', 0)}")
+    print(f"  ⏭️  Skipped: {counters.get('skipped', 0)}")
+    print(f"  ❌ Errors: {counters.get('errors', 0)}")
+    print(f"  📁 Total: {counters.get('total', 0)}")
+    print("=" * 60)
+
+    if stats.total_files:
+        stats.print_summary()
+        stats.save_to_file()
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,8 @@ company information, saving results as JSON files.
 from src.agents.about_extractor import AboutExtractor
 from src.config.settings import settings
 from src.modules.minio_manager import MinIOManager
+from src.modules.skip_index import CompletedIndex
+from src.modules.tracing import tracing_from_settings
 
 
 def run_batch_about_extraction():
@@ -22,25 +24,30 @@ def run_batch_about_extraction():
     minio_mgr = MinIOManager()
     extractor = AboutExtractor()
 
-    # List all markdown files
-    objects = minio_mgr.list_objects(prefix="scraped-content/", recursive=True)
-    md_objects = [obj for obj in objects if obj["object_name"].endswith(".md")]
-
-    print(f"📁 Found {len(md_objects)} markdown files")
-    print()
+    completed = CompletedIndex.build(
+        minio_mgr,
+        prefix="scraped-content/",
+        persist_path=settings.skip_index_path,
+        refresh=settings.skip_index_refresh,
+    )
 
     success_count = 0
     skip_count = 0
     error_count = 0
+    total = 0
+
+    # Stream markdown files from the listing
+    md_objects = minio_mgr.iter_objects(prefix="scraped-content/", suffix=".md")
 
     for idx, obj in enumerate(md_objects, 1):
+        total = idx
         object_name = obj["object_name"]
         json_path = object_name.replace(".md", ".about.json")
 
-        print(f"[{idx}/{len(md_objects)}] Processing: {object_name}")
+        print(f"[{idx}] Processing: {object_name}")
 
         # Skip if JSON already exists
-        if minio_mgr.object_exists(json_path):
+        if json_path in completed:
             print(f"⏭️  Skipping (already exists): {json_path}")
             skip_count += 1
             continue
@@ -58,21 +65,25 @@ def run_batch_about_extraction():
         success = minio_mgr.upload_json(json_path, data)
 
         if success:
+            completed.add(json_path)
             success_count += 1
         else:
             error_count += 1
 
         print()
 
+    completed.close()
+
     # Summary
     print("=" * 60)
     print("📊 Extraction Summary:")
     print(f"  ✅ Successful: {success_count}")
     print(f"  ⏭️  Skipped: {skip_count}")
     print(f"  ❌ Errors: {error_count}")
-    print(f"  📁 Total: {len(md_objects)}")
+    print(f"  📁 Total: {total}")
     print("=" * 60)
 
 
 if __name__ == "__main__":
+    tracing_from_settings()
     run_batch_about_extraction()
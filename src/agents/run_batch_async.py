@@ -0,0 +1,305 @@
+"""
+Asyncio batch extraction runner.
+
+Alternative to run_batch_production.py for large buckets. Each object is a
+coroutine instead of a thread, so thousands of objects can be in flight on
+a single core. Blocking MinIO and LLM calls run on a small thread pool that
+is bounded by per-stage semaphores:
+
+- download: concurrent MinIO GETs
+- llm: concurrent LLM calls (also metered by the shared RateLimiter)
+- upload: concurrent MinIO PUTs
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional, Union
+
+from src.agents.about_extractor_v2 import AboutExtractorV2
+from src.config.settings import settings
+from src.modules.async_minio import AsyncMinIOManager
+from src.modules.logger import logger
+from src.modules.minio_manager import MinIOManager
+from src.modules.skip_index import (
+    CompletedIndex,
+    completed_index_from_settings,
+    provenance_metadata,
+)
+from src.modules.statistics import ExtractionStatistics
+from src.modules.tracing import span, tracing_from_settings
+
+# Marks the end of the listing for each worker
+_STOP = object()
+
+
+class AsyncPipeline:
+    """
+    Download → extract → upload pipeline with a semaphore per stage.
+    """
+
+    def __init__(
+        self,
+        extractor: AboutExtractorV2,
+        minio_mgr: MinIOManager,
+        stats: ExtractionStatistics,
+        completed: Optional[CompletedIndex] = None,
+        download_concurrency: Optional[int] = None,
+        llm_concurrency: Optional[int] = None,
+        upload_concurrency: Optional[int] = None,
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            extractor: AboutExtractorV2 instance
+            minio_mgr: MinIOManager instance
+            stats: Statistics tracker
+            completed: Index of existing results
+            download_concurrency: Max concurrent downloads
+            llm_concurrency: Max concurrent LLM calls
+            upload_concurrency: Max concurrent uploads
+        """
+        self.extractor = extractor
+        self.stats = stats
+        self.completed = completed
+
+        download_concurrency = (
+            download_concurrency or settings.async_download_concurrency
+        )
+        llm_concurrency = llm_concurrency or settings.extraction_max_workers
+        upload_concurrency = upload_concurrency or settings.async_upload_concurrency
+
+        self.download_sem = asyncio.Semaphore(download_concurrency)
+        self.llm_sem = asyncio.Semaphore(llm_concurrency)
+        self.upload_sem = asyncio.Semaphore(upload_concurrency)
+
+        # One thread per possible concurrent blocking call plus the listing
+        self.executor = ThreadPoolExecutor(
+            max_workers=download_concurrency + llm_concurrency + upload_concurrency + 1,
+            thread_name_prefix="async-io",
+        )
+        self.minio = AsyncMinIOManager(minio_mgr, self.executor)
+
+    async def process_single_file(
+        self, object_name: str, source: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, any]:
+        """
+        Process a single markdown file.
+
+        Args:
+            object_name: Markdown file path
+            source: Listing entry of the object (provenance of the result)
+
+        Returns:
+            Result dictionary
+        """
+        json_path = object_name.replace(".md", ".about.json")
+
+        try:
+            if self.completed is not None and self.completed.incremental:
+                already_done = self.completed.is_current(json_path, source)
+            elif self.completed is not None:
+                already_done = json_path in self.completed
+            else:
+                already_done = await self.minio.object_exists(json_path)
+
+            if already_done:
+                logger.info(f"⏭️  Skipping (already exists): {json_path}")
+                self.stats.record_skip()
+                return {"status": "skipped", "file": object_name}
+            if self.completed is not None and json_path in self.completed:
+                logger.info(
+                    f"🔄 Re-extracting (source or config changed): {object_name}"
+                )
+                self.stats.record_refresh()
+
+            start_time = time.time()
+
+            async with self.download_sem:
+                markdown = await self.minio.download_object(object_name, as_text=True)
+
+            if not markdown:
+                self.stats.record_error(object_name, "Download failed")
+                return {
+                    "status": "error",
+                    "file": object_name,
+                    "error": "Download failed",
+                }
+
+            async with self.llm_sem:
+                company_info = await self.extractor.aextract_from_markdown_text(
+                    markdown, self.executor, source=object_name
+                )
+
+            if not company_info:
+                logger.warning(f"⚠️  No data extracted from: {object_name}")
+                self.stats.record_error(object_name, "No data extracted")
+                return {
+                    "status": "error",
+                    "file": object_name,
+                    "error": "No data extracted",
+                }
+
+            metadata = None
+            if source is not None:
+                metadata = provenance_metadata(source, self.extractor.fingerprint)
+            async with self.upload_sem:
+                success = await self.minio.upload_json(
+                    json_path, company_info.model_dump(), metadata
+                )
+
+            processing_time = time.time() - start_time
+
+            if success:
+                if self.completed is not None:
+                    self.completed.add(json_path, metadata)
+                self.stats.record_success(processing_time)
+                return {
+                    "status": "success",
+                    "file": object_name,
+                    "time": processing_time,
+                }
+
+            self.stats.record_error(object_name, "Failed to upload JSON")
+            return {"status": "error", "file": object_name, "error": "Upload failed"}
+
+        except Exception as e:
+            logger.error(f"❌ Error processing {object_name}: {e}", exc_info=True)
+            self.stats.record_error(object_name, str(e))
+            return {"status": "error", "file": object_name, "error": str(e)}
+
+    async def run(
+        self,
+        object_names: Iterable[Union[str, Dict[str, Any]]],
+        max_in_flight: Optional[int] = None,
+    ):
+        """
+        Process objects with a bounded number of in-flight coroutines.
+
+        Names are pulled from the (possibly blocking, lazily listed) iterable
+        on the thread pool and buffered in a bounded queue, so processing
+        starts before the listing finishes.
+
+        Args:
+            object_names: Markdown file paths, or listing entries (which
+                also carry the source version for incremental mode)
+            max_in_flight: Max objects being processed at once
+        """
+        max_in_flight = max_in_flight or settings.async_max_in_flight
+        work_queue: asyncio.Queue = asyncio.Queue(maxsize=settings.work_queue_size)
+        loop = asyncio.get_running_loop()
+        done_count = 0
+
+        async def producer():
+            names = iter(object_names)
+            try:
+                while True:
+                    name = await loop.run_in_executor(self.executor, next, names, _STOP)
+                    if name is _STOP:
+                        break
+                    self.stats.total_files += 1
+                    await work_queue.put(name)
+            except Exception as e:
+                logger.error(f"❌ Listing failed: {e}", exc_info=True)
+                self.stats.record_listing_failure("listing", e)
+            finally:
+                for _ in range(max_in_flight):
+                    await work_queue.put(_STOP)
+
+        async def worker():
+            nonlocal done_count
+            while True:
+                item = await work_queue.get()
+                if item is _STOP:
+                    return
+
+                source = item if isinstance(item, dict) else None
+                name = source["object_name"] if source is not None else item
+                with span("file", object=name):
+                    result = await self.process_single_file(name, source)
+                done_count += 1
+                progress = f"[{done_count}/{self.stats.total_files}]"
+
+                if result["status"] == "success":
+                    logger.info(f"{progress} ✅ {name} ({result['time']:.2f}s)")
+                elif result["status"] == "skipped":
+                    logger.info(f"{progress} ⏭️  {name}")
+                else:
+                    logger.warning(
+                        f"{progress} ❌ {name}: {result.get('error', 'Unknown error')}"
+                    )
+
+        workers = [asyncio.create_task(worker()) for _ in range(max_in_flight)]
+        await asyncio.gather(producer(), *workers)
+
+    def close(self):
+        """Shut down the blocking-call thread pool."""
+        self.executor.shutdown(wait=True)
+
+
+async def run_batch_extraction_async():
+    """
+    Run batch extraction with the asyncio pipeline.
+    """
+    logger.info("🚀 Starting async batch extraction...")
+    logger.info(f"📊 Model: {settings.langextract_model}")
+    logger.info(f"🗄️  MinIO: {settings.minio_endpoint}")
+    logger.info(f"📦 Bucket: {settings.minio_bucket_name}")
+    logger.info(f"🛫 Max In-Flight: {settings.async_max_in_flight}")
+    logger.info(
+        f"🚦 Concurrency: download={settings.async_download_concurrency} "
+        f"llm={settings.extraction_max_workers} "
+        f"upload={settings.async_upload_concurrency}"
+    )
+    logger.info(f"⏱️  Rate Limit: {settings.rate_limit_requests_per_minute} req/min")
+    print()
+
+    stats = ExtractionStatistics()
+    minio_mgr = MinIOManager(stats=stats)
+    extractor = AboutExtractorV2(stats=stats)
+
+    loop = asyncio.get_running_loop()
+    completed = await loop.run_in_executor(
+        None,
+        lambda: completed_index_from_settings(
+            minio_mgr, fingerprint=extractor.fingerprint
+        ),
+    )
+
+    logger.info("📁 Streaming markdown files from MinIO...")
+    md_objects = minio_mgr.iter_objects(
+        prefix="scraped-content/",
+        suffix=".md",
+        page_size=settings.listing_page_size,
+    )
+
+    pipeline = AsyncPipeline(extractor, minio_mgr, stats, completed)
+    try:
+        await pipeline.run(md_objects)
+    finally:
+        pipeline.close()
+        completed.close()
+
+    logger.info(f"✓ Processed {stats.total_files} markdown files")
+    if not stats.total_files and stats.listing_error is None:
+        logger.warning("No markdown files found.")
+        return
+
+    # Print and save statistics
+    print()
+    stats.print_summary()
+    stats.save_to_file()
+
+    if stats.listing_error is not None:
+        raise RuntimeError(f"Run incomplete, listing failed: {stats.listing_error}")
+
+
+def main():
+    """Entry point for the async runner."""
+    tracing_from_settings()
+    asyncio.run(run_batch_extraction_async())
+
+
+if __name__ == "__main__":
+    main()
@@ -3,21 +3,210 @@ Production-ready batch extraction runner with parallel processing.
 
 Features:
 - Parallel processing with thread pool
+- Streaming listing through a bounded work queue
 - Comprehensive error handling
 - Statistics tracking
 - Progress reporting
 - Retry logic
+- Optional packing of several small pages into one LLM call
+- Optional crash-safe run journal (pending uploads are replayed on restart)
+- Optional Prometheus metrics endpoint for live monitoring
+- Optional sharded JSONL output instead of one JSON object per page
+- Optional incremental mode (re-extracts only changed sources or configs)
+- Optional daemon mode (--daemon): processes new objects from bucket
+  notifications, with periodic reconciliation sweeps
+- Optional work leases, so several runner nodes share one bucket
 """
 
+import argparse
+import queue
+import signal
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.agents.about_extractor_v2 import AboutExtractorV2
 from src.config.settings import settings
+from src.modules.bucket_events import bucket_event_feed_from_settings
 from src.modules.logger import logger
+from src.modules.metrics_server import metrics_server_from_settings
 from src.modules.minio_manager import MinIOManager
+from src.modules.result_sink import ShardedResultSink, result_sink_from_settings
+from src.modules.run_journal import (
+    DOWNLOADED,
+    EXTRACTED,
+    UPLOADED,
+    RunJournal,
+    run_journal_from_settings,
+)
+from src.modules.skip_index import (
+    CompletedIndex,
+    completed_index_from_settings,
+    provenance_metadata,
+)
 from src.modules.statistics import ExtractionStatistics
+from src.modules.tracing import span, tracing_from_settings
+from src.modules.work_leases import WorkLeases, work_leases_from_settings
+
+# Marks the end of the listing for each worker
+_STOP = object()
+
+
+def mark_saved(
+    object_name: str,
+    journal: Optional[RunJournal] = None,
+    completed: Optional[CompletedIndex] = None,
+    metadata: Optional[Dict[str, str]] = None,
+):
+    """
+    Record that an object's result is stored.
+
+    Args:
+        object_name: Markdown file path
+        journal: Run journal to mark the object uploaded in (optional)
+        completed: Index of existing results to update (optional)
+        metadata: Provenance metadata the result was stored with
+    """
+    if journal is not None:
+        journal.record(object_name, UPLOADED)
+    if completed is not None:
+        completed.add(object_name.replace(".md", ".about.json"), metadata)
+
+
+def is_done(
+    minio_mgr: MinIOManager,
+    object_name: str,
+    state: Optional[str],
+    completed: Optional[CompletedIndex] = None,
+    source: Optional[Dict[str, Any]] = None,
+) -> bool:
+    """
+    Decide whether an object's stored result can be kept.
+
+    In incremental mode the index compares the result's provenance with
+    the listed source version; otherwise an existing result is final.
+
+    Args:
+        minio_mgr: MinIOManager instance (stat fallback without an index)
+        object_name: Markdown file path
+        state: Journal state of the object
+        completed: Index of existing results
+        source: Listing entry of the markdown object
+
+    Returns:
+        True if the object needs no processing
+    """
+    json_path = object_name.replace(".md", ".about.json")
+    if completed is not None and completed.incremental:
+        return completed.is_current(json_path, source)
+    if state == UPLOADED:
+        return True
+    if completed is not None:
+        return json_path in completed
+    return minio_mgr.object_exists(json_path)
+
+
+def result_metadata(
+    extractor: AboutExtractorV2, source: Optional[Dict[str, Any]]
+) -> Optional[Dict[str, str]]:
+    """
+    Build the provenance metadata of a result.
+
+    Args:
+        extractor: Extractor whose config fingerprint is recorded
+        source: Listing entry of the markdown object (None if unknown)
+
+    Returns:
+        Metadata dictionary, or None without a listing entry
+    """
+    if source is None:
+        return None
+    return provenance_metadata(source, extractor.fingerprint)
+
+
+def claim_objects(
+    leases: WorkLeases,
+    names: List[str],
+    sources: Dict[str, Dict[str, Any]],
+    completed: Optional[CompletedIndex],
+    fingerprint: str,
+) -> Tuple[List[str], Dict[str, Exception]]:
+    """
+    Claim the objects a worker is about to process.
+
+    Objects whose result is already current are kept without a lease (they
+    are skipped without work). In incremental mode the lease version is the
+    source ETag and config fingerprint, so a changed source can be claimed
+    again after another node finished the old one.
+
+    Args:
+        leases: Lease manager of this node
+        names: Markdown file paths
+        sources: Listing entries by object name
+        completed: Index of existing results
+        fingerprint: Extraction config fingerprint
+
+    Returns:
+        Tuple of (names this node may process, errors by name of objects
+        whose claim failed); the other names are held or done elsewhere
+    """
+    claimed = []
+    failed = {}
+    for name in names:
+        source = sources.get(name)
+        json_path = name.replace(".md", ".about.json")
+        if completed is not None and completed.is_current(json_path, source):
+            claimed.append(name)
+            continue
+
+        version = ""
+        if completed is not None and completed.incremental and source is not None:
+            version = f"{source.get('etag') or ''}:{fingerprint}"
+        try:
+            if leases.claim(name, version):
+                claimed.append(name)
+        except Exception as e:
+            failed[name] = e
+    return claimed, failed
+
+
+def save_result(
+    minio_mgr: MinIOManager,
+    object_name: str,
+    data: Dict[str, any],
+    journal: Optional[RunJournal] = None,
+    completed: Optional[CompletedIndex] = None,
+    sink: Optional[ShardedResultSink] = None,
+    metadata: Optional[Dict[str, str]] = None,
+) -> bool:
+    """
+    Store a result as its own JSON object or in the next shard.
+
+    With a sink, the journal and index are updated by the sink's on_commit
+    callback once the shard is written, not here.
+
+    Args:
+        minio_mgr: MinIOManager instance
+        object_name: Markdown file path
+        data: Extracted result
+        journal: Run journal (optional)
+        completed: Index of existing results (optional)
+        sink: Sharded result sink (None uploads a .about.json object)
+        metadata: Provenance metadata (object metadata or manifest entry)
+
+    Returns:
+        True if the result was uploaded or buffered
+    """
+    if sink is not None:
+        return sink.add(object_name, data, metadata)
+
+    options = {"metadata": metadata} if metadata else {}
+    json_path = object_name.replace(".md", ".about.json")
+    if not minio_mgr.upload_json(json_path, data, **options):
+        return False
+    mark_saved(object_name, journal, completed, metadata)
+    return True
 
 
 def process_single_file(
@@ -25,6 +214,10 @@ def process_single_file(
     minio_mgr: MinIOManager,
     object_name: str,
     stats: ExtractionStatistics,
+    completed: Optional[CompletedIndex] = None,
+    journal: Optional[RunJournal] = None,
+    sink: Optional[ShardedResultSink] = None,
+    source: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, any]:
     """
     Process a single markdown file.
@@ -34,6 +227,10 @@ def process_single_file(
         minio_mgr: MinIOManager instance
         object_name: Markdown file path
         stats: Statistics tracker
+        completed: Index of existing results (falls back to a stat call if None)
+        journal: Run journal recording each state change (optional)
+        sink: Sharded result sink (None uploads one JSON object per page)
+        source: Listing entry of the object (provenance of the result)
 
     Returns:
         Result dictionary
@@ -41,29 +238,59 @@ def process_single_file(
     json_path = object_name.replace(".md", ".about.json")
 
     try:
-        # Skip if JSON already exists
-        if minio_mgr.object_exists(json_path):
+        state, data = journal.get(object_name) if journal is not None else (None, None)
+
+        # Skip if an up-to-date JSON already exists
+        if is_done(minio_mgr, object_name, state, completed, source):
             logger.info(f"⏭️  Skipping (already exists): {json_path}")
             stats.record_skip()
             return {"status": "skipped", "file": object_name}
+        if completed is not None and json_path in completed:
+            logger.info(f"🔄 Re-extracting (source or config changed): {object_name}")
+            stats.record_refresh()
 
-        # Extract company info
         start_time = time.time()
-        company_info = extractor.extract_from_minio_object(object_name)
-        processing_time = time.time() - start_time
+        if state != EXTRACTED:
+            markdown = minio_mgr.download_object(object_name, as_text=True)
+            if not markdown:
+                stats.record_error(object_name, "Download failed")
+                return {
+                    "status": "error",
+                    "file": object_name,
+                    "error": "Download failed",
+                }
+            if journal is not None:
+                journal.record(object_name, DOWNLOADED)
 
-        if not company_info:
-            logger.warning(f"⚠️  No data extracted from: {object_name}")
-            stats.record_error(object_name, "No data extracted")
-            return {
-                "status": "error",
-                "file": object_name,
-                "error": "No data extracted",
-            }
+            # Extract company info
+            company_info = extractor.extract_from_markdown_text(
+                markdown, source=object_name
+            )
+
+            if not company_info:
+                logger.warning(f"⚠️  No data extracted from: {object_name}")
+                stats.record_error(object_name, "No data extracted")
+                return {
+                    "status": "error",
+                    "file": object_name,
+                    "error": "No data extracted",
+                }
+
+            data = company_info.model_dump()
+            if journal is not None:
+                journal.record(object_name, EXTRACTED, data)
+        processing_time = time.time() - start_time
 
         # Save to MinIO
-        data = company_info.model_dump()
-        success = minio_mgr.upload_json(json_path, data)
+        success = save_result(
+            minio_mgr,
+            object_name,
+            data,
+            journal,
+            completed,
+            sink,
+            result_metadata(extractor, source),
+        )
 
         if success:
             stats.record_success(processing_time)
@@ -79,9 +306,320 @@ def process_single_file(
         return {"status": "error", "file": object_name, "error": str(e)}
 
 
-def run_batch_extraction_parallel():
+def process_batch(
+    extractor: AboutExtractorV2,
+    minio_mgr: MinIOManager,
+    object_names: List[str],
+    stats: ExtractionStatistics,
+    completed: Optional[CompletedIndex] = None,
+    journal: Optional[RunJournal] = None,
+    sink: Optional[ShardedResultSink] = None,
+    sources: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> List[Dict[str, any]]:
+    """
+    Process several markdown files with shared (packed) LLM calls.
+
+    Args:
+        extractor: AboutExtractorV2 instance
+        minio_mgr: MinIOManager instance
+        object_names: Markdown file paths
+        stats: Statistics tracker
+        completed: Index of existing results (falls back to a stat call if None)
+        journal: Run journal recording each state change (optional)
+        sink: Sharded result sink (None uploads one JSON object per page)
+        sources: Listing entries by object name (provenance of the results)
+
+    Returns:
+        List of result dictionaries, one per object name
+    """
+    sources = sources or {}
+    results: Dict[str, Dict[str, any]] = {}
+    documents = []
+    uploads: Dict[str, Dict[str, any]] = {}  # Results to save, incl. replayed
+
+    for object_name in object_names:
+        json_path = object_name.replace(".md", ".about.json")
+        try:
+            state, data = (
+                journal.get(object_name) if journal is not None else (None, None)
+            )
+            source = sources.get(object_name)
+            if is_done(minio_mgr, object_name, state, completed, source):
+                logger.info(f"⏭️  Skipping (already exists): {json_path}")
+                stats.record_skip()
+                results[object_name] = {"status": "skipped", "file": object_name}
+                continue
+            if completed is not None and json_path in completed:
+                logger.info(
+                    f"🔄 Re-extracting (source or config changed): {object_name}"
+                )
+                stats.record_refresh()
+
+            if state == EXTRACTED:
+                uploads[object_name] = data  # Extracted before a crash
+                continue
+
+            markdown = minio_mgr.download_object(object_name, as_text=True)
+            if not markdown:
+                stats.record_error(object_name, "Download failed")
+                results[object_name] = {
+                    "status": "error",
+                    "file": object_name,
+                    "error": "Download failed",
+                }
+                continue
+
+            if journal is not None:
+                journal.record(object_name, DOWNLOADED)
+            documents.append((object_name, markdown))
+
+        except Exception as e:
+            logger.error(f"❌ Error processing {object_name}: {e}", exc_info=True)
+            stats.record_error(object_name, str(e))
+            results[object_name] = {
+                "status": "error",
+                "file": object_name,
+                "error": str(e),
+            }
+
+    start_time = time.time()
+    extracted = extractor.extract_batch(documents) if documents else {}
+    # Packed calls are shared, so each document is charged an equal share
+    processing_time = (time.time() - start_time) / max(len(documents), 1)
+
+    for object_name, company_info in extracted.items():
+        if isinstance(company_info, Exception):
+            stats.record_error(object_name, str(company_info))
+            results[object_name] = {
+                "status": "error",
+                "file": object_name,
+                "error": str(company_info),
+            }
+        elif not company_info:
+            logger.warning(f"⚠️  No data extracted from: {object_name}")
+            stats.record_error(object_name, "No data extracted")
+            results[object_name] = {
+                "status": "error",
+                "file": object_name,
+                "error": "No data extracted",
+            }
+        else:
+            uploads[object_name] = company_info.model_dump()
+            if journal is not None:
+                journal.record(object_name, EXTRACTED, uploads[object_name])
+
+    # Save to MinIO
+    for object_name, data in uploads.items():
+        metadata = result_metadata(extractor, sources.get(object_name))
+        if save_result(
+            minio_mgr, object_name, data, journal, completed, sink, metadata
+        ):
+            stats.record_success(processing_time)
+            results[object_name] = {
+                "status": "success",
+                "file": object_name,
+                "time": processing_time,
+            }
+        else:
+            stats.record_error(object_name, "Failed to upload JSON")
+            results[object_name] = {
+                "status": "error",
+                "file": object_name,
+                "error": "Upload failed",
+            }
+
+    return [results[name] for name in object_names]
+
+
+def take_group(work_queue: queue.Queue, max_items: int) -> List:
+    """
+    Take one item (blocking) plus whatever else is queued, up to max_items.
+
+    A stop marker ends the group and is returned as its last element.
+
+    Args:
+        work_queue: Work queue filled by feed_work_queue()
+        max_items: Maximum number of objects in the group
+
+    Returns:
+        List of listing entries, possibly ending with the stop marker
+    """
+    group = [work_queue.get()]
+    while group[-1] is not _STOP and len(group) < max_items:
+        try:
+            group.append(work_queue.get_nowait())
+        except queue.Empty:
+            break
+    return group
+
+
+def replay_pending_uploads(
+    journal: RunJournal,
+    minio_mgr: MinIOManager,
+    stats: ExtractionStatistics,
+    completed: Optional[CompletedIndex] = None,
+    sink: Optional[ShardedResultSink] = None,
+) -> int:
+    """
+    Upload results that were extracted but not saved before a crash.
+
+    Args:
+        journal: Run journal of the interrupted run
+        minio_mgr: MinIOManager instance
+        stats: Statistics tracker
+        completed: Index of existing results to update
+        sink: Sharded result sink (None uploads one JSON object per page)
+
+    Returns:
+        Number of replayed uploads
+    """
+    replayed = 0
+    for object_name, data in journal.pending_uploads():
+        if not save_result(minio_mgr, object_name, data, journal, completed, sink):
+            logger.warning(f"⚠️  Replay failed, will retry on listing: {object_name}")
+            continue
+
+        stats.record_replay()
+        replayed += 1
+
+    # Keep replays out of the shards of new results
+    if sink is not None and not sink.flush():
+        logger.warning("⚠️  Replayed shard failed, will retry on listing")
+
+    if replayed:
+        logger.info(f"🔁 Replayed {replayed} journaled uploads")
+    return replayed
+
+
+def feed_work_queue(
+    minio_mgr: MinIOManager,
+    work_queue: queue.Queue,
+    stats: ExtractionStatistics,
+    num_workers: int,
+    prefix: str = "scraped-content/",
+    journal: Optional[RunJournal] = None,
+):
+    """
+    Stream markdown listing entries from MinIO into the bounded work queue.
+
+    Blocks whenever the queue is full, so listing never runs far ahead of
+    the workers. Puts one stop marker per worker when the listing ends; a
+    listing that fails for good is recorded in the stats, marking the run
+    incomplete.
+
+    Args:
+        minio_mgr: MinIOManager instance
+        work_queue: Bounded queue consumed by the workers
+        stats: Statistics tracker (total_files grows as objects are listed)
+        num_workers: Number of consumers waiting on the queue
+        prefix: Prefix to list markdown files under
+        journal: Run journal that listed objects are recorded in (optional)
+    """
+    try:
+        for obj in minio_mgr.iter_objects(
+            prefix=prefix, suffix=".md", page_size=settings.listing_page_size
+        ):
+            stats.total_files += 1
+            if journal is not None:
+                journal.mark_listed(obj["object_name"])
+            work_queue.put(obj)
+    except Exception as e:
+        logger.error(f"❌ Listing failed: {e}", exc_info=True)
+        stats.record_listing_failure(prefix, e)
+    finally:
+        for _ in range(num_workers):
+            work_queue.put(_STOP)
+
+
+class PendingSet:
+    """
+    Thread-safe set of objects queued or in progress (daemon mode).
+
+    An object reported by both a notification and a sweep is queued once.
+    """
+
+    def __init__(self):
+        self._names = set()
+        self._lock = threading.Lock()
+
+    def add(self, name: str) -> bool:
+        """Add a name; False if it is already pending."""
+        with self._lock:
+            if name in self._names:
+                return False
+            self._names.add(name)
+            return True
+
+    def discard(self, name: str):
+        """Remove a finished name."""
+        with self._lock:
+            self._names.discard(name)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+def feed_from_events(
+    minio_mgr: MinIOManager,
+    work_queue: queue.Queue,
+    stats: ExtractionStatistics,
+    num_workers: int,
+    completed: CompletedIndex,
+    pending: PendingSet,
+    stop: threading.Event,
+    prefix: str = "scraped-content/",
+    journal: Optional[RunJournal] = None,
+):
+    """
+    Feed new markdown objects from bucket notifications until `stop` is set.
+
+    Events and reconciliation sweeps are filtered against the skip index
+    and the objects already queued, so only new (or, in incremental mode,
+    changed) objects reach the workers. Puts one stop marker per worker
+    when the feed ends.
+
+    Args:
+        minio_mgr: MinIOManager instance
+        work_queue: Bounded queue consumed by the workers
+        stats: Statistics tracker (total_files grows as objects are queued)
+        num_workers: Number of consumers waiting on the queue
+        completed: Index of existing results
+        pending: Objects queued or being processed
+        stop: Event that ends the feed
+        prefix: Prefix to watch for markdown files
+        journal: Run journal that queued objects are recorded in (optional)
+    """
+
+    def submit(obj: Dict[str, Any]):
+        name = obj["object_name"]
+        json_path = name.replace(".md", ".about.json")
+        if completed.is_current(json_path, obj) or not pending.add(name):
+            return
+        stats.total_files += 1
+        if journal is not None:
+            journal.mark_listed(name)
+        work_queue.put(obj)
+
+    try:
+        bucket_event_feed_from_settings(minio_mgr, submit, prefix).run(stop)
+    except Exception as e:
+        logger.error(f"❌ Event feed failed: {e}", exc_info=True)
+    finally:
+        for _ in range(num_workers):
+            work_queue.put(_STOP)
+
+
+def run_batch_extraction_parallel(daemon: bool = False):
     """
     Run batch extraction with parallel processing.
+
+    A producer thread streams the listing into a bounded queue while the
+    workers consume it, so memory stays constant and processing starts
+    before the listing finishes.
+
+    Args:
+        daemon: Keep running and process objects as bucket notifications
+            report them (reconciled by periodic sweeps) until SIGTERM/SIGINT
     """
     logger.info("🚀 Starting production batch extraction...")
     logger.info(f"📊 Model: {settings.langextract_model}")
@@ -90,66 +628,284 @@ def run_batch_extraction_parallel():
     logger.info(f"👥 Max Workers: {settings.extraction_max_workers}")
     logger.info(f"🔄 Retry Count: {settings.extraction_retry_count}")
     logger.info(f"⏱️  Rate Limit: {settings.rate_limit_requests_per_minute} req/min")
+    if daemon:
+        logger.info(
+            f"👂 Daemon mode: bucket notifications, sweep every "
+            f"{settings.daemon_sweep_interval:.0f}s"
+        )
+    if settings.extraction_batch_enabled:
+        logger.info(
+            f"📦 Batching: up to {settings.extraction_batch_max_docs} docs / "
+            f"{settings.extraction_batch_max_chars} chars per call"
+        )
     print()
 
     # Initialize components
-    minio_mgr = MinIOManager()
-    extractor = AboutExtractorV2()
     stats = ExtractionStatistics()
+    minio_mgr = MinIOManager(stats=stats)
+    extractor = AboutExtractorV2(stats=stats)
 
-    # List all markdown files
-    logger.info("📁 Listing markdown files from MinIO...")
-    objects = minio_mgr.list_objects(
-        prefix="scraped-content/", recursive=False, limit=50
+    completed_index = completed_index_from_settings(
+        minio_mgr, fingerprint=extractor.fingerprint
     )
-    md_objects = [
-        obj["object_name"] for obj in objects if obj["object_name"].endswith(".md")
-    ]
+    if completed_index.incremental:
+        logger.info("🔄 Incremental mode: re-extracting changed sources and configs")
 
-    stats.total_files = len(md_objects)
-    logger.info(f"✓ Found {len(md_objects)} markdown files")
-    print()
+    journal = run_journal_from_settings()
+    if journal is not None:
+        logger.info(f"📓 Run journal: {journal.path} {journal.counts()}")
 
-    if not md_objects:
-        logger.warning("No markdown files found. Exiting.")
-        return
+    leases = work_leases_from_settings(minio_mgr, stats)
+    if leases is not None:
+        logger.info(f"🔒 Work leases: {leases.owner} (TTL {leases.ttl:.0f}s)")
 
-    # Process files in parallel
-    with ThreadPoolExecutor(max_workers=settings.extraction_max_workers) as executor:
-        # Submit all tasks
-        future_to_file = {
-            executor.submit(process_single_file, extractor, minio_mgr, obj, stats): obj
-            for obj in md_objects
-        }
+    def on_shard_written(names: List[str], metadata: List[Optional[Dict[str, str]]]):
+        for name, meta in zip(names, metadata):
+            mark_saved(name, journal, completed_index, meta)
+            if leases is not None:
+                leases.release(name, done=True)
 
-        # Process completed tasks
-        completed = 0
-        for future in as_completed(future_to_file):
-            completed += 1
-            file_name = future_to_file[future]
+    def on_shard_failed(names: List[str]):
+        for name in names:
+            stats.record_lost(name, "Shard upload failed")
+            if leases is not None:
+                leases.release(name, done=False)
 
-            try:
-                result = future.result()
-                progress = f"[{completed}/{len(md_objects)}]"
-
-                if result["status"] == "success":
-                    logger.info(f"{progress} ✅ {file_name} ({result['time']:.2f}s)")
-                elif result["status"] == "skipped":
-                    logger.info(f"{progress} ⏭️  {file_name}")
-                else:
-                    logger.warning(
-                        f"{progress} ❌ {file_name}: {result.get('error', 'Unknown error')}"
+    sink = result_sink_from_settings(minio_mgr, on_commit=on_shard_written)
+    if sink is not None:
+        # Results stored in earlier runs' shards count as existing
+        for entry in sink.iter_manifest():
+            completed_index.add(
+                entry["source"].replace(".md", ".about.json"), entry.get("metadata")
+            )
+        logger.info(
+            f"📦 Sharded output: {sink.prefix} ({sink.compression}, "
+            f"{sink.max_records} results per shard)"
+        )
+
+    if journal is not None:
+        replay_pending_uploads(journal, minio_mgr, stats, completed_index, sink)
+    if sink is not None:
+        # Replays are flushed by now, so a failed shard only holds results
+        # that were already counted as successes
+        sink.on_failure = on_shard_failed
+
+    num_workers = settings.extraction_max_workers
+    work_queue: queue.Queue = queue.Queue(maxsize=settings.work_queue_size)
+
+    pending = PendingSet()
+
+    metrics = metrics_server_from_settings(stats)
+    if metrics is not None:
+        metrics.add_gauge("extraction_work_queue_depth", work_queue.qsize)
+        metrics.add_gauge("extraction_work_queue_capacity", lambda: work_queue.maxsize)
+        if daemon:
+            metrics.add_gauge("extraction_daemon_pending_objects", pending.__len__)
+        if leases is not None:
+            metrics.add_gauge("extraction_leases_held", lambda: leases.held)
+    progress_lock = threading.Lock()
+    done_count = 0
+
+    group_size = (
+        settings.extraction_batch_max_docs if settings.extraction_batch_enabled else 1
+    )
+
+    def report(result: Dict[str, any]):
+        nonlocal done_count
+        file_name = result["file"]
+        with progress_lock:
+            done_count += 1
+            progress = f"[{done_count}/{stats.total_files}]"
+
+        if result["status"] == "success":
+            logger.info(f"{progress} ✅ {file_name} ({result['time']:.2f}s)")
+        elif result["status"] == "skipped":
+            logger.info(f"{progress} ⏭️  {file_name}")
+        else:
+            logger.warning(
+                f"{progress} ❌ {file_name}: {result.get('error', 'Unknown error')}"
+            )
+
+    def finish(result: Dict[str, any]):
+        report(result)
+        # Sharded results are released once their shard is written
+        if leases is not None and not (
+            sink is not None and result["status"] == "success"
+        ):
+            leases.release(result["file"], done=result["status"] != "error")
+
+    def fail(names: List[str], error: Exception):
+        """Record objects whose processing raised and release them for a retry."""
+        logger.error(f"❌ Worker error on {names}: {error}", exc_info=True)
+        for name in names:
+            stats.record_error(name, str(error))
+            finish({"status": "error", "file": name, "error": str(error)})
+
+    def worker():
+        while True:
+            group = take_group(work_queue, group_size)
+            stop = group[-1] is _STOP
+            entries = group[:-1] if stop else group
+            sources = {entry["object_name"]: entry for entry in entries}
+            names = list(sources)
+            if leases is not None and names:
+                try:
+                    claimed, failed = claim_objects(
+                        leases, names, sources, completed_index, extractor.fingerprint
                     )
+                except Exception as e:
+                    claimed, failed = [], dict.fromkeys(names, e)
+                for name in names:
+                    if name in failed:
+                        # A lease store outage is an error, not contention
+                        fail([name], failed[name])
+                    elif name not in claimed:
+                        report({"status": "skipped", "file": name})
+                names = claimed
+
+            if settings.extraction_batch_enabled and names:
+                try:
+                    with span("batch", objects=len(names)):
+                        results = process_batch(
+                            extractor,
+                            minio_mgr,
+                            names,
+                            stats,
+                            completed_index,
+                            journal,
+                            sink,
+                            sources,
+                        )
+                except Exception as e:
+                    fail(names, e)
+                    results = []
+                for result in results:
+                    finish(result)
+            else:
+                for file_name in names:
+                    try:
+                        with span("file", object=file_name):
+                            result = process_single_file(
+                                extractor,
+                                minio_mgr,
+                                file_name,
+                                stats,
+                                completed_index,
+                                journal,
+                                sink,
+                                sources[file_name],
+                            )
+                    except Exception as e:
+                        fail([file_name], e)
+                        continue
+                    finish(result)
+
+            if daemon:
+                for name in sources:
+                    pending.discard(name)
+                # Write buffered results once a burst of new objects is done
+                if sink is not None and work_queue.empty():
+                    try:
+                        sink.flush()
+                    except Exception as e:
+                        logger.error(f"❌ Writing a result shard failed: {e}")
+            if stop:
+                return
+
+    if daemon:
+        stop_event = threading.Event()
+
+        def request_stop(signum, frame):
+            logger.info("🛑 Stopping daemon after the queued objects...")
+            stop_event.set()
+
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, request_stop)
+
+        producer = threading.Thread(
+            target=feed_from_events,
+            args=(
+                minio_mgr,
+                work_queue,
+                stats,
+                num_workers,
+                completed_index,
+                pending,
+                stop_event,
+                "scraped-content/",
+                journal,
+            ),
+            name="event-producer",
+            daemon=True,
+        )
+    else:
+        # Stream the listing into the workers
+        logger.info("📁 Streaming markdown files from MinIO...")
+        producer = threading.Thread(
+            target=feed_work_queue,
+            args=(
+                minio_mgr,
+                work_queue,
+                stats,
+                num_workers,
+                "scraped-content/",
+                journal,
+            ),
+            name="listing-producer",
+            daemon=True,
+        )
+    producer.start()
 
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        workers = [executor.submit(worker) for _ in range(num_workers)]
+        for future in as_completed(workers):
+            try:
+                future.result()
             except Exception as e:
-                logger.error(f"[{completed}/{len(md_objects)}] ❌ {file_name}: {e}")
-                stats.record_error(file_name, str(e))
+                logger.error(f"❌ Worker crashed: {e}", exc_info=True)
+
+    producer.join()
+    if sink is not None:
+        sink.close()
+    if leases is not None:
+        leases.close()
+    completed_index.close()
+    if journal is not None:
+        journal.close()
+    if metrics is not None:
+        metrics.stop()
+
+    logger.info(f"✓ Processed {stats.total_files} markdown files")
+    if not stats.total_files and stats.listing_error is None:
+        logger.warning("No markdown files found.")
+        return
 
     # Print and save statistics
     print()
     stats.print_summary()
     stats.save_to_file()
 
+    if stats.listing_error is not None:
+        raise RuntimeError(f"Run incomplete, listing failed: {stats.listing_error}")
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Run the production batch extraction.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="Production batch extraction")
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="keep running and process new objects from bucket notifications",
+    )
+    args = parser.parse_args(argv)
+    tracing_from_settings()
+    run_batch_extraction_parallel(daemon=args.daemon)
+
 
 if __name__ == "__main__":
-    run_batch_extraction_parallel()
+    main()
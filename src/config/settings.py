@@ -22,14 +22,32 @@ class Settings(BaseSettings):
     minio_secret_key: str = "minioadmin"
     minio_bucket_name: str = "scraped-content"
     minio_secure: bool = False
+    minio_pool_size: int = 0  # shared connections, 0 = sized from the worker counts
+    minio_connect_timeout: float = 10.0  # seconds
+    minio_read_timeout: float = 120.0  # seconds
 
     # LLM Configuration
     google_api_key: Optional[str] = None
     langextract_model: str = "gemini-2.0-flash-exp"
+    llm_backend: str = "langextract"  # "ollama" for local models, "fake" for load tests
 
-    # Ollama Configuration (for future use)
+    # Fake LLM Backend (offline load and latency testing)
+    fake_llm_latency_distribution: str = "lognormal"  # or fixed, uniform, exponential
+    fake_llm_latency_mean: float = 1.0  # seconds
+    fake_llm_latency_sigma: float = 0.5
+    fake_llm_error_rate: float = 0.0  # transient 503 errors
+    fake_llm_rate_limit_rate: float = 0.0  # random 429 errors
+    fake_llm_requests_per_minute: int = 0  # server-side quota, 0 disables
+    fake_llm_response_chars: int = 0  # padding per extraction
+    fake_llm_seed: Optional[int] = None
+
+    # Ollama Configuration (LLM_BACKEND=ollama)
     ollama_base_url: Optional[str] = "http://localhost:11434"
     ollama_model: Optional[str] = "gpt-oss:20b"
+    ollama_parallel: int = 4  # in-flight requests, match OLLAMA_NUM_PARALLEL
+    ollama_keep_alive: int = 1800  # seconds the model stays loaded, -1 = forever
+    ollama_preload: bool = True  # load the model before the first extraction
+    ollama_timeout: float = 300.0  # seconds per generation
 
     # Extraction Settings
     extraction_batch_size: int = 10
@@ -38,9 +56,95 @@ class Settings(BaseSettings):
     extraction_timeout: int = 30  # seconds
     extraction_max_workers: int = 5  # for parallel processing
 
+    # Listing / Work Queue
+    listing_page_size: int = 1000  # keys per MinIO listing request
+    work_queue_size: int = 1000  # listed objects buffered ahead of workers
+    graph_recursion_limit: int = 1_000_000  # LangGraph supersteps per run
+    graph_checkpoint_path: Optional[str] = None  # e.g. cache/graph.sqlite3 to resume
+
+    # Parallel LangGraph Workflow
+    graph_max_concurrency: int = 0  # parallel branches, 0 = extraction_max_workers
+    graph_wave_size: int = 200  # objects fanned out per wave (join cost grows with it)
+
+    # Async Runner
+    async_max_in_flight: int = 1000  # objects processed concurrently
+    async_download_concurrency: int = 32
+    async_upload_concurrency: int = 32
+
     # Rate Limiting
     rate_limit_requests_per_minute: int = 20
     rate_limit_delay_between_requests: int = 3  # seconds
+    rate_limit_tokens_per_minute: int = 0  # estimated input tokens, 0 disables
+
+    # Adaptive Concurrency (AIMD on in-flight LLM calls and the request rate)
+    adaptive_concurrency_enabled: bool = False
+    adaptive_min_concurrency: int = 1
+    adaptive_max_concurrency: int = 0  # 0 = extraction_max_workers
+    adaptive_min_requests_per_minute: int = 2
+    adaptive_max_requests_per_minute: int = 60
+    adaptive_rate_step: int = 2  # requests/min added per increase
+    adaptive_decrease_factor: float = 0.5  # applied on 429s, overload, errors
+    adaptive_latency_tolerance: float = 2.0  # x baseline latency, 0 disables
+    adaptive_min_success_rate: float = 0.9  # over the last 20 calls
+
+    # Impressum Locator (trim pages to legal-notice sections before the LLM)
+    impressum_locator_enabled: bool = True
+    impressum_context_before: int = 200  # chars kept before each anchor
+    impressum_context_after: int = 800  # chars kept after each anchor
+    impressum_max_chars: int = 4000  # total budget, shorter pages are not trimmed
+
+    # Contact Fast Path (regex extraction of email/phone/fax/website)
+    contact_fast_path_enabled: bool = True
+    contact_fast_path_skip_llm_fields: str = ""  # e.g. "email,phone", "" never skips
+
+    # Multi-Document Batching (pack small pages into one LLM call)
+    extraction_batch_enabled: bool = False
+    extraction_batch_max_chars: int = 8000  # packed text budget per call
+    extraction_batch_max_docs: int = 8
+
+    # Extraction Cache
+    extraction_cache_enabled: bool = True
+    extraction_cache_path: str = "cache/extraction_cache.sqlite3"
+    extraction_cache_max_bytes: int = 256 * 1024 * 1024  # LRU eviction budget
+
+    # Run Journal (per-object progress, replays uploads after a crash)
+    run_journal_enabled: bool = False
+    run_journal_path: str = "cache/run_journal.sqlite3"
+
+    # Result Sink ("json" = one .about.json per page, "jsonl" = compressed shards)
+    result_sink: str = "json"
+    result_sink_prefix: str = "extracted/"  # shards and manifest/ below it
+    result_sink_compression: str = "zstd"  # or gzip (no extra dependency)
+    result_sink_shard_max_records: int = 10000
+    result_sink_shard_max_bytes: int = 64 * 1024 * 1024  # uncompressed
+
+    # Skip Index (existing results, built from one listing)
+    skip_index_path: Optional[str] = None  # e.g. cache/completed.txt to persist
+    skip_index_refresh: bool = False  # relist even if a snapshot exists
+
+    # Daemon Mode (run_batch_production.py --daemon)
+    daemon_sweep_interval: float = 600.0  # seconds between reconciliation listings
+    daemon_reconnect_delay: float = 1.0  # first retry of the notification stream
+    daemon_max_reconnect_delay: float = 60.0
+
+    # Work Leases (several runner nodes on one bucket)
+    lease_backend: str = "none"  # "minio" (marker objects) or "sqlite" (one host)
+    lease_prefix: str = "leases/"
+    lease_ttl: float = 120.0  # seconds, renewed every third of it while processing
+    lease_sqlite_path: str = "cache/leases.sqlite3"
+
+    # Incremental Mode (redo results whose source ETag or config changed)
+    incremental_enabled: bool = False
+    incremental_refresh_unversioned: bool = False  # redo results without provenance
+
+    # Metrics Endpoint (Prometheus text format on /metrics)
+    metrics_enabled: bool = False
+    metrics_host: str = "127.0.0.1"  # 0.0.0.0 to allow remote scrapes
+    metrics_port: int = 9108
+
+    # Span Tracing (Chrome trace format, open in ui.perfetto.dev)
+    trace_enabled: bool = False
+    trace_path: str = "logs/trace.json"
 
     # Logging
     log_level: str = "INFO"
@@ -0,0 +1,261 @@
+"""
+Adaptive (AIMD) control of in-flight LLM calls and the request rate.
+
+EXTRACTION_MAX_WORKERS and RATE_LIMIT_REQUESTS_PER_MINUTE are static
+guesses: too low leaves quota unused, too high turns into 429s and retry
+storms. The controller starts from them and adapts both at runtime, the way
+TCP congestion control does:
+
+- Additive increase: after a window of successful calls (as many as the
+  current limit) at normal latency, one more call may be in flight and the
+  request rate rises by a fixed step.
+- Multiplicative decrease: a 429, a smoothed latency far above the baseline
+  (the lowest recent smoothed latency), or a success rate below the floor
+  cuts the limit and the rate by a factor. This happens at most once per cooldown, so one burst of rejections
+  counts as one signal.
+
+Both stay within the bounds from settings, and every change is recorded in
+the run statistics as the concurrency trajectory.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from src.config.settings import settings
+from src.modules.llm_backends import is_rate_limit_error
+from src.modules.logger import logger
+from src.modules.retry_handler import RateLimiter
+from src.modules.statistics import ExtractionStatistics
+
+# Weight of the newest sample in the smoothed latency
+LATENCY_SMOOTHING = 0.2
+
+# Weight of the smoothed latency in the baseline when it is above it; lets
+# the baseline forget one lucky fast window
+BASELINE_DECAY = 0.02
+
+
+class AdaptiveConcurrency:
+    """
+    Thread-safe AIMD limiter for LLM calls.
+
+    Callers wrap each model call in acquire() and release(); acquire()
+    blocks while the current limit of calls is in flight.
+    """
+
+    def __init__(
+        self,
+        min_limit: int = 1,
+        max_limit: int = 10,
+        initial_limit: Optional[int] = None,
+        min_requests_per_minute: int = 2,
+        max_requests_per_minute: int = 60,
+        initial_requests_per_minute: Optional[int] = None,
+        rate_step: int = 2,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        min_success_rate: float = 0.9,
+        window: int = 20,
+        cooldown: Optional[float] = None,
+        limiter: Optional[RateLimiter] = None,
+        stats: Optional[ExtractionStatistics] = None,
+    ):
+        """
+        Initialize the controller.
+
+        Args:
+            min_limit: Fewest calls allowed in flight
+            max_limit: Most calls allowed in flight
+            initial_limit: Starting limit (default max_limit)
+            min_requests_per_minute: Lowest request rate
+            max_requests_per_minute: Highest request rate
+            initial_requests_per_minute: Starting rate (default the limiter's)
+            rate_step: Requests per minute added per increase
+            decrease_factor: Multiplier applied to limit and rate on a decrease
+            latency_tolerance: Smoothed latency above this multiple of the
+                baseline latency counts as overload (0 disables)
+            min_success_rate: Success rate over the window below which the
+                controller backs off
+            window: Calls the success rate is computed over
+            cooldown: Seconds between decreases (default the smoothed
+                latency, at least one second)
+            limiter: Rate limiter whose request rate is adjusted (None leaves
+                the rate alone, e.g. for local models)
+            stats: Statistics tracker receiving the trajectory
+        """
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError(f"Invalid concurrency bounds {min_limit}..{max_limit}")
+        if not 0 < decrease_factor < 1:
+            raise ValueError(
+                f"decrease_factor must be in (0, 1), got {decrease_factor}"
+            )
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.min_requests_per_minute = min_requests_per_minute
+        self.max_requests_per_minute = max_requests_per_minute
+        self.rate_step = rate_step
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.min_success_rate = min_success_rate
+        self.cooldown = cooldown
+        self.limiter = limiter
+        self.stats = stats
+
+        self.limit = min(max(initial_limit or max_limit, min_limit), max_limit)
+        if initial_requests_per_minute is None and limiter is not None:
+            initial_requests_per_minute = limiter.requests_per_minute
+        self.requests_per_minute = min(
+            max(
+                initial_requests_per_minute or max_requests_per_minute,
+                min_requests_per_minute,
+            ),
+            max_requests_per_minute,
+        )
+
+        self._cond = threading.Condition()
+        self.in_flight = 0
+        self.latency: Optional[float] = None
+        self.best_latency: Optional[float] = None
+        self._outcomes: deque = deque(maxlen=window)
+        self._successes = 0
+        self._last_decrease = float("-inf")
+        self.increases = 0
+        self.decreases = 0
+
+        with self._cond:
+            self._changed("start")
+
+    def acquire(self):
+        """Block until another call may be in flight."""
+        with self._cond:
+            while self.in_flight >= self.limit:
+                self._cond.wait()
+            self.in_flight += 1
+
+    def release(self, latency: float, error: Optional[BaseException] = None):
+        """
+        Finish a call and adapt to its outcome.
+
+        Args:
+            latency: Seconds the call took
+            error: Exception the call raised, None on success
+        """
+        with self._cond:
+            self.in_flight -= 1
+            if error is None:
+                self._on_success(latency)
+            elif is_rate_limit_error(error):
+                self._outcomes.append(False)
+                self._decrease("rate_limited")
+            else:
+                self._outcomes.append(False)
+                self._check_success_rate()
+            self._cond.notify_all()
+
+    def _on_success(self, latency: float):
+        """Update the latency estimate and grow after a full good window."""
+        self._outcomes.append(True)
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency += LATENCY_SMOOTHING * (latency - self.latency)
+        if self.best_latency is None or self.latency < self.best_latency:
+            self.best_latency = self.latency
+        else:
+            self.best_latency += BASELINE_DECAY * (self.latency - self.best_latency)
+
+        overloaded = bool(
+            self.latency_tolerance
+            and self.latency > self.best_latency * self.latency_tolerance
+        )
+        if overloaded:
+            # Resets the success count unless still cooling down
+            self._decrease("latency")
+
+        self._successes += 1
+        if self._successes >= self.limit and not overloaded:
+            self._successes = 0
+            self._increase()
+
+    def _check_success_rate(self):
+        """Back off once too many calls of a full window failed."""
+        if len(self._outcomes) < self._outcomes.maxlen:
+            return
+        if sum(self._outcomes) / len(self._outcomes) < self.min_success_rate:
+            self._decrease("errors")
+
+    def _increase(self):
+        limit = min(self.limit + 1, self.max_limit)
+        rate = self.requests_per_minute
+        if self.limiter is not None:
+            rate = min(rate + self.rate_step, self.max_requests_per_minute)
+        if (limit, rate) != (self.limit, self.requests_per_minute):
+            self.limit, self.requests_per_minute = limit, rate
+            self.increases += 1
+            self._changed("increase")
+
+    def _decrease(self, reason: str):
+        now = time.monotonic()
+        cooldown = (
+            self.cooldown if self.cooldown is not None else max(self.latency or 0, 1.0)
+        )
+        if now - self._last_decrease < cooldown:
+            return
+
+        self._last_decrease = now
+        self._successes = 0
+        self._outcomes.clear()
+        self.limit = max(int(self.limit * self.decrease_factor), self.min_limit)
+        if self.limiter is not None:
+            self.requests_per_minute = max(
+                int(self.requests_per_minute * self.decrease_factor),
+                self.min_requests_per_minute,
+            )
+        self.decreases += 1
+        logger.info(
+            f"🚦 Backing off ({reason}): {self.limit} LLM calls in flight, "
+            f"{self.requests_per_minute} requests/min"
+        )
+        self._changed(reason)
+
+    def _changed(self, reason: str):
+        """Apply the new rate and record the step (caller holds the lock)."""
+        if self.limiter is not None:
+            self.limiter.set_requests_per_minute(self.requests_per_minute)
+        if self.stats is not None:
+            self.stats.record_concurrency(self.limit, self.requests_per_minute, reason)
+
+
+def adaptive_concurrency_from_settings(
+    limiter: Optional[RateLimiter] = None,
+    stats: Optional[ExtractionStatistics] = None,
+) -> Optional[AdaptiveConcurrency]:
+    """
+    Create the controller configured in settings.
+
+    Args:
+        limiter: Rate limiter to adjust (None for backends without a quota)
+        stats: Statistics tracker receiving the trajectory
+
+    Returns:
+        AdaptiveConcurrency, or None if ADAPTIVE_CONCURRENCY_ENABLED is off
+    """
+    if not settings.adaptive_concurrency_enabled:
+        return None
+
+    return AdaptiveConcurrency(
+        min_limit=settings.adaptive_min_concurrency,
+        max_limit=settings.adaptive_max_concurrency or settings.extraction_max_workers,
+        initial_limit=settings.extraction_max_workers,
+        min_requests_per_minute=settings.adaptive_min_requests_per_minute,
+        max_requests_per_minute=settings.adaptive_max_requests_per_minute,
+        rate_step=settings.adaptive_rate_step,
+        decrease_factor=settings.adaptive_decrease_factor,
+        latency_tolerance=settings.adaptive_latency_tolerance,
+        min_success_rate=settings.adaptive_min_success_rate,
+        limiter=limiter,
+        stats=stats,
+    )
@@ -0,0 +1,60 @@
+"""
+Asyncio adapter for MinIOManager.
+
+The MinIO SDK is blocking, so each call is offloaded to a bounded thread
+pool. Callers limit concurrency with their own semaphores; the pool only
+needs as many threads as there can be concurrent blocking calls.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from src.modules.minio_manager import MinIOManager
+
+
+class AsyncMinIOManager:
+    """
+    Awaitable wrappers around MinIOManager operations.
+    """
+
+    def __init__(self, minio_mgr: MinIOManager, executor: ThreadPoolExecutor):
+        """
+        Initialize the adapter.
+
+        Args:
+            minio_mgr: Underlying blocking MinIOManager
+            executor: Thread pool used for blocking SDK calls
+        """
+        self.minio = minio_mgr
+        self.executor = executor
+
+    async def _run(self, func: Callable, *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    async def list_objects(
+        self, prefix: str = "", recursive: bool = True, limit: Optional[int] = None
+    ) -> List[Dict[str, str]]:
+        """List objects in bucket (see MinIOManager.list_objects)."""
+        return await self._run(self.minio.list_objects, prefix, recursive, limit)
+
+    async def download_object(
+        self, object_name: str, as_text: bool = True
+    ) -> Optional[Union[str, bytes]]:
+        """Download an object (see MinIOManager.download_object)."""
+        return await self._run(self.minio.download_object, object_name, as_text)
+
+    async def upload_json(
+        self, object_name: str, data: dict, metadata: Optional[Dict[str, str]] = None
+    ) -> bool:
+        """Upload JSON data (see MinIOManager.upload_json)."""
+        if metadata:
+            upload = functools.partial(self.minio.upload_json, metadata=metadata)
+            return await self._run(upload, object_name, data)
+        return await self._run(self.minio.upload_json, object_name, data)
+
+    async def object_exists(self, object_name: str) -> bool:
+        """Check if an object exists (see MinIOManager.object_exists)."""
+        return await self._run(self.minio.object_exists, object_name)
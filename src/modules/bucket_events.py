@@ -0,0 +1,237 @@
+"""
+Feed of new objects for the long-running daemon mode.
+
+A restarted batch run relists the whole prefix to find a handful of new
+pages. The daemon instead subscribes to MinIO bucket notifications
+(ListenBucketNotification, a long-lived streaming GET) and hands every
+created object to the workers as soon as its event arrives.
+
+Notifications are best effort: events emitted while the stream reconnects
+(or while the daemon is down) are lost. A reconciliation sweep therefore
+lists the prefix once at startup and then every DAEMON_SWEEP_INTERVAL
+seconds. Sweeps and events yield the same entries as iter_objects(), so
+the caller can filter both against the skip index without extra requests.
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator
+from urllib.parse import unquote_plus
+
+from src.config.settings import settings
+from src.modules.logger import logger
+from src.modules.minio_manager import MinIOManager
+
+CREATED_EVENTS = ("s3:ObjectCreated:*",)
+
+# Seconds the first sweep waits for the notification stream to open
+STREAM_OPEN_TIMEOUT = 10.0
+
+
+def parse_event_records(event: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Turn a bucket notification into listing entries.
+
+    Args:
+        event: Notification as yielded by listen_bucket_notification()
+
+    Yields:
+        {"object_name", "size", "last_modified", "etag"} per created object
+        (keys are URL-decoded like in a listing)
+    """
+    for record in event.get("Records") or ():
+        if not record.get("eventName", "").startswith("s3:ObjectCreated:"):
+            continue
+        obj = record.get("s3", {}).get("object", {})
+        if not obj.get("key"):
+            continue
+
+        event_time = record.get("eventTime")
+        yield {
+            "object_name": unquote_plus(obj["key"]),
+            "size": obj.get("size"),
+            "last_modified": (
+                datetime.fromisoformat(event_time.replace("Z", "+00:00"))
+                if event_time
+                else None
+            ),
+            "etag": obj.get("eTag"),
+        }
+
+
+class BucketEventFeed:
+    """
+    Submits created objects from notifications and reconciliation sweeps.
+
+    run() blocks until the stop event is set; the notification stream is
+    consumed on a background thread and reconnects with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        minio_mgr: MinIOManager,
+        submit: Callable[[Dict[str, Any]], Any],
+        prefix: str = "scraped-content/",
+        suffix: str = ".md",
+        sweep_interval: float = 600.0,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 60.0,
+    ):
+        """
+        Initialize the feed.
+
+        Args:
+            minio_mgr: MinIOManager used for notifications and sweeps
+            submit: Called with the listing entry of every new object
+                (from both sources, so it must tolerate duplicates)
+            prefix: Prefix of the watched objects
+            suffix: Suffix of the watched objects
+            sweep_interval: Seconds between reconciliation sweeps (0 sweeps
+                only at startup)
+            reconnect_delay: First delay before reopening a failed stream
+            max_reconnect_delay: Upper bound of the reconnect delay
+        """
+        self.minio_mgr = minio_mgr
+        self.submit = submit
+        self.prefix = prefix
+        self.suffix = suffix
+        self.sweep_interval = sweep_interval
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+
+        self.events_received = 0
+        self.objects_swept = 0
+        self.sweeps = 0
+        self.reconnects = 0
+        self._events = None  # Open notification stream (closed on stop)
+        self._lock = threading.Lock()
+        self._listening = threading.Event()  # Set once a stream is open
+
+    def run(self, stop: threading.Event):
+        """
+        Listen and sweep until `stop` is set.
+
+        The first sweep waits (up to STREAM_OPEN_TIMEOUT) until the stream
+        is open, so objects created during the sweep are not missed.
+
+        Args:
+            stop: Event that ends the feed
+        """
+        listener = threading.Thread(
+            target=self._listen, args=(stop,), name="bucket-events", daemon=True
+        )
+        listener.start()
+        if not self._listening.wait(STREAM_OPEN_TIMEOUT) and not stop.is_set():
+            logger.warning(
+                "⚠️  Notification stream not open yet, sweeping anyway; "
+                "objects created meanwhile wait for the next sweep"
+            )
+
+        while not stop.is_set():
+            try:
+                self.sweep()
+            except Exception as e:
+                logger.error(f"❌ Reconciliation sweep failed: {e}", exc_info=True)
+            if not self.sweep_interval:
+                stop.wait()
+            else:
+                stop.wait(self.sweep_interval)
+
+        self._close_stream()
+        listener.join(timeout=5)
+
+    def sweep(self) -> int:
+        """
+        List the prefix once and submit every object.
+
+        Returns:
+            Number of listed objects
+        """
+        start = time.time()
+        count = 0
+        for obj in self.minio_mgr.iter_objects(
+            prefix=self.prefix,
+            suffix=self.suffix,
+            page_size=settings.listing_page_size,
+        ):
+            self.submit(obj)
+            count += 1
+
+        self.sweeps += 1
+        self.objects_swept += count
+        logger.info(
+            f"🧹 Reconciliation sweep listed {count} objects in {time.time() - start:.1f}s"
+        )
+        return count
+
+    def _listen(self, stop: threading.Event):
+        """Consume the notification stream, reopening it after failures."""
+        delay = self.reconnect_delay
+        while not stop.is_set():
+            try:
+                events = self.minio_mgr.listen_notifications(
+                    prefix=self.prefix, suffix=self.suffix, events=CREATED_EVENTS
+                )
+                with self._lock:
+                    self._events = events
+                self._listening.set()
+                if stop.is_set():
+                    break
+                logger.info(f"👂 Listening for new objects under '{self.prefix}'")
+                for event in events:
+                    delay = self.reconnect_delay  # Stream is healthy again
+                    for obj in parse_event_records(event):
+                        self.events_received += 1
+                        self.submit(obj)
+                    if stop.is_set():
+                        break
+            except Exception as e:
+                if stop.is_set():
+                    break
+                self.reconnects += 1
+                logger.warning(
+                    f"⚠️  Notification stream failed ({e}), reconnecting in {delay:.0f}s"
+                )
+                stop.wait(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
+            finally:
+                self._close_stream()
+
+    def _close_stream(self):
+        """Close the open notification stream, unblocking the listener."""
+        with self._lock:
+            events, self._events = self._events, None
+        if events is not None:
+            try:
+                events.__exit__(None, None, None)
+            except Exception as e:
+                # Closing a stream that is being read may race; it ends anyway
+                logger.debug(f"Closing the notification stream failed: {e}")
+
+
+def bucket_event_feed_from_settings(
+    minio_mgr: MinIOManager,
+    submit: Callable[[Dict[str, Any]], Any],
+    prefix: str = "scraped-content/",
+) -> BucketEventFeed:
+    """
+    Create the event feed configured in settings.
+
+    Args:
+        minio_mgr: MinIOManager used for notifications and sweeps
+        submit: Called with the listing entry of every new object
+        prefix: Prefix of the watched markdown objects
+
+    Returns:
+        BucketEventFeed
+    """
+    return BucketEventFeed(
+        minio_mgr,
+        submit,
+        prefix=prefix,
+        suffix=".md",
+        sweep_interval=settings.daemon_sweep_interval,
+        reconnect_delay=settings.daemon_reconnect_delay,
+        max_reconnect_delay=settings.daemon_max_reconnect_delay,
+    )
@@ -0,0 +1,119 @@
+"""
+Deterministic extraction of contact fields from German Impressum text.
+
+Email, phone, fax and website follow a handful of regular label formats
+("E-Mail:", "Tel.:", "Telefax:", "Internet:"), so they can be resolved
+locally with compiled patterns. Only the semantic fields then need an LLM.
+"""
+
+import re
+from typing import Dict, List, Optional, Set
+
+CONTACT_FIELDS = ("email", "phone", "fax", "website")
+
+# Local parts treated as generic mailboxes (personal addresses are preferred)
+GENERIC_EMAIL_PREFIXES = {
+    "info",
+    "kontakt",
+    "contact",
+    "office",
+    "mail",
+    "post",
+    "service",
+    "hallo",
+    "hello",
+    "team",
+    "anfrage",
+    "empfang",
+    "webmaster",
+    "noreply",
+    "no-reply",
+    "datenschutz",
+    "privacy",
+}
+
+EMAIL_PATTERN = re.compile(
+    r"(?<![\w.+-])([A-Za-z0-9._%+-]+)\s*(?:@|\(at\)|\[at\])\s*"
+    r"([A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,})(?![\w-])",
+    re.IGNORECASE,
+)
+
+_NUMBER = r"(\+?\(?\d[\d \t()/.\-]{4,}\d)"
+PHONE_PATTERN = re.compile(
+    r"\b(?:Telefon|Tel|Fon|Phone|Mobil|Mobile|Handy)\b\.?\*{0,2}\s*:?\*{0,2}\s*"
+    + _NUMBER,
+    re.IGNORECASE,
+)
+FAX_PATTERN = re.compile(
+    r"\b(?:Telefax|Fax)\b\.?\*{0,2}\s*:?\*{0,2}\s*" + _NUMBER, re.IGNORECASE
+)
+
+_URL = (
+    r"((?:https?://)?(?:www\.)?[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,}"
+    r"(?:/[^\s)\]>]*)?)"
+)
+# Only labeled URLs count: an Impressum also links the mandatory EU ODR
+# platform, social profiles and hosters, so unlabeled URLs are left to the LLM
+LABELED_WEBSITE_PATTERN = re.compile(
+    r"\b(?:Internet|Website|Webseite|Homepage|Web)\b\*{0,2}\s*:\*{0,2}\s*" + _URL,
+    re.IGNORECASE,
+)
+
+
+def _choose_email(candidates: List[str]) -> str:
+    """Prefer personal over generic addresses, keeping document order."""
+    for email in candidates:
+        if email.split("@")[0].lower() not in GENERIC_EMAIL_PREFIXES:
+            return email
+    return candidates[0] if candidates else ""
+
+
+def _clean_number(number: str) -> str:
+    """Strip trailing punctuation and collapse inner whitespace."""
+    return " ".join(number.strip(" .-/").split())
+
+
+def extract_contact_fields(text: str) -> Dict[str, str]:
+    """
+    Extract email, phone, fax and website with compiled patterns.
+
+    The website is only taken from a labeled line ("Internet:", "Web:", ...).
+
+    Args:
+        text: Markdown content
+
+    Returns:
+        Dictionary with every CONTACT_FIELDS key ("" when not found)
+    """
+    emails = []
+    for local, domain in EMAIL_PATTERN.findall(text):
+        email = f"{local}@{domain}"
+        if email not in emails:
+            emails.append(email)
+
+    phone = PHONE_PATTERN.search(text)
+    fax = FAX_PATTERN.search(text)
+
+    website = LABELED_WEBSITE_PATTERN.search(text)
+
+    return {
+        "email": _choose_email(emails),
+        "phone": _clean_number(phone.group(1)) if phone else "",
+        "fax": _clean_number(fax.group(1)) if fax else "",
+        "website": website.group(1).rstrip(".,;") if website else "",
+    }
+
+
+def parse_field_list(value: Optional[str]) -> Set[str]:
+    """
+    Parse a comma-separated field list from settings.
+
+    Args:
+        value: e.g. "email,phone,website"
+
+    Returns:
+        Set of field names
+    """
+    if not value:
+        return set()
+    return {field.strip() for field in value.split(",") if field.strip()}
@@ -0,0 +1,139 @@
+"""
+Pack several small documents into one LLM extraction call.
+
+Each request is charged against the requests-per-minute quota regardless of
+its size, so short Impressum pages are concatenated (up to a character
+budget) behind numbered headers and sent together. Extractions are mapped
+back to their document through the character interval LangExtract aligns
+them to; anything that cannot be attributed unambiguously is reported so
+the caller can retry those documents one by one.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Sequence, Set, Tuple
+
+DOCUMENT_HEADER = "=== DOKUMENT {number} ===\n"
+DOCUMENT_GAP = "\n\n"
+
+
+@dataclass
+class PackedBatch:
+    """
+    Several documents concatenated into one extraction text.
+
+    Attributes:
+        text: Concatenated text with a header before every document
+        sources: Source identifiers, in packing order
+        spans: (start, end) of each document's own text inside `text`
+    """
+
+    text: str = ""
+    sources: List[str] = field(default_factory=list)
+    spans: List[Tuple[int, int]] = field(default_factory=list)
+
+    def add(self, source: str, document: str):
+        """Append a document behind its numbered header."""
+        if self.sources:
+            self.text += DOCUMENT_GAP
+        self.text += DOCUMENT_HEADER.format(number=len(self.sources) + 1)
+        start = len(self.text)
+        self.text += document
+        self.sources.append(source)
+        self.spans.append((start, len(self.text)))
+
+    def __len__(self) -> int:
+        return len(self.sources)
+
+
+def pack_documents(
+    documents: Sequence[Tuple[str, str]], max_chars: int, max_docs: int
+) -> List[PackedBatch]:
+    """
+    Greedily pack documents into batches in their original order.
+
+    A document that alone exceeds the budget becomes a batch of one.
+
+    Args:
+        documents: (source, text) pairs
+        max_chars: Character budget per batch (headers included)
+        max_docs: Maximum documents per batch
+
+    Returns:
+        List of packed batches
+    """
+    batches: List[PackedBatch] = []
+    current = PackedBatch()
+
+    for source, text in documents:
+        overhead = len(DOCUMENT_HEADER.format(number=len(current) + 1))
+        if current.sources:
+            overhead += len(DOCUMENT_GAP)
+
+        fits = len(current.text) + overhead + len(text) <= max_chars
+        if current.sources and (not fits or len(current) >= max_docs):
+            batches.append(current)
+            current = PackedBatch()
+
+        current.add(source, text)
+
+    if current.sources:
+        batches.append(current)
+    return batches
+
+
+def attribute_extractions(
+    batch: PackedBatch, extractions: Sequence[Any], extraction_class: str
+) -> Tuple[Dict[str, Any], Set[str]]:
+    """
+    Map extractions back to the documents their text was aligned to.
+
+    A document is ambiguous when more than one extraction lands in it, when
+    an extraction crosses a document boundary, or when it received nothing
+    while some extraction in the batch could not be aligned at all.
+    Documents that received nothing in a fully aligned batch simply have no
+    data.
+
+    Args:
+        batch: The packed batch that was sent
+        extractions: Extractions returned for batch.text
+        extraction_class: Only extractions of this class are attributed
+
+    Returns:
+        Tuple of ({source: extraction}, ambiguous sources)
+    """
+    assigned: Dict[str, List[Any]] = {source: [] for source in batch.sources}
+    ambiguous: Set[str] = set()
+    unaligned = False
+
+    for ext in extractions:
+        if ext.extraction_class != extraction_class:
+            continue
+
+        interval = getattr(ext, "char_interval", None)
+        if interval is None or interval.start_pos is None or interval.end_pos is None:
+            unaligned = True
+            continue
+
+        touched = [
+            source
+            for source, (start, end) in zip(batch.sources, batch.spans)
+            if interval.start_pos < end and interval.end_pos > start
+        ]
+        if len(touched) == 1:
+            assigned[touched[0]].append(ext)
+        elif touched:
+            ambiguous.update(touched)
+        else:
+            # Aligned to a header or gap only
+            unaligned = True
+
+    resolved: Dict[str, Any] = {}
+    for source, found in assigned.items():
+        if source in ambiguous:
+            continue
+        if len(found) == 1:
+            resolved[source] = found[0]
+        elif found or unaligned:
+            ambiguous.add(source)
+
+    return resolved, ambiguous
@@ -0,0 +1,226 @@
+"""
+Persistent content-addressed cache for LLM extraction results.
+
+Results are keyed by a hash of the normalized markdown together with a
+fingerprint of the extraction configuration (prompt, examples, model id),
+so re-scraped pages that differ only in whitespace never pay for a second
+LLM call, while any change to the prompt or model invalidates old entries.
+"""
+
+import dataclasses
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional, Sequence, Tuple
+
+from src.config.settings import settings
+from src.modules.logger import logger
+
+
+def normalize_markdown(text: str) -> str:
+    """
+    Collapse all whitespace runs so formatting-only changes hash identically.
+
+    Args:
+        text: Raw markdown content
+
+    Returns:
+        Normalized text
+    """
+    return " ".join(text.split())
+
+
+def config_fingerprint(prompt: str, examples: Sequence[Any], model_id: str) -> str:
+    """
+    Hash the extraction configuration that influences LLM output.
+
+    Args:
+        prompt: Prompt description sent to the model
+        examples: Few-shot examples (dataclasses or plain objects)
+        model_id: LLM model identifier
+
+    Returns:
+        Hex digest identifying the configuration
+    """
+    serialized_examples = [
+        dataclasses.asdict(ex) if dataclasses.is_dataclass(ex) else repr(ex)
+        for ex in examples
+    ]
+    payload = json.dumps(
+        {"prompt": prompt, "examples": serialized_examples, "model_id": model_id},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def cache_key(text: str, fingerprint: str) -> str:
+    """
+    Build the content-addressed key for a markdown document.
+
+    Args:
+        text: Markdown content
+        fingerprint: Result of config_fingerprint()
+
+    Returns:
+        Hex digest used as cache key
+    """
+    digest = hashlib.sha256()
+    digest.update(fingerprint.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(normalize_markdown(text).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """
+    SQLite-backed extraction cache with size-based LRU eviction.
+
+    Each entry stores the serialized result and the LLM time it cost, so a
+    hit can report how much latency was saved. The connection is shared
+    between worker threads and guarded by a lock.
+    """
+
+    def __init__(self, path: str, max_bytes: int):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite file location
+            max_bytes: Maximum total payload size before LRU eviction
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                llm_seconds REAL NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_entries_last_access "
+            "ON entries (last_access)"
+        )
+        self._conn.commit()
+
+        row = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+        self._total_bytes = row[0]
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        """
+        Look up an entry and mark it as recently used.
+
+        Args:
+            key: Cache key from cache_key()
+
+        Returns:
+            Tuple of (serialized value, original LLM seconds) or None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, llm_seconds FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            self._conn.execute(
+                "UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+            return row[0], row[1]
+
+    def put(self, key: str, value: str, llm_seconds: float = 0.0):
+        """
+        Store an entry, evicting least recently used entries if over budget.
+
+        Args:
+            key: Cache key from cache_key()
+            value: Serialized extraction result
+            llm_seconds: Time the LLM call took to produce the value
+        """
+        size = len(value.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT size FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                self._total_bytes -= row[0]
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries "
+                "(key, value, size, llm_seconds, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, value, size, llm_seconds, now, now),
+            )
+            self._total_bytes += size
+
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+            self._conn.commit()
+
+    def _evict(self):
+        """Delete least recently used entries until the size budget holds."""
+        rows = self._conn.execute(
+            "SELECT key, size FROM entries ORDER BY last_access ASC"
+        )
+        to_delete = []
+        for key, size in rows:
+            if self._total_bytes <= self.max_bytes:
+                break
+            to_delete.append((key,))
+            self._total_bytes -= size
+
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", to_delete)
+        logger.debug(f"Evicted {len(to_delete)} extraction cache entries")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    @property
+    def total_bytes(self) -> int:
+        """Current total payload size in bytes."""
+        return self._total_bytes
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def extraction_cache_from_settings() -> Optional[ExtractionCache]:
+    """
+    Create the cache configured in settings.
+
+    Returns:
+        ExtractionCache instance, or None if caching is disabled
+    """
+    if not settings.extraction_cache_enabled:
+        return None
+
+    return ExtractionCache(
+        settings.extraction_cache_path, settings.extraction_cache_max_bytes
+    )
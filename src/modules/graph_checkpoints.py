@@ -0,0 +1,78 @@
+"""
+SQLite checkpoints for the LangGraph workflows.
+
+Every superstep of a graph compiled with a checkpointer is saved under the
+run's thread id, so an interrupted run continues from its last completed
+node instead of starting over. Needs the optional langgraph-checkpoint-sqlite
+package (pip install -e ".[checkpoint]").
+"""
+
+import sqlite3
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+def open_checkpointer(path: str):
+    """
+    Open (or create) a SQLite checkpoint store.
+
+    Args:
+        path: Local SQLite file
+
+    Returns:
+        SqliteSaver bound to the file
+    """
+    try:
+        from langgraph.checkpoint.sqlite import SqliteSaver
+    except ImportError as e:
+        raise RuntimeError(
+            "Graph checkpoints need langgraph-checkpoint-sqlite "
+            '(pip install -e ".[checkpoint]")'
+        ) from e
+
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, check_same_thread=False)
+    return SqliteSaver(conn)
+
+
+def new_thread_id() -> str:
+    """
+    Create a thread id for a new run.
+
+    Returns:
+        Id like "run-20250101-120000-1a2b3c"
+    """
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    return f"run-{stamp}-{uuid.uuid4().hex[:6]}"
+
+
+def thread_config(thread_id: str, **config: Any) -> Dict[str, Any]:
+    """
+    Build the invoke config for a thread.
+
+    Args:
+        thread_id: Run thread id
+        **config: Extra config entries (e.g. recursion_limit)
+
+    Returns:
+        RunnableConfig dictionary
+    """
+    return {"configurable": {"thread_id": thread_id}, **config}
+
+
+def latest_thread_id(checkpointer) -> Optional[str]:
+    """
+    Find the thread with the most recent checkpoint.
+
+    Args:
+        checkpointer: Checkpoint store
+
+    Returns:
+        Thread id, or None if the store is empty
+    """
+    # Checkpoint ids are time-ordered, and list() returns the newest first
+    for checkpoint in checkpointer.list(None, limit=1):
+        return checkpoint.config["configurable"]["thread_id"]
+    return None
@@ -0,0 +1,29 @@
+"""
+State reducers shared by the LangGraph workflows.
+
+LangGraph applies a channel's reducer whenever several nodes (or parallel
+branches) write the same key in one superstep, so counters can be updated
+with small deltas instead of copying a mutable dict through every node.
+"""
+
+from typing import Dict, Optional
+
+
+def merge_stats(
+    left: Optional[Dict[str, int]], right: Optional[Dict[str, int]]
+) -> Dict[str, int]:
+    """
+    Add two counter dictionaries key by key.
+
+    Args:
+        left: Current counters
+        right: Counter deltas written by a node
+
+    Returns:
+        Merged counters
+    """
+    left = left or {}
+    right = right or {}
+    return {
+        key: left.get(key, 0) + right.get(key, 0) for key in left.keys() | right.keys()
+    }
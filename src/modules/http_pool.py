@@ -0,0 +1,178 @@
+"""
+Process-wide HTTP connection pool for MinIO clients.
+
+The MinIO SDK gives every client its own urllib3 pool of 10 connections,
+fewer than a large worker count needs; extra requests then open and drop
+connections instead of reusing them. All MinIO clients of the process share
+one pool instead, sized from the configured concurrency, with keep-alive and
+explicit connect/read timeouts.
+
+The pool blocks when all connections are checked out, so the connection
+count stays bounded, and it counts checkouts, waits and wait time so a
+pool that throttles the workers shows up in the metrics.
+"""
+
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+import certifi
+import urllib3
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from src.config.settings import settings
+
+
+class PoolStats:
+    """
+    Thread-safe counters of connection checkouts.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.size = 0
+        self.in_use = 0
+        self.max_in_use = 0
+        self.checkouts = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+
+    def record_checkout(self, waited: bool, seconds: float):
+        """
+        Count a connection taken from the pool.
+
+        Args:
+            waited: Whether every connection was in use at the time
+            seconds: Time spent waiting for the connection
+        """
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self.max_in_use = max(self.max_in_use, self.in_use)
+            if waited:
+                self.waits += 1
+                self.wait_seconds += seconds
+
+    def record_return(self):
+        """Count a connection given back to the pool."""
+        with self._lock:
+            self.in_use -= 1
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        Copy the current counters.
+
+        Returns:
+            {"size", "in_use", "max_in_use", "checkouts", "waits", "wait_seconds"}
+        """
+        with self._lock:
+            return {
+                "size": self.size,
+                "in_use": self.in_use,
+                "max_in_use": self.max_in_use,
+                "checkouts": self.checkouts,
+                "waits": self.waits,
+                "wait_seconds": self.wait_seconds,
+            }
+
+
+# Counters of the shared pool, read by the metrics endpoint
+pool_stats = PoolStats()
+
+
+class _InstrumentedPoolMixin:
+    """Count checkouts and waits of a urllib3 connection pool."""
+
+    def _get_conn(self, timeout: Optional[float] = None):
+        waited = self.pool is not None and self.pool.empty()
+        start = time.perf_counter()
+        conn = super()._get_conn(timeout)
+        pool_stats.record_checkout(waited, time.perf_counter() - start)
+        return conn
+
+    def _put_conn(self, conn):
+        pool_stats.record_return()
+        super()._put_conn(conn)
+
+
+class InstrumentedHTTPConnectionPool(_InstrumentedPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class InstrumentedHTTPSConnectionPool(_InstrumentedPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+def pool_size_from_settings() -> int:
+    """
+    Size the pool for the most concurrent runner.
+
+    Returns:
+        MINIO_POOL_SIZE, or enough connections for every worker (thread pool)
+        or every download and upload slot (async runner) plus the listing
+    """
+    if settings.minio_pool_size > 0:
+        return settings.minio_pool_size
+    return (
+        max(
+            settings.extraction_max_workers,
+            settings.async_download_concurrency + settings.async_upload_concurrency,
+        )
+        + 2
+    )
+
+
+def build_pool_manager(
+    size: int, connect_timeout: float, read_timeout: float
+) -> urllib3.PoolManager:
+    """
+    Create an instrumented, blocking pool manager.
+
+    Args:
+        size: Connections kept per host
+        connect_timeout: Seconds to establish a connection
+        read_timeout: Seconds to wait for response data
+
+    Returns:
+        PoolManager usable as a Minio http_client
+    """
+    # Same certificate and retry behaviour as the MinIO SDK's default client
+    manager = urllib3.PoolManager(
+        num_pools=4,
+        maxsize=size,
+        block=True,
+        timeout=urllib3.Timeout(connect=connect_timeout, read=read_timeout),
+        cert_reqs="CERT_REQUIRED",
+        ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+        retries=urllib3.Retry(
+            total=5, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]
+        ),
+    )
+    manager.pool_classes_by_scheme = {
+        "http": InstrumentedHTTPConnectionPool,
+        "https": InstrumentedHTTPSConnectionPool,
+    }
+    return manager
+
+
+_shared_manager: Optional[urllib3.PoolManager] = None
+_shared_lock = threading.Lock()
+
+
+def shared_pool_manager() -> urllib3.PoolManager:
+    """
+    Get the process-wide pool manager, creating it on first use.
+
+    Returns:
+        Shared PoolManager
+    """
+    global _shared_manager
+    with _shared_lock:
+        if _shared_manager is None:
+            size = pool_size_from_settings()
+            _shared_manager = build_pool_manager(
+                size, settings.minio_connect_timeout, settings.minio_read_timeout
+            )
+            pool_stats.size = size
+        return _shared_manager
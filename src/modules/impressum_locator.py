@@ -0,0 +1,152 @@
+"""
+Locate the legal-notice section of a scraped page before extraction.
+
+Scraped markdown usually contains navigation, cookie banners and long
+service lists around the few lines the extractor actually needs. This
+module keeps only the text windows around German Impressum anchors
+(e.g. "Angaben gemäß § 5 TMG", "Geschäftsführer", contact lines) so the
+LLM receives fewer input tokens.
+"""
+
+import re
+from typing import List, Optional, Tuple
+
+from src.config.settings import settings
+
+# (pattern, weight) - higher weight windows are kept first when over budget
+_ANCHORS = [
+    (r"angaben\s+gem(?:ä|ae)(?:ß|ss)\s*§\s*5", 3),
+    (r"§\s*5\s*(?:tmg|ddg)", 3),
+    (r"\bimpressum\b", 3),
+    (r"gesch(?:ä|ae)ftsf(?:ü|ue)hr(?:er|erin|ung)\b", 2),
+    (r"\b(?:praxis)?inhaber(?:in)?\b", 2),
+    (r"\bvertreten\s+durch\b", 2),
+    (r"\bverantwortlich\b", 1),
+    (r"\bhandelsregister\b|\bregistergericht\b|\bhrb\s*\d", 1),
+    (r"\bust\.?-?id|\bumsatzsteuer", 1),
+    (r"\bkontakt(?:daten|informationen)?\b", 1),
+    (r"\be-?mail\s*:", 1),
+    (r"\b(?:telefon|tel\.?|telefax|fax)\s*:", 1),
+]
+
+ANCHOR_PATTERNS = [(re.compile(p, re.IGNORECASE), w) for p, w in _ANCHORS]
+
+# Markdown links, e.g. "[Impressum](/impressum)" in navigation and footers
+LINK_PATTERN = re.compile(r"\[[^\]\n]*\]\([^)\n]*\)")
+
+# Separator between non-adjacent kept windows
+WINDOW_SEPARATOR = "\n[...]\n"
+
+
+def _find_anchors(text: str) -> List[Tuple[int, int]]:
+    """
+    Find anchor positions outside of markdown links.
+
+    Args:
+        text: Markdown content
+
+    Returns:
+        List of (position, weight) tuples
+    """
+    link_spans = [m.span() for m in LINK_PATTERN.finditer(text)]
+
+    def in_link(pos: int) -> bool:
+        return any(start <= pos < end for start, end in link_spans)
+
+    anchors = []
+    for pattern, weight in ANCHOR_PATTERNS:
+        for match in pattern.finditer(text):
+            if not in_link(match.start()):
+                anchors.append((match.start(), weight))
+    return anchors
+
+
+def _snap_to_lines(
+    text: str, start: int, end: int, slack: int = 120
+) -> Tuple[int, int]:
+    """Extend a window to whole lines unless a line runs on past `slack` chars."""
+    line_start = text.rfind("\n", 0, start) + 1
+    if start - line_start <= slack:
+        start = line_start
+
+    newline = text.find("\n", end)
+    line_end = len(text) if newline == -1 else newline
+    if line_end - end <= slack:
+        end = line_end
+
+    return start, end
+
+
+def _merge(windows: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Merge overlapping or adjacent windows, sorted by position."""
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(windows):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def locate_impressum(
+    text: str,
+    context_before: Optional[int] = None,
+    context_after: Optional[int] = None,
+    max_chars: Optional[int] = None,
+) -> str:
+    """
+    Keep only the windows of text around legal-notice anchors.
+
+    Falls back to the full text when no anchor is found or when the text
+    already fits within the budget.
+
+    Args:
+        text: Markdown content
+        context_before: Characters kept before each anchor
+        context_after: Characters kept after each anchor
+        max_chars: Total character budget for the kept windows
+
+    Returns:
+        Trimmed text (or the original text on fallback)
+    """
+    if context_before is None:
+        context_before = settings.impressum_context_before
+    if context_after is None:
+        context_after = settings.impressum_context_after
+    if max_chars is None:
+        max_chars = settings.impressum_max_chars
+
+    if len(text) <= max_chars:
+        return text
+
+    anchors = _find_anchors(text)
+    if not anchors:
+        return text
+
+    # Strongest anchors claim the budget first, earlier positions break ties
+    anchors.sort(key=lambda a: (-a[1], a[0]))
+
+    # Disjoint kept windows in document order
+    windows: List[Tuple[int, int]] = []
+    used = 0
+    for pos, _ in anchors:
+        start, end = _snap_to_lines(
+            text, max(pos - context_before, 0), min(pos + context_after, len(text))
+        )
+
+        # Only count characters not already covered by a kept window
+        overlap = sum(max(0, min(end, e) - max(start, s)) for s, e in windows)
+        cost = (end - start) - overlap
+        if cost == 0:
+            continue
+        if used + cost > max_chars:
+            if not windows:
+                # A single oversized window is truncated rather than dropped
+                windows.append((start, start + max_chars))
+                used = max_chars
+            continue
+
+        windows = _merge(windows + [(start, end)])
+        used += cost
+
+    return WINDOW_SEPARATOR.join(text[start:end].strip("\n") for start, end in windows)
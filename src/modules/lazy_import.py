@@ -0,0 +1,44 @@
+"""
+Deferred imports for heavy optional-at-startup dependencies.
+
+langextract pulls in pandas and IPython (close to a second of import time),
+which CLI startup, --help and test collection should not pay for. A module
+imported with lazy_import() is registered immediately but only executed on
+its first attribute access.
+"""
+
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Import a module on first attribute access.
+
+    The returned object is the module itself (it is also placed in
+    sys.modules), so later imports, attribute patches in tests and
+    monkeypatching all see the same object.
+
+    Args:
+        name: Absolute module name (e.g. "langextract")
+
+    Returns:
+        Module that loads itself when first used
+
+    Raises:
+        ImportError: If the module is not installed
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No module named '{name}'", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -0,0 +1,472 @@
+"""
+Model backends for AboutExtractorV2.
+
+The extractor talks to the model through a small backend interface, so the
+Gemini-backed LangExtract call can be swapped for a local stand-in. The fake
+backend returns schema-valid company_info extractions without any network
+access, with configurable latency, error and 429 behaviour, so the full
+runners (retry_with_backoff, RateLimiter, cache, batching) can be load- and
+latency-tested offline.
+
+The Ollama backend runs the same LangExtract prompting and resolution
+against a local Ollama server over one persistent keep-alive session, with
+a cap on in-flight requests matching the server's OLLAMA_NUM_PARALLEL.
+"""
+
+import hashlib
+import random
+import re
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from types import SimpleNamespace
+from typing import Any, Optional, Sequence
+
+from src.config.settings import settings
+from src.modules.document_batcher import DOCUMENT_HEADER
+from src.modules.lazy_import import lazy_import
+from src.modules.logger import logger
+
+lx = lazy_import("langextract")
+requests = lazy_import("requests")
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "exponential", "lognormal")
+
+# Messages providers use for quota rejections
+_RATE_LIMIT_PATTERN = re.compile(
+    r"\b429\b|resource[_ ]exhausted|rate[ _]limit|quota exceeded", re.IGNORECASE
+)
+
+# Matches the numbered headers of a packed multi-document batch
+_HEADER_PATTERN = re.compile(re.escape(DOCUMENT_HEADER).replace(r"\{number\}", r"\d+"))
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """
+    Check whether an exception is a provider quota (HTTP 429) rejection.
+
+    Args:
+        error: Exception raised by a backend call
+
+    Returns:
+        True for rate-limit errors
+    """
+    while error is not None:
+        for attr in ("code", "status_code"):
+            if getattr(error, attr, None) == 429:
+                return True
+        if _RATE_LIMIT_PATTERN.search(str(error)):
+            return True
+        error = getattr(error, "original", None) or error.__cause__
+    return False
+
+
+class LangExtractBackend:
+    """
+    Backend calling LangExtract (and through it, Gemini).
+    """
+
+    # Requests count against the provider quota enforced by RateLimiter
+    rate_limited = True
+
+    def __init__(self, model_id: str):
+        """
+        Initialize the backend.
+
+        Args:
+            model_id: LLM model identifier passed to lx.extract
+        """
+        self.model_id = model_id
+
+    def extract(
+        self,
+        text: str,
+        prompt: str,
+        examples: Sequence[Any],
+        max_char_buffer: Optional[int] = None,
+    ) -> Any:
+        """
+        Run one extraction.
+
+        Args:
+            text: Text to extract from
+            prompt: Prompt description
+            examples: Few-shot examples
+            max_char_buffer: Chunk size override
+
+        Returns:
+            AnnotatedDocument with extractions
+        """
+        kwargs = {}
+        if max_char_buffer is not None:
+            kwargs["max_char_buffer"] = max_char_buffer
+
+        return lx.extract(
+            text_or_documents=text,
+            prompt_description=prompt,
+            examples=examples,
+            model_id=self.model_id,
+            fence_output=True,
+            use_schema_constraints=False,
+            **kwargs,
+        )
+
+
+class FakeExtractionBackend:
+    """
+    Offline stand-in for the LLM.
+
+    Answers are derived from a hash of the text, so repeated runs are
+    reproducible. Every document of a packed batch gets its own aligned
+    extraction.
+    """
+
+    model_id = "fake"
+    rate_limited = True
+
+    def __init__(
+        self,
+        latency_distribution: str = "lognormal",
+        latency_mean: float = 1.0,
+        latency_sigma: float = 0.5,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        requests_per_minute: int = 0,
+        response_chars: int = 0,
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize the fake backend.
+
+        Args:
+            latency_distribution: One of LATENCY_DISTRIBUTIONS
+            latency_mean: Mean latency in seconds
+            latency_sigma: Spread (uniform half-width in seconds, lognormal
+                sigma of the underlying normal)
+            error_rate: Probability of a transient provider error
+            rate_limit_rate: Probability of a random 429 rejection
+            requests_per_minute: Server-side quota, exceeding it returns 429
+                (0 disables)
+            response_chars: Extra characters added to each extraction to
+                simulate large responses
+            seed: Random seed for latency and error injection
+        """
+        if latency_distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(
+                f"Unknown latency distribution {latency_distribution!r}, "
+                f"expected one of {LATENCY_DISTRIBUTIONS}"
+            )
+
+        self.latency_distribution = latency_distribution
+        self.latency_mean = latency_mean
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.requests_per_minute = requests_per_minute
+        self.response_chars = response_chars
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._request_times: deque = deque()
+        self.calls = 0
+
+    def sample_latency(self) -> float:
+        """
+        Draw one latency from the configured distribution.
+
+        Returns:
+            Latency in seconds
+        """
+        mean, sigma = self.latency_mean, self.latency_sigma
+        with self._lock:
+            if self.latency_distribution == "fixed":
+                return mean
+            if self.latency_distribution == "uniform":
+                return max(0.0, self._random.uniform(mean - sigma, mean + sigma))
+            if self.latency_distribution == "exponential":
+                return self._random.expovariate(1 / mean) if mean > 0 else 0.0
+            # lognormal with the requested mean
+            mu = -(sigma**2) / 2
+            return mean * self._random.lognormvariate(mu, sigma)
+
+    def _check_quota(self):
+        """Count the call and raise injected quota, 429 or transient errors."""
+        now = time.monotonic()
+        with self._lock:
+            self.calls += 1
+            if self.requests_per_minute:
+                while self._request_times and now - self._request_times[0] >= 60:
+                    self._request_times.popleft()
+                if len(self._request_times) >= self.requests_per_minute:
+                    raise lx.exceptions.InferenceRuntimeError(
+                        "429 RESOURCE_EXHAUSTED: Quota exceeded for requests "
+                        "per minute",
+                        provider="fake",
+                    )
+                self._request_times.append(now)
+
+            roll = self._random.random()
+
+        if roll < self.rate_limit_rate:
+            raise lx.exceptions.InferenceRuntimeError(
+                "429 RESOURCE_EXHAUSTED: Resource has been exhausted", provider="fake"
+            )
+        if roll < self.rate_limit_rate + self.error_rate:
+            raise lx.exceptions.InferenceRuntimeError(
+                "503 UNAVAILABLE: The model is overloaded", provider="fake"
+            )
+
+    def _fake_extraction(self, text: str, start: int, end: int) -> Any:
+        """Build a schema-valid company_info extraction for text[start:end]."""
+        document = text[start:end]
+        digest = hashlib.sha1(document.encode("utf-8")).hexdigest()[:8]
+
+        # Ground the extraction on the first non-empty line of the document
+        offset = len(document) - len(document.lstrip())
+        line = document[offset:].split("\n", 1)[0]
+
+        return lx.data.Extraction(
+            extraction_class="company_info",
+            extraction_text=line,
+            char_interval=lx.data.CharInterval(
+                start_pos=start + offset, end_pos=start + offset + len(line)
+            ),
+            attributes={
+                "owner_name": f"Max Mustermann {digest}",
+                "position": "Geschäftsführer",
+                "company_name": f"Muster {digest} GmbH",
+                "email": f"kontakt@muster-{digest}.de",
+                "phone": f"+49 30 {int(digest, 16) % 10_000_000:07d}",
+                "fax": "",
+                "website": f"www.muster-{digest}.de",
+                "profession": "",
+                "sector": "Consulting",
+            },
+            description="x" * self.response_chars if self.response_chars else None,
+        )
+
+    def extract(
+        self,
+        text: str,
+        prompt: str,
+        examples: Sequence[Any],
+        max_char_buffer: Optional[int] = None,
+    ) -> Any:
+        """
+        Sleep for a sampled latency and return fake extractions.
+
+        Args:
+            text: Text to extract from
+            prompt: Prompt description (ignored)
+            examples: Few-shot examples (ignored)
+            max_char_buffer: Chunk size override (ignored)
+
+        Returns:
+            AnnotatedDocument with one extraction per packed document
+        """
+        latency = self.sample_latency()
+        self._check_quota()
+        time.sleep(latency)
+
+        headers = list(_HEADER_PATTERN.finditer(text))
+        if headers:
+            bounds = [h.end() for h in headers]
+            ends = [h.start() for h in headers[1:]] + [len(text)]
+            spans = list(zip(bounds, ends))
+        else:
+            spans = [(0, len(text))]
+
+        extractions = [
+            self._fake_extraction(text, start, end)
+            for start, end in spans
+            if text[start:end].strip()
+        ]
+        return lx.data.AnnotatedDocument(text=text, extractions=extractions)
+
+
+class OllamaBackend:
+    """
+    Backend calling LangExtract with a local Ollama model.
+
+    LangExtract's Ollama provider opens a new connection for every request.
+    Here all requests share one requests.Session whose connection pool holds
+    `parallel` keep-alive connections, and a semaphore keeps at most
+    `parallel` requests in flight, so concurrent workers queue on the client
+    instead of piling up on the server. The backend is thread-safe and meant
+    to be shared by all workers.
+    """
+
+    # A local server has no quota, so the extractor skips RateLimiter
+    rate_limited = False
+
+    def __init__(
+        self,
+        model_id: str,
+        base_url: str = "http://localhost:11434",
+        parallel: int = 4,
+        keep_alive: int = 1800,
+        timeout: float = 300.0,
+    ):
+        """
+        Initialize the backend.
+
+        Args:
+            model_id: Ollama model name (e.g. "gpt-oss:20b")
+            base_url: Ollama server URL
+            parallel: Maximum concurrent requests (match OLLAMA_NUM_PARALLEL)
+            keep_alive: Seconds the server keeps the model loaded after a
+                request (-1 keeps it loaded)
+            timeout: Seconds to wait for one generation
+        """
+        self.model_id = model_id
+        self.base_url = base_url.rstrip("/")
+        self.parallel = parallel
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=parallel
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._slots = threading.BoundedSemaphore(parallel)
+        self._model = None
+        self._model_lock = threading.Lock()
+        self.pooled = False  # Provider requests go through the session
+
+    def _post(self, url: str, **kwargs) -> "requests.Response":
+        """POST through the shared session, waiting for a free slot."""
+        with self._slots:
+            return self.session.post(url, **kwargs)
+
+    @property
+    def model(self) -> Any:
+        """LangExtract Ollama model sending its requests through the session."""
+        with self._model_lock:
+            if self._model is None:
+                from langextract.providers.ollama import OllamaLanguageModel
+
+                model = OllamaLanguageModel(
+                    model_id=self.model_id,
+                    model_url=self.base_url,
+                    timeout=self.timeout,
+                    keep_alive=self.keep_alive,
+                )
+                # The provider calls self._requests.post() (langextract 1.7.1);
+                # route it through the pooled session and the concurrency cap
+                if hasattr(model, "_requests"):
+                    model._requests = SimpleNamespace(
+                        post=self._post, exceptions=requests.exceptions
+                    )
+                    self.pooled = True
+                else:
+                    logger.warning(
+                        "⚠️  langextract's OllamaLanguageModel has no _requests "
+                        "attribute; Ollama requests are not pooled and the "
+                        "concurrency cap applies per extraction"
+                    )
+                self._model = model
+            return self._model
+
+    def preload(self) -> bool:
+        """
+        Load the model into server memory before the first extraction.
+
+        An Ollama generate request without a prompt only loads the model, so
+        the first real request does not pay the load time.
+
+        Returns:
+            True if the server loaded the model
+        """
+        try:
+            response = self._post(
+                f"{self.base_url}/api/generate",
+                json={"model": self.model_id, "keep_alive": self.keep_alive},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.warning(f"⚠️  Could not preload Ollama model {self.model_id}: {e}")
+            return False
+
+        logger.info(f"✅ Ollama model {self.model_id} loaded")
+        return True
+
+    def extract(
+        self,
+        text: str,
+        prompt: str,
+        examples: Sequence[Any],
+        max_char_buffer: Optional[int] = None,
+    ) -> Any:
+        """
+        Run one extraction.
+
+        Args:
+            text: Text to extract from
+            prompt: Prompt description
+            examples: Few-shot examples
+            max_char_buffer: Chunk size override
+
+        Returns:
+            AnnotatedDocument with extractions
+        """
+        kwargs = {}
+        if max_char_buffer is not None:
+            kwargs["max_char_buffer"] = max_char_buffer
+
+        model = self.model
+        with nullcontext() if self.pooled else self._slots:
+            return lx.extract(
+                text_or_documents=text,
+                prompt_description=prompt,
+                examples=examples,
+                model=model,
+                fence_output=False,
+                use_schema_constraints=False,
+                show_progress=False,
+                **kwargs,
+            )
+
+    def close(self):
+        """Close the pooled connections."""
+        self.session.close()
+
+
+def backend_from_settings(model_id: Optional[str] = None):
+    """
+    Create the model backend configured in settings.
+
+    Args:
+        model_id: LLM model for the LangExtract backend
+
+    Returns:
+        LangExtractBackend, OllamaBackend or FakeExtractionBackend
+    """
+    if settings.llm_backend == "ollama":
+        backend = OllamaBackend(
+            settings.ollama_model,
+            base_url=settings.ollama_base_url,
+            parallel=settings.ollama_parallel,
+            keep_alive=settings.ollama_keep_alive,
+            timeout=settings.ollama_timeout,
+        )
+        if settings.ollama_preload:
+            backend.preload()
+        return backend
+
+    if settings.llm_backend == "fake":
+        return FakeExtractionBackend(
+            latency_distribution=settings.fake_llm_latency_distribution,
+            latency_mean=settings.fake_llm_latency_mean,
+            latency_sigma=settings.fake_llm_latency_sigma,
+            error_rate=settings.fake_llm_error_rate,
+            rate_limit_rate=settings.fake_llm_rate_limit_rate,
+            requests_per_minute=settings.fake_llm_requests_per_minute,
+            response_chars=settings.fake_llm_response_chars,
+            seed=settings.fake_llm_seed,
+        )
+
+    return LangExtractBackend(model_id or settings.langextract_model)
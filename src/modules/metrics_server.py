@@ -0,0 +1,279 @@
+"""
+Embedded Prometheus metrics endpoint for long-running extraction runs.
+
+Serves the live ExtractionStatistics of a run in the Prometheus text
+exposition format from a daemon thread (stdlib http.server only), so
+throughput, saturation and stalls can be watched and alerted on while a
+multi-hour run is still going:
+
+    curl http://localhost:9108/metrics
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional
+
+from src.config.settings import settings
+from src.modules.http_pool import pool_stats
+from src.modules.logger import logger
+from src.modules.retry_handler import retry_counter
+from src.modules.statistics import ExtractionStatistics
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Histogram bucket boundaries in seconds
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+def _metric(lines: List[str], name: str, kind: str, help_text: str):
+    """Append the HELP and TYPE header of a metric family."""
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {kind}")
+
+
+def render_metrics(
+    stats: ExtractionStatistics,
+    gauges: Optional[Dict[str, Callable[[], float]]] = None,
+) -> str:
+    """
+    Render a run's statistics in the Prometheus text format.
+
+    Args:
+        stats: Live statistics of the run
+        gauges: Extra gauges by metric name (e.g. queue depths), read at
+            scrape time
+
+    Returns:
+        Metrics page
+    """
+    lines: List[str] = []
+
+    _metric(lines, "extraction_files_listed_total", "counter", "Objects listed.")
+    lines.append(f"extraction_files_listed_total {stats.total_files}")
+
+    _metric(lines, "extraction_files_total", "counter", "Objects finished by status.")
+    for status, value in (
+        ("success", stats.successful),
+        ("skipped", stats.skipped),
+        ("error", stats.errors),
+    ):
+        lines.append(f'extraction_files_total{{status="{status}"}} {value}')
+
+    _metric(lines, "extraction_cache_lookups_total", "counter", "Cache lookups.")
+    lines.append(f'extraction_cache_lookups_total{{result="hit"}} {stats.cache_hits}')
+    lines.append(
+        f'extraction_cache_lookups_total{{result="miss"}} {stats.cache_misses}'
+    )
+
+    _metric(
+        lines,
+        "extraction_llm_calls_skipped_total",
+        "counter",
+        "LLM calls avoided by the contact fast path.",
+    )
+    lines.append(f"extraction_llm_calls_skipped_total {stats.llm_calls_skipped}")
+
+    retries = retry_counter.snapshot()
+    _metric(lines, "extraction_retries_total", "counter", "Retried failed attempts.")
+    for name, value in sorted(retries["retries"].items()):
+        lines.append(f'extraction_retries_total{{function="{name}"}} {value}')
+    _metric(
+        lines,
+        "extraction_retries_exhausted_total",
+        "counter",
+        "Calls that failed after their last attempt.",
+    )
+    for name, value in sorted(retries["failures"].items()):
+        lines.append(f'extraction_retries_exhausted_total{{function="{name}"}} {value}')
+
+    pool = pool_stats.snapshot()
+    _metric(lines, "minio_pool_size", "gauge", "Connections in the shared pool.")
+    lines.append(f"minio_pool_size {pool['size']}")
+    _metric(lines, "minio_pool_in_use", "gauge", "Connections checked out.")
+    lines.append(f"minio_pool_in_use {pool['in_use']}")
+    _metric(lines, "minio_pool_max_in_use", "gauge", "Most connections checked out.")
+    lines.append(f"minio_pool_max_in_use {pool['max_in_use']}")
+    _metric(lines, "minio_pool_checkouts_total", "counter", "Connection checkouts.")
+    lines.append(f"minio_pool_checkouts_total {pool['checkouts']}")
+    _metric(
+        lines,
+        "minio_pool_waits_total",
+        "counter",
+        "Checkouts that found every connection in use.",
+    )
+    lines.append(f"minio_pool_waits_total {pool['waits']}")
+    _metric(
+        lines,
+        "minio_pool_wait_seconds_total",
+        "counter",
+        "Time spent waiting for a free connection.",
+    )
+    lines.append(f"minio_pool_wait_seconds_total {pool['wait_seconds']:.6f}")
+
+    if stats.concurrency_trajectory:
+        step = stats.concurrency_trajectory[-1]
+        _metric(
+            lines,
+            "extraction_llm_concurrency_limit",
+            "gauge",
+            "Adaptive limit of LLM calls in flight.",
+        )
+        lines.append(f"extraction_llm_concurrency_limit {step['limit']}")
+        _metric(
+            lines,
+            "extraction_llm_requests_per_minute",
+            "gauge",
+            "Adaptive LLM request rate.",
+        )
+        lines.append(
+            f"extraction_llm_requests_per_minute {step['requests_per_minute']}"
+        )
+
+    _metric(lines, "extraction_stage_in_flight", "gauge", "Items inside a stage.")
+    for stage, value in stats.in_flight.items():
+        lines.append(f'extraction_stage_in_flight{{stage="{stage}"}} {value}')
+
+    _metric(
+        lines,
+        "extraction_stage_latency_seconds",
+        "histogram",
+        "Latency per pipeline stage.",
+    )
+    for stage, histogram in stats.stage_latency.items():
+        for bound in LATENCY_BUCKETS:
+            lines.append(
+                f'extraction_stage_latency_seconds_bucket{{stage="{stage}",'
+                f'le="{bound}"}} {histogram.count_le(bound)}'
+            )
+        lines.append(
+            f'extraction_stage_latency_seconds_bucket{{stage="{stage}",le="+Inf"}} '
+            f"{histogram.count}"
+        )
+        lines.append(
+            f'extraction_stage_latency_seconds_sum{{stage="{stage}"}} '
+            f"{histogram.total:.6f}"
+        )
+        lines.append(
+            f'extraction_stage_latency_seconds_count{{stage="{stage}"}} '
+            f"{histogram.count}"
+        )
+
+    for name, read in (gauges or {}).items():
+        _metric(lines, name, "gauge", name.replace("_", " ").capitalize() + ".")
+        lines.append(f"{name} {read()}")
+
+    return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """
+    HTTP server exposing /metrics from a daemon thread.
+    """
+
+    def __init__(
+        self,
+        stats: ExtractionStatistics,
+        host: str = "127.0.0.1",
+        port: int = 9108,
+        gauges: Optional[Dict[str, Callable[[], float]]] = None,
+    ):
+        """
+        Bind the server (port 0 picks a free port).
+
+        Args:
+            stats: Live statistics of the run
+            host: Interface to listen on
+            port: TCP port
+            gauges: Extra gauges by metric name, read at scrape time
+        """
+        self.stats = stats
+        self.gauges = dict(gauges or {})
+        self._thread: Optional[threading.Thread] = None
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+
+                body = render_metrics(server.stats, server.gauges).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Scrapes would flood the pipeline log
+
+        self._httpd = ThreadingHTTPServer((host, port), Handler)
+        self._httpd.daemon_threads = True
+
+    @property
+    def port(self) -> int:
+        """Port the server is bound to."""
+        return self._httpd.server_address[1]
+
+    def add_gauge(self, name: str, read: Callable[[], float]):
+        """
+        Register a gauge read at scrape time.
+
+        Args:
+            name: Metric name
+            read: Callable returning the current value
+        """
+        self.gauges[name] = read
+
+    def start(self) -> "MetricsServer":
+        """Serve requests in a daemon thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="metrics-server", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            f"📈 Metrics: http://{self._httpd.server_address[0]}:{self.port}/metrics"
+        )
+        return self
+
+    def stop(self):
+        """Stop serving and release the port."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+
+def metrics_server_from_settings(
+    stats: ExtractionStatistics,
+) -> Optional[MetricsServer]:
+    """
+    Start the metrics server configured in settings.
+
+    Args:
+        stats: Live statistics of the run
+
+    Returns:
+        Running MetricsServer, or None if metrics are disabled
+    """
+    if not settings.metrics_enabled:
+        return None
+
+    return MetricsServer(stats, settings.metrics_host, settings.metrics_port).start()
@@ -4,12 +4,64 @@ MinIO client wrapper for object storage operations.
 
 import io
 import json
-from typing import Dict, List, Optional, Union
+import threading
+import time
+from contextlib import nullcontext
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 from minio import Minio
 from minio.error import S3Error
+from urllib3.exceptions import HTTPError
 
 from src.config.settings import settings
+from src.modules.http_pool import shared_pool_manager
+from src.modules.statistics import ExtractionStatistics
+from src.modules.tracing import span
+
+_clients: Dict[tuple, Minio] = {}
+_clients_lock = threading.Lock()
+
+# (client, bucket) pairs already checked by this process
+_checked_buckets: Set[tuple] = set()
+
+# Whether the missing max-keys support was reported
+_warned_page_size = False
+
+
+def minio_client() -> Minio:
+    """
+    Get the process-wide MinIO client for the configured endpoint.
+
+    All MinIOManager instances share one client and its connection pool
+    (see src.modules.http_pool), so connections are reused across them.
+
+    Returns:
+        Minio client
+    """
+    key = (
+        settings.minio_endpoint,
+        settings.minio_access_key,
+        settings.minio_secret_key,
+        settings.minio_secure,
+    )
+    with _clients_lock:
+        if key not in _clients:
+            _clients[key] = Minio(
+                settings.minio_endpoint,
+                access_key=settings.minio_access_key,
+                secret_key=settings.minio_secret_key,
+                secure=settings.minio_secure,
+                http_client=shared_pool_manager(),
+            )
+        return _clients[key]
+
+
+def reset_clients():
+    """Forget the cached clients and bucket checks (e.g. between tests)."""
+    with _clients_lock:
+        _clients.clear()
+        _checked_buckets.clear()
 
 
 class MinIOManager:
@@ -17,19 +69,30 @@ class MinIOManager:
     MinIO object storage manager for markdown and JSON file operations.
     """
 
-    def __init__(self):
-        """Initialize MinIO client with settings from environment."""
-        self.client = Minio(
-            settings.minio_endpoint,
-            access_key=settings.minio_access_key,
-            secret_key=settings.minio_secret_key,
-            secure=settings.minio_secure,
-        )
+    def __init__(self, stats: Optional[ExtractionStatistics] = None):
+        """
+        Initialize MinIO client with settings from environment.
+
+        Args:
+            stats: Statistics tracker receiving per-call stage latencies
+        """
+        self.stats = stats
+        self.client = minio_client()
         self.bucket_name = settings.minio_bucket_name
         self._ensure_bucket_exists()
 
+    def _stage(self, stage: str):
+        """Time a block as a pipeline stage if statistics are tracked."""
+        if self.stats is None:
+            return nullcontext()
+        return self.stats.time_stage(stage)
+
     def _ensure_bucket_exists(self):
-        """Create bucket if it doesn't exist."""
+        """Create bucket if it doesn't exist (checked once per process)."""
+        key = (self.client, self.bucket_name)
+        if key in _checked_buckets:
+            return
+
         try:
             if not self.client.bucket_exists(self.bucket_name):
                 self.client.make_bucket(self.bucket_name)
@@ -39,45 +102,152 @@ class MinIOManager:
         except S3Error as e:
             print(f"✗ Error checking/creating bucket: {e}")
             raise
+        _checked_buckets.add(key)
 
-    def list_objects(
-        self, prefix: str = "", recursive: bool = True, limit: Optional[int] = None
-    ) -> List[Dict[str, str]]:
+    def iter_objects(
+        self,
+        prefix: str = "",
+        recursive: bool = True,
+        suffix: Optional[str] = None,
+        start_after: Optional[str] = None,
+        page_size: Optional[int] = None,
+        include_user_meta: bool = False,
+        retries: int = 3,
+    ) -> Iterator[Dict[str, str]]:
         """
-        List objects in bucket with optional prefix filtering.
+        Lazily stream objects in bucket, one listing page at a time.
+
+        Memory use is independent of bucket size and the first objects are
+        yielded as soon as the first page arrives.
 
         Args:
             prefix: Filter objects by prefix (e.g., "scraped-content/")
             recursive: List recursively through subdirectories
-            limit: Maximum number of objects to return (None for unlimited)
+            suffix: Only yield objects whose name ends with this suffix
+            start_after: Resume listing after this object name (exclusive)
+            page_size: Keys per listing request (server default 1000)
+            include_user_meta: Also return each object's user metadata
+                (MinIO listing extension, no extra requests)
+            retries: Times an interrupted listing is resumed after the last
+                listed key before the error is raised
 
-        Returns:
-            List of dictionaries with object metadata
+        Yields:
+            Dictionaries with object metadata
+
+        Raises:
+            S3Error: If the listing still fails after `retries` resumptions
         """
-        try:
-            objects = self.client.list_objects(
-                self.bucket_name, prefix=prefix, recursive=recursive
+        attempts = 0
+        cursor = start_after
+        while True:
+            objects = iter(
+                self._open_listing(
+                    prefix, recursive, cursor, page_size, include_user_meta
+                )
             )
+            try:
+                # Pages are fetched lazily while iterating; time spent waiting
+                # for them is recorded once per page
+                per_page = page_size or 1000
+                waited = 0.0
+                listed = 0
+                while True:
+                    start = time.perf_counter()
+                    obj = next(objects, None)
+                    waited += time.perf_counter() - start
+                    if obj is None:
+                        if listed % per_page and self.stats is not None:
+                            self.stats.record_stage("list", waited)
+                        return
+
+                    listed += 1
+                    if listed % per_page == 0 and self.stats is not None:
+                        self.stats.record_stage("list", waited)
+                        waited = 0.0
+                    if obj.object_name != cursor:  # Progress resets the retries
+                        cursor = obj.object_name
+                        attempts = 0
 
-            result = []
-            count = 0
-            for obj in objects:
-                if limit and count >= limit:
-                    break
+                    if suffix and not obj.object_name.endswith(suffix):
+                        continue
 
-                result.append(
-                    {
+                    entry = {
                         "object_name": obj.object_name,
                         "size": obj.size,
                         "last_modified": obj.last_modified,
                         "etag": obj.etag,
                     }
+                    if include_user_meta:
+                        entry["metadata"] = obj.metadata or {}
+                    yield entry
+            except (S3Error, HTTPError) as e:
+                # Never end early as if the listing were complete: resume
+                # after the last listed key, or give up loudly
+                attempts += 1
+                if attempts > retries:
+                    print(f"✗ Error listing objects: {e}")
+                    raise
+                delay = 2 ** (attempts - 1)
+                print(
+                    f"⚠ Listing interrupted after {cursor!r} ({e}), retrying in {delay}s"
                 )
-                count += 1
+                time.sleep(delay)
 
-            return result
-        except S3Error as e:
-            print(f"✗ Error listing objects: {e}")
+    def _open_listing(
+        self,
+        prefix: str,
+        recursive: bool,
+        start_after: Optional[str],
+        page_size: Optional[int],
+        include_user_meta: bool,
+    ) -> Iterable:
+        """Start a lazy listing, with max-keys where the client supports it."""
+        global _warned_page_size
+
+        if page_size and hasattr(self.client, "_list_objects"):
+            # The public list_objects() does not expose max-keys
+            return self.client._list_objects(
+                self.bucket_name,
+                delimiter=None if recursive else "/",
+                encoding_type="url",
+                max_keys=page_size,
+                prefix=prefix,
+                start_after=start_after,
+                include_user_meta=include_user_meta,
+            )
+        if page_size and not _warned_page_size:
+            _warned_page_size = True
+            print("⚠ minio client has no _list_objects(); ignoring LISTING_PAGE_SIZE")
+
+        options = {}
+        if start_after:
+            options["start_after"] = start_after
+        if include_user_meta:
+            options["include_user_meta"] = True
+        return self.client.list_objects(
+            self.bucket_name, prefix=prefix, recursive=recursive, **options
+        )
+
+    def list_objects(
+        self, prefix: str = "", recursive: bool = True, limit: Optional[int] = None
+    ) -> List[Dict[str, str]]:
+        """
+        List objects in bucket with optional prefix filtering.
+
+        Builds the full result in memory; prefer iter_objects() for large
+        buckets.
+
+        Args:
+            prefix: Filter objects by prefix (e.g., "scraped-content/")
+            recursive: List recursively through subdirectories
+            limit: Maximum number of objects to return (None for unlimited)
+
+        Returns:
+            List of dictionaries with object metadata
+        """
+        try:
+            return list(islice(self.iter_objects(prefix, recursive), limit or None))
+        except (S3Error, HTTPError):
             return []
 
     def download_object(
@@ -94,10 +264,11 @@ class MinIOManager:
             Object content as string (if as_text=True) or bytes
         """
         try:
-            response = self.client.get_object(self.bucket_name, object_name)
-            data = response.read()
-            response.close()
-            response.release_conn()
+            with span("minio.download", object=object_name), self._stage("download"):
+                response = self.client.get_object(self.bucket_name, object_name)
+                data = response.read()
+                response.close()
+                response.release_conn()
 
             if as_text:
                 return data.decode("utf-8")
@@ -111,6 +282,7 @@ class MinIOManager:
         object_name: str,
         data: dict,
         content_type: str = "application/json; charset=utf-8",
+        metadata: Optional[Dict[str, str]] = None,
     ) -> bool:
         """
         Upload JSON data to MinIO.
@@ -119,6 +291,7 @@ class MinIOManager:
             object_name: Full path where to save object
             data: Dictionary to serialize as JSON
             content_type: MIME type
+            metadata: User metadata stored with the object (x-amz-meta-*)
 
         Returns:
             True if successful, False otherwise
@@ -127,13 +300,15 @@ class MinIOManager:
             json_bytes = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
             json_stream = io.BytesIO(json_bytes)
 
-            self.client.put_object(
-                self.bucket_name,
-                object_name,
-                json_stream,
-                length=len(json_bytes),
-                content_type=content_type,
-            )
+            with span("minio.upload", object=object_name), self._stage("upload"):
+                self.client.put_object(
+                    self.bucket_name,
+                    object_name,
+                    json_stream,
+                    length=len(json_bytes),
+                    content_type=content_type,
+                    metadata=metadata,
+                )
 
             print(f"✓ Uploaded: {object_name}")
             return True
@@ -186,7 +361,111 @@ class MinIOManager:
             True if object exists, False otherwise
         """
         try:
-            self.client.stat_object(self.bucket_name, object_name)
+            with span("minio.stat", object=object_name), self._stage("stat"):
+                self.client.stat_object(self.bucket_name, object_name)
             return True
         except S3Error:
             return False
+
+    def listen_notifications(
+        self,
+        prefix: str = "",
+        suffix: str = "",
+        events: tuple = ("s3:ObjectCreated:*",),
+    ) -> Iterable[Dict[str, Any]]:
+        """
+        Open a bucket notification stream (MinIO extension, not on AWS S3).
+
+        The stream is one long-lived GET, sent before this returns so the
+        server already records events; iterating it blocks until the next
+        event and reopens the request when the server ends it.
+
+        Args:
+            prefix: Only report objects starting with this prefix
+            suffix: Only report objects ending with this suffix
+            events: Event types to report
+
+        Returns:
+            Iterable of notification dictionaries ({"Records": [...]}), also
+            a context manager that closes the stream
+        """
+        events = self.client.listen_bucket_notification(
+            self.bucket_name, prefix=prefix, suffix=suffix, events=events
+        )
+        # minio sends the request lazily on the first next(); send it now
+        if hasattr(events, "_func") and getattr(events, "_response", None) is None:
+            events._response = events._func()
+        return events
+
+    def put_object_if(
+        self, object_name: str, data: bytes, etag: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Write an object only if it is unchanged (S3 conditional write).
+
+        Args:
+            object_name: Full path where to save object
+            data: Raw bytes to upload
+            etag: ETag the current object must have (If-Match); None
+                creates the object only if it does not exist (If-None-Match)
+
+        Returns:
+            ETag of the written object, or None if the condition failed
+
+        Raises:
+            S3Error: For errors other than a failed precondition
+        """
+        headers = {"If-Match": f'"{etag}"'} if etag else {"If-None-Match": "*"}
+        try:
+            with span("minio.put_if", object=object_name), self._stage("upload"):
+                result = self.client._put_object(
+                    self.bucket_name, object_name, data, headers=headers
+                )
+            return result.etag
+        except S3Error as e:
+            if e.code in ("PreconditionFailed", "NoSuchKey"):
+                return None
+            raise
+
+    def read_object(self, object_name: str) -> Optional[Tuple[bytes, str]]:
+        """
+        Download an object together with its ETag.
+
+        Args:
+            object_name: Full path to object
+
+        Returns:
+            (content, ETag), or None if the object does not exist
+
+        Raises:
+            S3Error: For errors other than a missing object
+        """
+        try:
+            with span("minio.download", object=object_name), self._stage("download"):
+                response = self.client.get_object(self.bucket_name, object_name)
+                data = response.read()
+                etag = (response.headers.get("etag") or "").replace('"', "")
+                response.close()
+                response.release_conn()
+            return data, etag
+        except S3Error as e:
+            if e.code == "NoSuchKey":
+                return None
+            raise
+
+    def remove_object(self, object_name: str) -> bool:
+        """
+        Delete an object.
+
+        Args:
+            object_name: Full path to object
+
+        Returns:
+            True if successful (also if it did not exist), False otherwise
+        """
+        try:
+            self.client.remove_object(self.bucket_name, object_name)
+            return True
+        except S3Error as e:
+            print(f"✗ Error removing {object_name}: {e}")
+            return False
@@ -0,0 +1,370 @@
+"""
+Sharded bulk sink for extraction results.
+
+Writing one small `.about.json` object per page costs a PUT per result and
+leaves downstream consumers to list and GET millions of tiny objects. The
+sharded sink buffers results and writes them as compressed JSONL shards of
+bounded size instead:
+
+    extracted/part-20250101-120000-1a2b3c-00000.jsonl.zst
+    extracted/manifest/part-20250101-120000-1a2b3c-00000.jsonl
+
+Each shard line is {"source": <markdown key>, "data": <CompanyInfoLite>}.
+The manifest of a shard maps every source key to its line number and byte
+range in the uncompressed shard (plus the result's provenance metadata, if
+any), and is written only after its shard, so a listed manifest always
+points at a complete shard. Results still buffered
+when the process dies are not in any manifest and are extracted again (or
+replayed from the run journal) by the next run.
+
+zstd compression needs the optional zstandard package
+(pip install -e ".[sink]"); gzip uses the standard library.
+"""
+
+import gzip
+import json
+import threading
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from src.config.settings import settings
+from src.modules.logger import logger
+from src.modules.minio_manager import MinIOManager
+
+COMPRESSIONS = ("zstd", "gzip")
+SHARD_SUFFIXES = {"zstd": ".jsonl.zst", "gzip": ".jsonl.gz"}
+MANIFEST_DIR = "manifest/"
+
+
+def _zstd():
+    """Import zstandard or explain how to install it."""
+    try:
+        import zstandard
+    except ImportError as e:
+        raise RuntimeError(
+            'zstd shards need the zstandard package (pip install -e ".[sink]") '
+            "or RESULT_SINK_COMPRESSION=gzip"
+        ) from e
+    return zstandard
+
+
+def compress(data: bytes, compression: str) -> bytes:
+    """
+    Compress a whole shard.
+
+    Args:
+        data: Uncompressed JSONL bytes
+        compression: "zstd" or "gzip"
+
+    Returns:
+        Compressed bytes
+    """
+    if compression == "zstd":
+        return _zstd().ZstdCompressor(level=3).compress(data)
+    return gzip.compress(data, compresslevel=6)
+
+
+def decompress(data: bytes, compression: str) -> bytes:
+    """
+    Decompress a whole shard.
+
+    Args:
+        data: Compressed shard bytes
+        compression: "zstd" or "gzip"
+
+    Returns:
+        Uncompressed JSONL bytes
+    """
+    if compression == "zstd":
+        return _zstd().ZstdDecompressor().decompressobj().decompress(data)
+    return gzip.decompress(data)
+
+
+class ShardedResultSink:
+    """
+    Thread-safe buffer writing results as compressed JSONL shards.
+    """
+
+    def __init__(
+        self,
+        minio_mgr: MinIOManager,
+        prefix: str = "extracted/",
+        compression: str = "zstd",
+        max_records: int = 10000,
+        max_bytes: int = 64 * 1024 * 1024,
+        on_commit: Optional[
+            Callable[[List[str], List[Optional[Dict[str, str]]]], None]
+        ] = None,
+        on_failure: Optional[Callable[[List[str]], None]] = None,
+    ):
+        """
+        Initialize the sink.
+
+        Args:
+            minio_mgr: MinIOManager used for shard and manifest uploads
+            prefix: Object prefix for shards (manifests go below it)
+            compression: "zstd" or "gzip"
+            max_records: Results per shard
+            max_bytes: Uncompressed bytes per shard
+            on_commit: Called with the source keys of each written shard and
+                their metadata
+            on_failure: Called with the source keys of a shard that could
+                not be written and whose add() calls already returned True
+                (the call that triggered the write returns False instead)
+        """
+        if compression not in COMPRESSIONS:
+            raise ValueError(
+                f"Unknown result sink compression '{compression}' "
+                f"(expected one of {', '.join(COMPRESSIONS)})"
+            )
+        if compression == "zstd":
+            _zstd()  # Fail at startup, not at the first shard
+
+        self.minio_mgr = minio_mgr
+        self.prefix = prefix if not prefix or prefix.endswith("/") else prefix + "/"
+        self.compression = compression
+        self.max_records = max_records
+        self.max_bytes = max_bytes
+        self.on_commit = on_commit
+        self.on_failure = on_failure
+
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        self.run_id = f"{stamp}-{uuid.uuid4().hex[:6]}"
+        self.shards_written = 0
+        self.records_written = 0
+
+        self._lock = threading.Lock()
+        self._lines: List[bytes] = []
+        self._sources: List[str] = []
+        self._metadata: List[Optional[Dict[str, str]]] = []
+        self._size = 0
+        self._next_shard = 0
+
+    def add(
+        self,
+        source: str,
+        data: Dict[str, Any],
+        metadata: Optional[Dict[str, str]] = None,
+    ) -> bool:
+        """
+        Buffer one result, writing a shard when the buffer is full.
+
+        Args:
+            source: Markdown object key the result was extracted from
+            data: Result dictionary
+            metadata: Provenance metadata recorded in the manifest entry
+
+        Returns:
+            False if a shard write triggered by this call failed (the other
+            results of that shard go to on_failure)
+        """
+        line = (
+            json.dumps({"source": source, "data": data}, ensure_ascii=False) + "\n"
+        ).encode("utf-8")
+
+        with self._lock:
+            self._lines.append(line)
+            self._sources.append(source)
+            self._metadata.append(metadata)
+            self._size += len(line)
+            if len(self._lines) < self.max_records and self._size < self.max_bytes:
+                return True
+            shard = self._take_shard()
+
+        # Compress and upload outside the lock so other workers keep buffering
+        return self._write_shard(*shard, reported=1)
+
+    def flush(self) -> bool:
+        """
+        Write buffered results as a (possibly small) shard.
+
+        Returns:
+            True if nothing was buffered or the shard was written
+        """
+        with self._lock:
+            if not self._lines:
+                return True
+            shard = self._take_shard()
+        return self._write_shard(*shard)
+
+    def close(self) -> bool:
+        """Write the remaining buffered results."""
+        return self.flush()
+
+    def _take_shard(self) -> Tuple[int, List[bytes], List[str], List]:
+        """Swap out the buffer and reserve a shard number (lock held)."""
+        shard = (self._next_shard, self._lines, self._sources, self._metadata)
+        self._next_shard += 1
+        self._lines, self._sources, self._metadata, self._size = [], [], [], 0
+        return shard
+
+    def shard_key(self, number: int) -> str:
+        """
+        Build the object key of a shard of this run.
+
+        Args:
+            number: Shard sequence number
+
+        Returns:
+            Shard object key
+        """
+        suffix = SHARD_SUFFIXES[self.compression]
+        return f"{self.prefix}part-{self.run_id}-{number:05d}{suffix}"
+
+    def _write_shard(
+        self,
+        number: int,
+        lines: List[bytes],
+        sources: List[str],
+        metadata: List[Optional[Dict[str, str]]],
+        reported: int = 0,
+    ) -> bool:
+        """
+        Upload a shard, then its manifest, then report the sources.
+
+        The last `reported` sources learn about a failure from the return
+        value; on_failure gets the others.
+        """
+        shard_key = self.shard_key(number)
+        payload = b"".join(lines)
+        body = compress(payload, self.compression)
+
+        manifest = []
+        offset = 0
+        for line_number, (source, line, meta) in enumerate(
+            zip(sources, lines, metadata)
+        ):
+            entry = {
+                "source": source,
+                "shard": shard_key,
+                "line": line_number,
+                "offset": offset,
+                "length": len(line),
+            }
+            if meta:
+                entry["metadata"] = meta
+            manifest.append(json.dumps(entry, ensure_ascii=False) + "\n")
+            offset += len(line)
+        manifest_body = "".join(manifest).encode("utf-8")
+
+        if not self.minio_mgr.put_object(
+            shard_key, body, len(body), content_type="application/octet-stream"
+        ) or not self.minio_mgr.put_object(
+            self.manifest_key(shard_key),
+            manifest_body,
+            len(manifest_body),
+            content_type="application/x-ndjson",
+        ):
+            logger.error(
+                f"❌ Shard {shard_key} not written; its {len(sources)} results "
+                "will be extracted again by the next run"
+            )
+            if self.on_failure is not None and len(sources) > reported:
+                self.on_failure(sources[: len(sources) - reported])
+            return False
+
+        with self._lock:
+            self.shards_written += 1
+            self.records_written += len(sources)
+        logger.info(
+            f"📦 Wrote shard {shard_key}: {len(sources)} results, "
+            f"{len(payload)} -> {len(body)} bytes"
+        )
+        if self.on_commit is not None:
+            self.on_commit(sources, metadata)
+        return True
+
+    def manifest_key(self, shard_key: str) -> str:
+        """
+        Build the manifest object key of a shard.
+
+        Args:
+            shard_key: Shard object key
+
+        Returns:
+            Manifest object key
+        """
+        name = shard_key[len(self.prefix) :]
+        name = name[: -len(SHARD_SUFFIXES[self.compression])]
+        return f"{self.prefix}{MANIFEST_DIR}{name}.jsonl"
+
+    def iter_manifest(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the manifest entries of all written shards (of any run).
+
+        Returns:
+            Iterator of {"source", "shard", "line", "offset", "length"}, plus
+            "metadata" for results stored with provenance
+        """
+        for obj in self.minio_mgr.iter_objects(
+            prefix=self.prefix + MANIFEST_DIR,
+            suffix=".jsonl",
+            page_size=settings.listing_page_size,
+        ):
+            text = self.minio_mgr.download_object(obj["object_name"], as_text=True)
+            for line in (text or "").splitlines():
+                if line:
+                    yield json.loads(line)
+
+    def committed_sources(self) -> Iterator[str]:
+        """
+        Yield the source keys already stored in a shard.
+
+        Returns:
+            Iterator of markdown object keys
+        """
+        for entry in self.iter_manifest():
+            yield entry["source"]
+
+    def read_shard(self, shard_key: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the records of a shard.
+
+        Args:
+            shard_key: Shard object key
+
+        Returns:
+            Iterator of {"source", "data"}
+        """
+        body = self.minio_mgr.download_object(shard_key, as_text=False)
+        if body is None:
+            return
+        compression = "zstd" if shard_key.endswith(SHARD_SUFFIXES["zstd"]) else "gzip"
+        for line in decompress(body, compression).splitlines():
+            if line:
+                yield json.loads(line)
+
+
+def result_sink_from_settings(
+    minio_mgr: MinIOManager,
+    on_commit: Optional[
+        Callable[[List[str], List[Optional[Dict[str, str]]]], None]
+    ] = None,
+) -> Optional[ShardedResultSink]:
+    """
+    Create the result sink configured in settings.
+
+    Args:
+        minio_mgr: MinIOManager used for uploads
+        on_commit: Called with the source keys of each written shard and
+            their metadata
+
+    Returns:
+        ShardedResultSink, or None for one JSON object per page
+    """
+    if settings.result_sink == "json":
+        return None
+    if settings.result_sink != "jsonl":
+        raise ValueError(
+            f"Unknown RESULT_SINK '{settings.result_sink}' (expected json or jsonl)"
+        )
+
+    return ShardedResultSink(
+        minio_mgr,
+        prefix=settings.result_sink_prefix,
+        compression=settings.result_sink_compression,
+        max_records=settings.result_sink_shard_max_records,
+        max_bytes=settings.result_sink_shard_max_bytes,
+        on_commit=on_commit,
+    )
@@ -2,12 +2,50 @@
 Retry logic and error handling utilities.
 """
 
+import asyncio
 import functools
+import inspect
+import threading
 import time
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, Optional
 
 from src.config.settings import settings
 from src.modules.logger import logger
+from src.modules.tracing import span
+
+
+class RetryCounter:
+    """
+    Thread-safe counts of retried and exhausted calls per function.
+    """
+
+    def __init__(self):
+        """Initialize empty counters."""
+        self._lock = threading.Lock()
+        self.retries: Dict[str, int] = {}
+        self.failures: Dict[str, int] = {}
+
+    def record(self, name: str, exhausted: bool):
+        """
+        Count one failed attempt.
+
+        Args:
+            name: Name of the retried function
+            exhausted: True if no attempts are left
+        """
+        counts = self.failures if exhausted else self.retries
+        with self._lock:
+            counts[name] = counts.get(name, 0) + 1
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        """
+        Copy the current counts.
+
+        Returns:
+            {"retries": {name: count}, "failures": {name: count}}
+        """
+        with self._lock:
+            return {"retries": dict(self.retries), "failures": dict(self.failures)}
 
 
 def retry_with_backoff(
@@ -19,6 +57,9 @@ def retry_with_backoff(
     """
     Decorator for retrying functions with exponential backoff.
 
+    Coroutine functions are supported and back off with asyncio.sleep, so
+    retries never block the event loop.
+
     Args:
         max_retries: Maximum number of retry attempts (default from settings)
         delay: Initial delay in seconds (default from settings)
@@ -33,7 +74,45 @@ def retry_with_backoff(
     if delay is None:
         delay = settings.extraction_retry_delay
 
+    def log_failure(func: Callable, attempt: int, error: Exception, wait: float):
+        retry_counter.record(func.__name__, exhausted=attempt >= max_retries)
+        if attempt < max_retries:
+            logger.warning(
+                f"Attempt {attempt + 1}/{max_retries + 1} failed for {func.__name__}: {error}"
+            )
+            logger.info(f"Retrying in {wait} seconds...")
+        else:
+            logger.error(
+                f"All {max_retries + 1} attempts failed for {func.__name__}: {error}"
+            )
+
     def decorator(func: Callable) -> Callable:
+        name = func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                current_delay = delay
+                last_exception = None
+
+                for attempt in range(max_retries + 1):
+                    try:
+                        with span("retry.attempt", function=name, attempt=attempt + 1):
+                            return await func(*args, **kwargs)
+                    except exceptions as e:
+                        last_exception = e
+                        log_failure(func, attempt, e, current_delay)
+
+                        if attempt < max_retries:
+                            with span("retry.backoff", seconds=current_delay):
+                                await asyncio.sleep(current_delay)
+                            current_delay *= backoff_factor
+
+                raise last_exception
+
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
             current_delay = delay
@@ -41,21 +120,16 @@ def retry_with_backoff(
 
             for attempt in range(max_retries + 1):
                 try:
-                    return func(*args, **kwargs)
+                    with span("retry.attempt", function=name, attempt=attempt + 1):
+                        return func(*args, **kwargs)
                 except exceptions as e:
                     last_exception = e
+                    log_failure(func, attempt, e, current_delay)
 
                     if attempt < max_retries:
-                        logger.warning(
-                            f"Attempt {attempt + 1}/{max_retries + 1} failed for {func.__name__}: {e}"
-                        )
-                        logger.info(f"Retrying in {current_delay} seconds...")
-                        time.sleep(current_delay)
+                        with span("retry.backoff", seconds=current_delay):
+                            time.sleep(current_delay)
                         current_delay *= backoff_factor
-                    else:
-                        logger.error(
-                            f"All {max_retries + 1} attempts failed for {func.__name__}: {e}"
-                        )
 
             raise last_exception
 
@@ -64,15 +138,75 @@ def retry_with_backoff(
     return decorator
 
 
+def estimate_tokens(text: str) -> int:
+    """
+    Roughly estimate the number of LLM input tokens for a text.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Estimated token count (about four characters per token)
+    """
+    return len(text) // 4 + 1
+
+
+class _TokenBucket:
+    """
+    Token bucket that may go into debt to hand out future reservations.
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float, now: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.tokens = capacity
+        self.updated_at = now
+
+    def _refill(self, now: float):
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(
+                self.capacity, self.tokens + elapsed * self.refill_per_second
+            )
+            self.updated_at = now
+
+    def delay_for(self, amount: float, now: float) -> float:
+        """Seconds until `amount` tokens are available, without consuming."""
+        self._refill(now)
+        deficit = min(amount, self.capacity) - self.tokens
+        return max(deficit / self.refill_per_second, 0.0)
+
+    def resize(self, capacity: float, refill_per_second: float, now: float):
+        """Change the budget, keeping at most the new capacity in the bucket."""
+        self._refill(now)
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.tokens = min(self.tokens, capacity)
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Take `amount` tokens, going into debt if needed; return the wait."""
+        self._refill(now)
+        self.tokens -= min(amount, self.capacity)
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.refill_per_second
+
+
 class RateLimiter:
     """
-    Simple rate limiter to control request frequency.
+    Thread-safe token-bucket rate limiter for LLM requests.
+
+    Meters requests per minute and, optionally, estimated input tokens per
+    minute. Callers reserve budget under a short lock and then sleep outside
+    of it until exactly the moment their reservation becomes valid, so
+    concurrent workers are released one by one instead of in bursts.
     """
 
     def __init__(
         self,
         requests_per_minute: Optional[int] = None,
-        delay_between_requests: Optional[int] = None,
+        delay_between_requests: Optional[float] = None,
+        tokens_per_minute: Optional[int] = None,
     ):
         """
         Initialize rate limiter.
@@ -80,46 +214,147 @@ class RateLimiter:
         Args:
             requests_per_minute: Maximum requests per minute
             delay_between_requests: Minimum delay between requests in seconds
+            tokens_per_minute: Maximum estimated input tokens per minute (0 disables)
         """
         self.requests_per_minute = (
             requests_per_minute or settings.rate_limit_requests_per_minute
         )
         self.delay_between_requests = (
-            delay_between_requests or settings.rate_limit_delay_between_requests
+            delay_between_requests
+            if delay_between_requests is not None
+            else settings.rate_limit_delay_between_requests
+        )
+        self._configured_delay = self.delay_between_requests
+        self.tokens_per_minute = (
+            tokens_per_minute
+            if tokens_per_minute is not None
+            else settings.rate_limit_tokens_per_minute
+        )
+
+        now = time.monotonic()
+        self._lock = threading.Lock()
+        self._requests = _TokenBucket(
+            self.requests_per_minute, self.requests_per_minute / 60, now
         )
-        self.last_request_time = 0
-        self.request_count = 0
-        self.minute_start = time.time()
+        self._tokens = (
+            _TokenBucket(self.tokens_per_minute, self.tokens_per_minute / 60, now)
+            if self.tokens_per_minute
+            else None
+        )
+        self._next_slot = now
+
+    def _delay_for(self, tokens: int, now: float) -> float:
+        """Seconds until a request of `tokens` fits every budget."""
+        delay = max(
+            self._requests.delay_for(1, now),
+            self._next_slot - now,
+        )
+        if self._tokens is not None and tokens:
+            delay = max(delay, self._tokens.delay_for(tokens, now))
+        return max(delay, 0.0)
+
+    def reserve(self, tokens: int = 0) -> float:
+        """
+        Reserve budget for one request without blocking.
 
-    def wait_if_needed(self):
+        Args:
+            tokens: Estimated input tokens of the request
+
+        Returns:
+            Seconds the caller must wait before sending the request
         """
-        Wait if rate limit is reached.
+        with self._lock:
+            now = time.monotonic()
+            delay = max(self._requests.reserve(1, now), self._next_slot - now)
+            if self._tokens is not None and tokens:
+                delay = max(delay, self._tokens.reserve(tokens, now))
+
+            delay = max(delay, 0.0)
+            self._next_slot = now + delay + self.delay_between_requests
+            return delay
+
+    def set_requests_per_minute(self, requests_per_minute: int):
         """
-        current_time = time.time()
+        Change the request rate of a running limiter.
 
-        # Reset counter every minute
-        if current_time - self.minute_start >= 60:
-            self.request_count = 0
-            self.minute_start = current_time
+        The spacing between requests shrinks to 60 / requests_per_minute if
+        the configured delay would cap the rate below the new one.
+        Reservations already handed out keep their slots.
 
-        # Check requests per minute limit
-        if self.request_count >= self.requests_per_minute:
-            sleep_time = 60 - (current_time - self.minute_start)
-            if sleep_time > 0:
-                logger.info(f"Rate limit reached. Waiting {sleep_time:.1f} seconds...")
-                time.sleep(sleep_time)
-                self.request_count = 0
-                self.minute_start = time.time()
+        Args:
+            requests_per_minute: New maximum requests per minute
+        """
+        with self._lock:
+            self.requests_per_minute = requests_per_minute
+            self.delay_between_requests = min(
+                self._configured_delay, 60 / requests_per_minute
+            )
+            self._requests.resize(
+                requests_per_minute, requests_per_minute / 60, time.monotonic()
+            )
 
-        # Check delay between requests
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.delay_between_requests:
-            sleep_time = self.delay_between_requests - time_since_last
-            time.sleep(sleep_time)
+    def can_proceed(self, tokens: int = 0) -> bool:
+        """
+        Check whether a request could be sent right now.
 
-        self.last_request_time = time.time()
-        self.request_count += 1
+        Args:
+            tokens: Estimated input tokens of the request
+
+        Returns:
+            True if no waiting would be required
+        """
+        with self._lock:
+            return self._delay_for(tokens, time.monotonic()) == 0
+
+    def record_request(self, tokens: int = 0):
+        """
+        Record a request that was sent without calling wait_if_needed().
+
+        Args:
+            tokens: Estimated input tokens of the request
+        """
+        self.reserve(tokens)
+
+    def wait_if_needed(self, tokens: int = 0) -> float:
+        """
+        Block until the request budget allows another request.
+
+        Args:
+            tokens: Estimated input tokens of the request
+
+        Returns:
+            Seconds spent waiting
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            if delay >= 5:
+                logger.info(f"Rate limit reached. Waiting {delay:.1f} seconds...")
+            time.sleep(delay)
+        return delay
+
+    async def async_wait_if_needed(self, tokens: int = 0) -> float:
+        """
+        Asynchronously wait until the request budget allows another request.
+
+        Shares its budget with wait_if_needed(), so thread-based and asyncio
+        callers are metered together.
+
+        Args:
+            tokens: Estimated input tokens of the request
+
+        Returns:
+            Seconds spent waiting
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            if delay >= 5:
+                logger.info(f"Rate limit reached. Waiting {delay:.1f} seconds...")
+            await asyncio.sleep(delay)
+        return delay
 
 
 # Global rate limiter instance
 rate_limiter = RateLimiter()
+
+# Global retry counts (exported as metrics)
+retry_counter = RetryCounter()
@@ -0,0 +1,164 @@
+"""
+Crash-safe journal of per-object progress for the batch runners.
+
+The presence of a `.about.json` result is not enough to resume a run: an
+LLM result computed just before a crash (or a failed upload) would be lost
+and paid for again. The journal records every object's state together with
+the extracted payload, so a restarted run re-uploads pending results
+without calling the LLM and skips finished objects without touching MinIO.
+
+The journal is a SQLite database in WAL mode with synchronous=NORMAL: every
+state change is committed (and survives a process crash), while fsyncs are
+batched into WAL checkpoints.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from src.config.settings import settings
+
+# Object states, in pipeline order
+LISTED = "listed"
+DOWNLOADED = "downloaded"
+EXTRACTED = "extracted"
+UPLOADED = "uploaded"
+
+
+class RunJournal:
+    """
+    SQLite-backed, thread-safe journal of object states.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open (or create) the journal database.
+
+        Args:
+            path: SQLite file location
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS objects (
+                object_name TEXT PRIMARY KEY,
+                state TEXT NOT NULL,
+                payload TEXT,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_objects_state ON objects (state)"
+        )
+        self._conn.commit()
+
+    def mark_listed(self, object_name: str):
+        """
+        Record a listed object unless it already has a later state.
+
+        Args:
+            object_name: Markdown object key
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO objects (object_name, state, updated_at) "
+                "VALUES (?, ?, ?)",
+                (object_name, LISTED, time.time()),
+            )
+            self._conn.commit()
+
+    def record(
+        self, object_name: str, state: str, payload: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Record a state change.
+
+        Args:
+            object_name: Markdown object key
+            state: New state (DOWNLOADED, EXTRACTED or UPLOADED)
+            payload: Extracted result (kept until the upload is recorded)
+        """
+        value = json.dumps(payload, ensure_ascii=False) if payload is not None else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO objects "
+                "(object_name, state, payload, updated_at) VALUES (?, ?, ?, ?)",
+                (object_name, state, value, time.time()),
+            )
+            self._conn.commit()
+
+    def get(self, object_name: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Look up an object.
+
+        Args:
+            object_name: Markdown object key
+
+        Returns:
+            Tuple of (state, payload), (None, None) for unknown objects
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT state, payload FROM objects WHERE object_name = ?",
+                (object_name,),
+            ).fetchone()
+        if row is None:
+            return None, None
+        return row[0], json.loads(row[1]) if row[1] is not None else None
+
+    def pending_uploads(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Yield extracted results whose upload was never recorded.
+
+        Returns:
+            Iterator of (object_name, payload)
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT object_name, payload FROM objects WHERE state = ? "
+                "ORDER BY object_name",
+                (EXTRACTED,),
+            ).fetchall()
+        for object_name, payload in rows:
+            yield object_name, json.loads(payload)
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Count objects per state.
+
+        Returns:
+            {state: count}
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT state, COUNT(*) FROM objects GROUP BY state"
+            ).fetchall()
+        return dict(rows)
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def run_journal_from_settings() -> Optional[RunJournal]:
+    """
+    Create the journal configured in settings.
+
+    Returns:
+        RunJournal instance, or None if the journal is disabled
+    """
+    if not settings.run_journal_enabled:
+        return None
+
+    return RunJournal(settings.run_journal_path)
@@ -0,0 +1,299 @@
+"""
+In-memory index of already extracted objects.
+
+Replaces one stat_object round trip per markdown file with a single
+streaming listing of existing `.about.json` results. The index can be
+persisted to a local file so later runs skip the listing entirely.
+
+Results carry their provenance as user metadata: the ETag and modification
+time of the source markdown and the fingerprint of the extraction config
+(prompt, examples, model). In incremental mode the index lists results with
+their metadata, so whether a result is still current is decided by
+comparing two listings, without a request per object.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from src.config.settings import settings
+from src.modules.logger import logger
+from src.modules.minio_manager import MinIOManager
+
+RESULT_SUFFIX = ".about.json"
+
+# User metadata keys of a result object
+SOURCE_ETAG = "source-etag"
+SOURCE_LAST_MODIFIED = "source-last-modified"
+FINGERPRINT = "extraction-fingerprint"
+
+# (source ETag, extraction fingerprint) a result was produced from
+Provenance = Tuple[str, str]
+
+
+def provenance_metadata(source: Dict[str, Any], fingerprint: str) -> Dict[str, str]:
+    """
+    Build the user metadata recording what a result was extracted from.
+
+    Args:
+        source: Listing entry of the source markdown (iter_objects)
+        fingerprint: Extraction config fingerprint
+
+    Returns:
+        {SOURCE_ETAG, SOURCE_LAST_MODIFIED, FINGERPRINT}
+    """
+    last_modified = source.get("last_modified")
+    return {
+        SOURCE_ETAG: source.get("etag") or "",
+        SOURCE_LAST_MODIFIED: last_modified.isoformat() if last_modified else "",
+        FINGERPRINT: fingerprint,
+    }
+
+
+def parse_provenance(metadata: Optional[Dict[str, str]]) -> Optional[Provenance]:
+    """
+    Read the provenance from a result's user metadata.
+
+    Args:
+        metadata: Metadata from a listing or provenance_metadata(); keys may
+            carry the "X-Amz-Meta-" prefix in any case
+
+    Returns:
+        (source ETag, fingerprint), or None for results without provenance
+    """
+    if not metadata:
+        return None
+    meta = {
+        key.lower().removeprefix("x-amz-meta-"): value
+        for key, value in metadata.items()
+    }
+    if FINGERPRINT not in meta:
+        return None
+    return meta.get(SOURCE_ETAG, ""), meta[FINGERPRINT]
+
+
+class CompletedIndex:
+    """
+    Thread-safe set of result object keys that already exist.
+
+    With a fingerprint (incremental mode) the index also keeps each
+    result's provenance and only treats results as done whose source and
+    extraction config are unchanged.
+    """
+
+    def __init__(
+        self,
+        keys: Optional[Iterable[str]] = None,
+        persist_path: Optional[str] = None,
+        provenance: Optional[Dict[str, Provenance]] = None,
+        fingerprint: Optional[str] = None,
+        refresh_unversioned: bool = False,
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            keys: Initial result object keys
+            persist_path: Local file that newly completed keys are appended to
+            provenance: Provenance of results by key (incremental mode)
+            fingerprint: Current extraction config fingerprint; enables
+                incremental mode
+            refresh_unversioned: In incremental mode, also redo results
+                written without provenance
+        """
+        self._keys = set(keys or ())
+        self._provenance: Dict[str, Provenance] = dict(provenance or {})
+        self._keys.update(self._provenance)
+        self._lock = threading.Lock()
+        self.persist_path = persist_path
+        self.fingerprint = fingerprint
+        self.refresh_unversioned = refresh_unversioned
+        self._persist_file = None
+
+        if persist_path:
+            Path(persist_path).parent.mkdir(parents=True, exist_ok=True)
+            # Held open for appends from every worker; closed by close()
+            self._persist_file = open(persist_path, "a", encoding="utf-8")  # noqa: SIM115
+
+    @classmethod
+    def build(
+        cls,
+        minio_mgr: MinIOManager,
+        prefix: str = "",
+        persist_path: Optional[str] = None,
+        refresh: bool = False,
+        fingerprint: Optional[str] = None,
+        refresh_unversioned: bool = False,
+    ) -> "CompletedIndex":
+        """
+        Build the index from a persisted snapshot or one bucket listing.
+
+        Args:
+            minio_mgr: MinIOManager used for the listing
+            prefix: Prefix to list result objects under
+            persist_path: Local snapshot file (None disables persistence)
+            refresh: Ignore an existing snapshot and relist the bucket
+            fingerprint: Current extraction config fingerprint (enables
+                incremental mode; results are listed with their metadata)
+            refresh_unversioned: In incremental mode, also redo results
+                written without provenance
+
+        Returns:
+            Populated CompletedIndex
+        """
+        options = {
+            "fingerprint": fingerprint,
+            "refresh_unversioned": refresh_unversioned,
+        }
+
+        if persist_path and not refresh and os.path.exists(persist_path):
+            keys, provenance = cls._read_snapshot(persist_path)
+            logger.info(f"📇 Loaded {len(keys)} completed keys from {persist_path}")
+            return cls(keys, persist_path, provenance, **options)
+
+        keys = set()
+        provenance = {}
+        for obj in minio_mgr.iter_objects(
+            prefix=prefix,
+            suffix=RESULT_SUFFIX,
+            page_size=settings.listing_page_size,
+            include_user_meta=fingerprint is not None,
+        ):
+            keys.add(obj["object_name"])
+            recorded = parse_provenance(obj.get("metadata"))
+            if recorded is not None:
+                provenance[obj["object_name"]] = recorded
+        logger.info(f"📇 Indexed {len(keys)} existing results under '{prefix}'")
+
+        if persist_path:
+            cls._write_snapshot(persist_path, keys, provenance)
+
+        return cls(keys, persist_path, provenance, **options)
+
+    @staticmethod
+    def _read_snapshot(path: str) -> Tuple[set, Dict[str, Provenance]]:
+        """Read keys and provenance; later lines override earlier ones."""
+        keys = set()
+        provenance = {}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                fields = line.rstrip("\n").split("\t")
+                if not fields[0]:
+                    continue
+                keys.add(fields[0])
+                if len(fields) == 3:
+                    provenance[fields[0]] = (fields[1], fields[2])
+                else:
+                    provenance.pop(fields[0], None)
+        return keys, provenance
+
+    @staticmethod
+    def _snapshot_line(key: str, provenance: Optional[Provenance]) -> str:
+        if provenance is None:
+            return f"{key}\n"
+        return f"{key}\t{provenance[0]}\t{provenance[1]}\n"
+
+    @classmethod
+    def _write_snapshot(
+        cls,
+        path: str,
+        keys: Iterable[str],
+        provenance: Optional[Dict[str, Provenance]] = None,
+    ):
+        """Atomically replace the snapshot file with the given keys."""
+        provenance = provenance or {}
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for key in keys:
+                f.write(cls._snapshot_line(key, provenance.get(key)))
+        os.replace(tmp_path, path)
+
+    @property
+    def incremental(self) -> bool:
+        """Whether results are checked against their provenance."""
+        return self.fingerprint is not None
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def is_current(self, key: str, source: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Check whether a result exists and needs no re-extraction.
+
+        Args:
+            key: Result object key
+            source: Listing entry of the source markdown (with "etag")
+
+        Returns:
+            True if the result exists and, in incremental mode, was produced
+            from the listed source version with the current config
+        """
+        if key not in self._keys:
+            return False
+        if not self.incremental or source is None:
+            return True
+
+        recorded = self._provenance.get(key)
+        if recorded is None:
+            return not self.refresh_unversioned
+        return recorded == (source.get("etag") or "", self.fingerprint)
+
+    def add(self, key: str, metadata: Optional[Dict[str, str]] = None):
+        """
+        Mark a result key as completed.
+
+        Args:
+            key: Result object key that was just written
+            metadata: Provenance metadata the result was written with
+        """
+        provenance = parse_provenance(metadata)
+        with self._lock:
+            if key in self._keys and self._provenance.get(key) == provenance:
+                return
+            self._keys.add(key)
+            if provenance is not None:
+                self._provenance[key] = provenance
+            else:
+                self._provenance.pop(key, None)
+            if self._persist_file:
+                self._persist_file.write(self._snapshot_line(key, provenance))
+                self._persist_file.flush()
+
+    def close(self):
+        """Close the snapshot file."""
+        with self._lock:
+            if self._persist_file:
+                self._persist_file.close()
+                self._persist_file = None
+
+
+def completed_index_from_settings(
+    minio_mgr: MinIOManager,
+    prefix: str = "scraped-content/",
+    fingerprint: Optional[str] = None,
+) -> CompletedIndex:
+    """
+    Build the index of existing results configured in settings.
+
+    Args:
+        minio_mgr: MinIOManager used for the listing
+        prefix: Prefix to list result objects under
+        fingerprint: Extraction config fingerprint of the runner's extractor
+            (used only if INCREMENTAL_ENABLED is on)
+
+    Returns:
+        Populated CompletedIndex
+    """
+    return CompletedIndex.build(
+        minio_mgr,
+        prefix=prefix,
+        persist_path=settings.skip_index_path,
+        refresh=settings.skip_index_refresh,
+        fingerprint=fingerprint if settings.incremental_enabled else None,
+        refresh_unversioned=settings.incremental_refresh_unversioned,
+    )
@@ -3,10 +3,137 @@ Statistics tracking and reporting for extraction pipeline.
 """
 
 import json
+import math
+import threading
 import time
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator
+
+from src.modules.logger import logger
+
+# Pipeline stages with their own latency histogram
+STAGES = (
+    "list",
+    "stat",
+    "download",
+    "rate_limit_wait",
+    "concurrency_wait",
+    "llm_call",
+    "validation",
+    "upload",
+)
+
+# Per-file trim records kept for the stats file; later files are only logged
+TRIM_DETAILS_LIMIT = 1000
+
+# Adaptive concurrency steps kept for the stats file; older steps are dropped
+TRAJECTORY_LIMIT = 1000
+
+
+class LatencyHistogram:
+    """
+    Thread-safe latency histogram with fixed memory.
+
+    Samples fall into log-spaced buckets (about 9% wide, from 0.1 ms to
+    about an hour), so percentiles are accurate to one bucket however many
+    samples are recorded.
+    """
+
+    MIN_SECONDS = 1e-4
+    GROWTH = 2**0.125
+    BUCKETS = 200
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self._lock = threading.Lock()
+        self._counts = [0] * (self.BUCKETS + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        """
+        Add one sample.
+
+        Args:
+            seconds: Observed latency
+        """
+        if seconds <= self.MIN_SECONDS:
+            bucket = 0
+        else:
+            bucket = 1 + int(math.log(seconds / self.MIN_SECONDS, self.GROWTH))
+            bucket = min(bucket, self.BUCKETS)
+
+        with self._lock:
+            self._counts[bucket] += 1
+            self.count += 1
+            self.total += seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    def percentile(self, p: float) -> float:
+        """
+        Estimate a percentile.
+
+        Args:
+            p: Percentile between 0 and 100
+
+        Returns:
+            Upper bound of the bucket holding the percentile, in seconds
+        """
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = max(1, math.ceil(p / 100 * self.count))
+            seen = 0
+            for bucket, count in enumerate(self._counts):
+                seen += count
+                if seen >= rank and bucket < self.BUCKETS:
+                    upper = self.MIN_SECONDS * self.GROWTH**bucket
+                    return min(upper, self.max)
+            # Only the overflow bucket is left
+            return self.max
+
+    def count_le(self, seconds: float) -> int:
+        """
+        Count samples in buckets whose upper bound is at most `seconds`.
+
+        Args:
+            seconds: Bucket boundary
+
+        Returns:
+            Cumulative sample count (exact up to bucket resolution)
+        """
+        with self._lock:
+            total = 0
+            for bucket, count in enumerate(self._counts[: self.BUCKETS]):
+                if self.MIN_SECONDS * self.GROWTH**bucket > seconds:
+                    break
+                total += count
+            return total
+
+    def mean(self) -> float:
+        """Average latency in seconds."""
+        return self.total / self.count if self.count else 0.0
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Summarize the histogram.
+
+        Returns:
+            {count, mean, p50, p90, p99, max} with latencies in milliseconds
+        """
+        return {
+            "count": self.count,
+            "mean": round(self.mean() * 1000, 3),
+            "p50": round(self.percentile(50) * 1000, 3),
+            "p90": round(self.percentile(90) * 1000, 3),
+            "p99": round(self.percentile(99) * 1000, 3),
+            "max": round(self.max * 1000, 3),
+        }
 
 
 class ExtractionStatistics:
@@ -20,30 +147,190 @@ class ExtractionStatistics:
         self.total_files = 0
         self.successful = 0
         self.skipped = 0
+        self.refreshed = 0
+        self.claimed_elsewhere = 0
         self.errors = 0
         self.error_details = []
-        self.processing_times = []
+        self.listing_error = None  # Set if the listing stopped early
+        self.processing_latency = LatencyHistogram()
+        self.stage_latency = {stage: LatencyHistogram() for stage in STAGES}
+        self.in_flight = {stage: 0 for stage in STAGES}
+        self._lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_time_saved = 0.0
+        self.chars_original = 0
+        self.chars_sent = 0
+        self.trimmed_files = 0
+        self.trim_details = []  # First TRIM_DETAILS_LIMIT files
+        self.fields_resolved_locally = 0
+        self.llm_calls_skipped = 0
+        self.batched_calls = 0
+        self.batched_documents = 0
+        self.batch_fallbacks = 0
+        self.replayed_uploads = 0
+        self.concurrency_trajectory = deque(maxlen=TRAJECTORY_LIMIT)
+        self.concurrency_increases = 0
+        self.concurrency_decreases = 0
+        self.concurrency_min_limit = None
+        self.concurrency_max_limit = None
+
+    def record_listed(self, count: int = 1):
+        """Record listed files."""
+        with self._lock:
+            self.total_files += count
 
     def record_success(self, processing_time: float = 0):
         """Record a successful extraction."""
-        self.successful += 1
+        with self._lock:
+            self.successful += 1
         if processing_time > 0:
-            self.processing_times.append(processing_time)
+            self.processing_latency.record(processing_time)
+
+    def record_lost(self, file_name: str, error: str):
+        """Turn a recorded success into an error (its result was not stored)."""
+        with self._lock:
+            self.successful -= 1
+        self.record_error(file_name, error)
 
     def record_skip(self):
         """Record a skipped file."""
-        self.skipped += 1
+        with self._lock:
+            self.skipped += 1
+
+    def record_refresh(self):
+        """Record a stale result that is re-extracted (incremental mode)."""
+        with self._lock:
+            self.refreshed += 1
+
+    def record_claimed_elsewhere(self):
+        """Record an object left to the node holding its lease."""
+        with self._lock:
+            self.claimed_elsewhere += 1
+
+    def record_stage(self, stage: str, seconds: float):
+        """Record the latency of one pipeline stage (see STAGES)."""
+        self.stage_latency[stage].record(seconds)
+
+    @contextmanager
+    def time_stage(self, stage: str) -> Iterator[None]:
+        """Record the wall-clock time of the enclosed block under `stage`."""
+        with self._lock:
+            self.in_flight[stage] += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_latency[stage].record(time.perf_counter() - start)
+            with self._lock:
+                self.in_flight[stage] -= 1
+
+    def record_cache_hit(self, saved_time: float = 0):
+        """Record an extraction served from cache instead of the LLM."""
+        with self._lock:
+            self.cache_hits += 1
+            self.cache_time_saved += saved_time
+
+    def record_cache_miss(self):
+        """Record an extraction that required an LLM call."""
+        with self._lock:
+            self.cache_misses += 1
+
+    def record_trim(self, file_name: str, original_chars: int, kept_chars: int):
+        """Record how much of a page the Impressum locator kept."""
+        ratio = round(1 - kept_chars / original_chars, 4) if original_chars else 0.0
+        with self._lock:
+            self.chars_original += original_chars
+            self.chars_sent += kept_chars
+            self.trimmed_files += 1
+            if len(self.trim_details) < TRIM_DETAILS_LIMIT:
+                self.trim_details.append(
+                    {
+                        "file": file_name,
+                        "original_chars": original_chars,
+                        "kept_chars": kept_chars,
+                        "reduction_ratio": ratio,
+                    }
+                )
+        logger.debug(f"✂️  {file_name}: kept {kept_chars}/{original_chars} chars")
+
+    def record_fast_path(self, resolved_fields: int, skipped_llm: bool):
+        """Record contact fields resolved by the regex fast path."""
+        with self._lock:
+            self.fields_resolved_locally += resolved_fields
+            if skipped_llm:
+                self.llm_calls_skipped += 1
+
+    def record_batch(self, documents: int, fallbacks: int):
+        """Record a packed multi-document LLM call."""
+        with self._lock:
+            self.batched_calls += 1
+            self.batched_documents += documents
+            self.batch_fallbacks += fallbacks
+
+    def record_replay(self):
+        """Record a journaled result uploaded without a new LLM call."""
+        with self._lock:
+            self.replayed_uploads += 1
+
+    def record_concurrency(self, limit: int, requests_per_minute: int, reason: str):
+        """Record a step of the adaptive LLM concurrency and request rate."""
+        with self._lock:
+            if reason == "increase":
+                self.concurrency_increases += 1
+            elif reason != "start":
+                self.concurrency_decreases += 1
+            if self.concurrency_min_limit is None:
+                self.concurrency_min_limit = self.concurrency_max_limit = limit
+            self.concurrency_min_limit = min(self.concurrency_min_limit, limit)
+            self.concurrency_max_limit = max(self.concurrency_max_limit, limit)
+            self.concurrency_trajectory.append(
+                {
+                    "elapsed": round(time.time() - self.start_time, 3),
+                    "limit": limit,
+                    "requests_per_minute": requests_per_minute,
+                    "reason": reason,
+                }
+            )
+
+    def concurrency_summary(self) -> Dict[str, Any]:
+        """
+        Summarize the adaptive concurrency trajectory.
+
+        Returns:
+            {limit, requests_per_minute, min_limit, max_limit, increases,
+            decreases} (empty if the controller is disabled)
+        """
+        with self._lock:
+            if not self.concurrency_trajectory:
+                return {}
+            last = self.concurrency_trajectory[-1]
+            return {
+                "limit": last["limit"],
+                "requests_per_minute": last["requests_per_minute"],
+                "min_limit": self.concurrency_min_limit,
+                "max_limit": self.concurrency_max_limit,
+                "increases": self.concurrency_increases,
+                "decreases": self.concurrency_decreases,
+            }
+
+    def record_listing_failure(self, prefix: str, error: str):
+        """Record that the listing stopped early, leaving the run incomplete."""
+        with self._lock:
+            self.listing_error = str(error)
+        self.record_error(prefix, f"Listing failed: {error}")
 
     def record_error(self, file_name: str, error: str):
         """Record an error."""
-        self.errors += 1
-        self.error_details.append(
-            {
-                "file": file_name,
-                "error": str(error),
-                "timestamp": datetime.now().isoformat(),
-            }
-        )
+        with self._lock:
+            self.errors += 1
+            self.error_details.append(
+                {
+                    "file": file_name,
+                    "error": str(error),
+                    "timestamp": datetime.now().isoformat(),
+                }
+            )
 
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -53,21 +340,42 @@ class ExtractionStatistics:
             Dictionary with statistics
         """
         elapsed_time = time.time() - self.start_time
-        avg_time = (
-            sum(self.processing_times) / len(self.processing_times)
-            if self.processing_times
-            else 0
-        )
+        avg_time = self.processing_latency.mean()
+        cache_lookups = self.cache_hits + self.cache_misses
 
         return {
             "total_files": self.total_files,
             "successful": self.successful,
             "skipped": self.skipped,
+            "refreshed": self.refreshed,
+            "claimed_elsewhere": self.claimed_elsewhere,
             "errors": self.errors,
+            "complete": self.listing_error is None,
             "success_rate": f"{(self.successful / self.total_files * 100) if self.total_files > 0 else 0:.1f}%",
             "elapsed_time": f"{elapsed_time:.2f}s",
             "average_processing_time": f"{avg_time:.2f}s",
             "files_per_second": f"{self.total_files / elapsed_time if elapsed_time > 0 else 0:.2f}",
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_hit_rate": f"{(self.cache_hits / cache_lookups * 100) if cache_lookups > 0 else 0:.1f}%",
+            "cache_time_saved": f"{self.cache_time_saved:.2f}s",
+            "chars_original": self.chars_original,
+            "chars_sent": self.chars_sent,
+            "trimmed_files": self.trimmed_files,
+            "char_reduction": f"{(1 - self.chars_sent / self.chars_original) * 100 if self.chars_original > 0 else 0:.1f}%",
+            "fields_resolved_locally": self.fields_resolved_locally,
+            "llm_calls_skipped": self.llm_calls_skipped,
+            "batched_calls": self.batched_calls,
+            "batched_documents": self.batched_documents,
+            "batch_fallbacks": self.batch_fallbacks,
+            "replayed_uploads": self.replayed_uploads,
+            "concurrency": self.concurrency_summary(),
+            "processing_latency_ms": self.processing_latency.summary(),
+            "stage_latency_ms": {
+                stage: histogram.summary()
+                for stage, histogram in self.stage_latency.items()
+                if histogram.count
+            },
         }
 
     def print_summary(self):
@@ -80,12 +388,53 @@ class ExtractionStatistics:
         print(f"  📁 Total Files:          {summary['total_files']}")
         print(f"  ✅ Successful:           {summary['successful']}")
         print(f"  ⏭️  Skipped:              {summary['skipped']}")
+        if summary["refreshed"]:
+            print(f"  🔄 Re-extracted:         {summary['refreshed']}")
+        if summary["claimed_elsewhere"]:
+            print(f"  🔒 Claimed Elsewhere:    {summary['claimed_elsewhere']}")
         print(f"  ❌ Errors:               {summary['errors']}")
+        if not summary["complete"]:
+            print(f"  ⚠️  INCOMPLETE:           listing failed: {self.listing_error}")
         print(f"  📈 Success Rate:         {summary['success_rate']}")
         print("-" * 70)
         print(f"  ⏱️  Elapsed Time:         {summary['elapsed_time']}")
         print(f"  ⚡ Avg Processing Time:  {summary['average_processing_time']}")
         print(f"  🚀 Files/Second:         {summary['files_per_second']}")
+        print("-" * 70)
+        print(f"  💾 Cache Hits:           {summary['cache_hits']}")
+        print(f"  🔍 Cache Misses:         {summary['cache_misses']}")
+        print(f"  🎯 Cache Hit Rate:       {summary['cache_hit_rate']}")
+        print(f"  ⏳ LLM Time Saved:       {summary['cache_time_saved']}")
+        print(f"  ✂️  Input Reduction:      {summary['char_reduction']}")
+        print(f"  🧩 Fields via Regex:     {summary['fields_resolved_locally']}")
+        print(f"  🏎️  LLM Calls Skipped:    {summary['llm_calls_skipped']}")
+        if self.batched_calls:
+            print(
+                f"  📦 Batched Calls:        {summary['batched_calls']} "
+                f"({summary['batched_documents']} docs, "
+                f"{summary['batch_fallbacks']} fallbacks)"
+            )
+        if self.replayed_uploads:
+            print(f"  🔁 Replayed Uploads:     {summary['replayed_uploads']}")
+        if summary["concurrency"]:
+            concurrency = summary["concurrency"]
+            print(
+                f"  🚦 LLM Concurrency:      {concurrency['limit']} "
+                f"(range {concurrency['min_limit']}-{concurrency['max_limit']}, "
+                f"{concurrency['requests_per_minute']} req/min, "
+                f"+{concurrency['increases']}/-{concurrency['decreases']})"
+            )
+        if summary["stage_latency_ms"]:
+            print("-" * 70)
+            print(
+                f"  {'Stage (ms)':<18}{'count':>9}{'p50':>10}{'p90':>10}"
+                f"{'p99':>10}{'max':>10}"
+            )
+            for stage, row in summary["stage_latency_ms"].items():
+                print(
+                    f"  {stage:<18}{row['count']:>9}{row['p50']:>10.2f}"
+                    f"{row['p90']:>10.2f}{row['p99']:>10.2f}{row['max']:>10.2f}"
+                )
         print("=" * 70)
 
         if self.error_details:
@@ -109,6 +458,8 @@ class ExtractionStatistics:
         stats = {
             "summary": self.get_summary(),
             "error_details": self.error_details,
+            "trim_details": self.trim_details,
+            "concurrency_trajectory": list(self.concurrency_trajectory),
             "timestamp": datetime.now().isoformat(),
         }
 
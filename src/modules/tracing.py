@@ -0,0 +1,191 @@
+"""
+Lightweight span tracing in the Chrome trace event format.
+
+Spans around MinIO calls, rate-limit waits, retry attempts and LLM calls are
+written as complete ("X") events to a local JSON file that chrome://tracing,
+Perfetto (ui.perfetto.dev) or speedscope can open. Spans on one thread nest
+by time in the viewer; every span also records its parent span id, so the
+hierarchy survives thread pool and asyncio hand-offs.
+
+Tracing is off unless TRACE_ENABLED is set; entry points turn it on with
+tracing_from_settings() in main(), so importing an instrumented module never
+opens a trace file. A disabled span() returns a shared no-op context manager,
+so instrumented code pays one function call.
+"""
+
+import atexit
+import contextvars
+import itertools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, Iterator, List, Optional
+
+from src.config.settings import settings
+
+_NOOP = nullcontext()
+
+# Id of the innermost open span in the current thread or task
+_current_span: contextvars.ContextVar[Optional[int]] = contextvars.ContextVar(
+    "current_span", default=None
+)
+
+
+class Tracer:
+    """
+    Thread-safe writer of Chrome trace events.
+
+    Events are buffered and appended to the file in chunks. The file is a
+    JSON array that is closed on close(); trace viewers also accept the
+    unterminated array left behind by a crashed run.
+    """
+
+    def __init__(self, path: str, flush_every: int = 1000):
+        """
+        Open the trace file.
+
+        Args:
+            path: Output file (overwritten)
+            flush_every: Buffered events per write
+        """
+        self.path = path
+        self.flush_every = flush_every
+        self._lock = threading.Lock()
+        self._buffer: List[str] = []
+        self._ids = itertools.count(1)
+        self._pid = os.getpid()
+        self._origin = time.perf_counter()
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        # Held open across flushes; closed by close()
+        self._file = open(path, "w", encoding="utf-8")  # noqa: SIM115
+        self._file.write("[\n")
+
+    @contextmanager
+    def span(self, name: str, **args: Any) -> Iterator[None]:
+        """
+        Record the enclosed block as one span.
+
+        Args:
+            name: Span name (e.g. "minio.download")
+            **args: Attributes shown in the viewer
+        """
+        span_id = next(self._ids)
+        parent_id = _current_span.get()
+        token = _current_span.set(span_id)
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException as e:
+            args["error"] = type(e).__name__
+            raise
+        finally:
+            end = time.perf_counter()
+            _current_span.reset(token)
+            args["span_id"] = span_id
+            if parent_id is not None:
+                args["parent_id"] = parent_id
+            self._emit(
+                {
+                    "name": name,
+                    "cat": name.split(".", 1)[0],
+                    "ph": "X",
+                    "ts": round((start - self._origin) * 1e6, 1),
+                    "dur": round((end - start) * 1e6, 1),
+                    "pid": self._pid,
+                    "tid": threading.get_ident(),
+                    "args": args,
+                }
+            )
+
+    def _emit(self, event: dict):
+        """Buffer one event and write the buffer when it is full."""
+        line = json.dumps(event, ensure_ascii=False, default=str)
+        with self._lock:
+            self._buffer.append(line)
+            if len(self._buffer) >= self.flush_every:
+                self._flush()
+
+    def _flush(self):
+        if self._buffer and not self._file.closed:
+            self._file.write(",\n".join(self._buffer) + ",\n")
+            self._file.flush()
+            self._buffer = []
+
+    def close(self):
+        """Write buffered events and terminate the JSON array."""
+        with self._lock:
+            if self._file.closed:
+                return
+            self._flush()
+            # A process name event absorbs the trailing comma
+            meta = {
+                "name": "process_name",
+                "ph": "M",
+                "pid": self._pid,
+                "args": {"name": "extraction"},
+            }
+            self._file.write(json.dumps(meta) + "\n]\n")
+            self._file.close()
+
+
+_tracer: Optional[Tracer] = None
+
+
+def span(name: str, **args: Any):
+    """
+    Trace the enclosed block if tracing is enabled.
+
+    Args:
+        name: Span name (e.g. "minio.download")
+        **args: Attributes shown in the viewer
+
+    Returns:
+        Context manager (a shared no-op when tracing is disabled)
+    """
+    if _tracer is None:
+        return _NOOP
+    return _tracer.span(name, **args)
+
+
+def start_tracing(path: str) -> Tracer:
+    """
+    Enable tracing for this process.
+
+    Args:
+        path: Output trace file
+
+    Returns:
+        The active Tracer
+    """
+    global _tracer
+    stop_tracing()
+    _tracer = Tracer(path)
+    return _tracer
+
+
+def stop_tracing():
+    """Disable tracing and finish the trace file."""
+    global _tracer
+    if _tracer is not None:
+        _tracer.close()
+        _tracer = None
+
+
+def tracing_from_settings() -> Optional[Tracer]:
+    """
+    Enable tracing if TRACE_ENABLED is set.
+
+    The trace file is finished when the process exits.
+
+    Returns:
+        The active Tracer, or None when tracing is disabled
+    """
+    if not settings.trace_enabled:
+        return None
+    tracer = start_tracing(settings.trace_path)
+    atexit.register(stop_tracing)
+    return tracer
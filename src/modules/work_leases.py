@@ -0,0 +1,422 @@
+"""
+Lease-based claiming of objects across several runner nodes.
+
+Runners on different hosts list the same bucket; without coordination they
+would all extract the same pages. Before processing an object, a worker
+claims it with a short-lived lease, renews the lease while it works and
+releases it when done:
+
+- A lease is a small marker record {owner, state, expires_at, version}.
+  It is created only if none exists and replaced only if unchanged, so
+  exactly one node wins a race.
+- Held leases are renewed every third of the TTL. A node that crashes
+  stops renewing, and its objects become claimable once the lease expires.
+- A finished object leaves a "done" marker, so nodes whose skip index
+  predates the result do not extract it again. The marker records a version
+  (source ETag and config fingerprint in incremental mode); a newer version
+  can be claimed again. A failed object's lease is removed for a retry.
+
+Two stores are available. MinIOLeaseStore keeps markers as objects under
+LEASE_PREFIX and uses S3 conditional writes (If-None-Match / If-Match),
+for nodes on different hosts. SQLiteLeaseStore is for processes on one host
+and for tests. Expiry compares wall clocks of different hosts, so the TTL
+must be well above their clock skew.
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from src.config.settings import settings
+from src.modules.logger import logger
+from src.modules.minio_manager import MinIOManager
+from src.modules.statistics import ExtractionStatistics
+
+# Lease states
+HELD = "held"
+DONE = "done"
+
+LEASE_SUFFIX = ".lease"
+
+
+def default_owner() -> str:
+    """Identify this process uniquely (host, pid and a random suffix)."""
+    return f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+
+def _claimable(lease: Dict[str, Any], version: str, now: float) -> bool:
+    """Whether an existing lease record may be taken over."""
+    if lease.get("state") == DONE:
+        return lease.get("version", "") != version
+    return lease.get("expires_at", 0) <= now
+
+
+class MinIOLeaseStore:
+    """
+    Lease markers as MinIO objects, written with conditional PUTs.
+
+    Tokens are the ETags of the marker objects.
+    """
+
+    def __init__(self, minio_mgr: MinIOManager, prefix: str = "leases/"):
+        """
+        Initialize the store.
+
+        Args:
+            minio_mgr: MinIOManager of the bucket holding the markers
+            prefix: Object prefix of the markers
+        """
+        self.minio_mgr = minio_mgr
+        self.prefix = prefix
+
+    def _key(self, name: str) -> str:
+        return f"{self.prefix}{name}{LEASE_SUFFIX}"
+
+    @staticmethod
+    def _record(owner: str, state: str, expires_at: float, version: str) -> bytes:
+        return json.dumps(
+            {
+                "owner": owner,
+                "state": state,
+                "expires_at": expires_at,
+                "version": version,
+            }
+        ).encode("utf-8")
+
+    def acquire(
+        self, name: str, owner: str, ttl: float, version: str = ""
+    ) -> Optional[str]:
+        """
+        Claim an object.
+
+        Args:
+            name: Object key to claim
+            owner: Claiming node
+            ttl: Seconds until the lease expires unless renewed
+            version: Version of the work (a done marker of the same version
+                blocks the claim)
+
+        Returns:
+            Lease token, or None if the object is held or done elsewhere
+        """
+        key = self._key(name)
+        record = self._record(owner, HELD, time.time() + ttl, version)
+        token = self.minio_mgr.put_object_if(key, record)
+        if token is not None:
+            return token
+
+        current = self.minio_mgr.read_object(key)
+        if current is None:  # Released in the meantime
+            return self.minio_mgr.put_object_if(key, record)
+        data, etag = current
+        if not _claimable(json.loads(data), version, time.time()):
+            return None
+        return self.minio_mgr.put_object_if(key, record, etag)
+
+    def renew(
+        self, name: str, owner: str, token: str, ttl: float, version: str = ""
+    ) -> Optional[str]:
+        """
+        Extend a held lease.
+
+        Args:
+            name: Claimed object key
+            owner: Node holding the lease
+            token: Current lease token
+            ttl: Seconds from now until the lease expires
+            version: Version the lease was claimed with
+
+        Returns:
+            New lease token, or None if the lease was lost
+        """
+        record = self._record(owner, HELD, time.time() + ttl, version)
+        return self.minio_mgr.put_object_if(self._key(name), record, token)
+
+    def release(
+        self, name: str, owner: str, token: str, done: bool, version: str = ""
+    ) -> bool:
+        """
+        Give up a lease.
+
+        Args:
+            name: Claimed object key
+            owner: Node holding the lease
+            token: Current lease token
+            done: Leave a done marker (else remove the lease for a retry)
+            version: Version the lease was claimed with
+
+        Returns:
+            True if the lease was still held by this token
+        """
+        key = self._key(name)
+        if done:
+            record = self._record(owner, DONE, 0, version)
+            return self.minio_mgr.put_object_if(key, record, token) is not None
+
+        # S3 has no conditional delete; checking the ETag first narrows the race
+        current = self.minio_mgr.read_object(key)
+        if current is None or current[1] != token:
+            return False
+        return self.minio_mgr.remove_object(key)
+
+
+class SQLiteLeaseStore:
+    """
+    Lease records in a SQLite table, for processes on one host and tests.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open (or create) the lease database.
+
+        Args:
+            path: SQLite file location
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None, timeout=30
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS leases (
+                name TEXT PRIMARY KEY,
+                owner TEXT NOT NULL,
+                state TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                version TEXT NOT NULL,
+                token TEXT NOT NULL
+            )
+            """
+        )
+
+    def acquire(
+        self, name: str, owner: str, ttl: float, version: str = ""
+    ) -> Optional[str]:
+        """Claim an object (see MinIOLeaseStore.acquire)."""
+        token = uuid.uuid4().hex
+        with self._lock:
+            # BEGIN IMMEDIATE serializes claims of concurrent processes
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT state, expires_at, version FROM leases WHERE name = ?",
+                    (name,),
+                ).fetchone()
+                now = time.time()
+                if row is not None and not _claimable(
+                    {"state": row[0], "expires_at": row[1], "version": row[2]},
+                    version,
+                    now,
+                ):
+                    token = None
+                else:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO leases VALUES (?, ?, ?, ?, ?, ?)",
+                        (name, owner, HELD, now + ttl, version, token),
+                    )
+            finally:
+                self._conn.execute("COMMIT")
+        return token
+
+    def renew(
+        self, name: str, owner: str, token: str, ttl: float, version: str = ""
+    ) -> Optional[str]:
+        """Extend a held lease (see MinIOLeaseStore.renew)."""
+        new_token = uuid.uuid4().hex
+        with self._lock:
+            cursor = self._conn.execute(
+                """
+                UPDATE leases SET expires_at = ?, token = ?
+                WHERE name = ? AND token = ? AND state = ?
+                """,
+                (time.time() + ttl, new_token, name, token, HELD),
+            )
+        return new_token if cursor.rowcount == 1 else None
+
+    def release(
+        self, name: str, owner: str, token: str, done: bool, version: str = ""
+    ) -> bool:
+        """Give up a lease (see MinIOLeaseStore.release)."""
+        with self._lock:
+            if done:
+                cursor = self._conn.execute(
+                    """
+                    UPDATE leases SET state = ?, expires_at = 0, token = ?
+                    WHERE name = ? AND token = ?
+                    """,
+                    (DONE, uuid.uuid4().hex, name, token),
+                )
+            else:
+                cursor = self._conn.execute(
+                    "DELETE FROM leases WHERE name = ? AND token = ?", (name, token)
+                )
+        return cursor.rowcount == 1
+
+    def close(self):
+        """Close the database."""
+        with self._lock:
+            self._conn.close()
+
+
+class WorkLeases:
+    """
+    Claims, renews and releases the leases of one runner node.
+
+    A background thread renews every held lease each third of the TTL.
+    """
+
+    def __init__(
+        self,
+        store: Any,
+        owner: Optional[str] = None,
+        ttl: float = 120.0,
+        stats: Optional[ExtractionStatistics] = None,
+    ):
+        """
+        Initialize the node's lease manager.
+
+        Args:
+            store: MinIOLeaseStore or SQLiteLeaseStore
+            owner: Node identity (default host, pid and a random suffix)
+            ttl: Lease lifetime in seconds
+            stats: Statistics tracker counting objects claimed elsewhere
+        """
+        self.store = store
+        self.owner = owner or default_owner()
+        self.ttl = ttl
+        self.stats = stats
+        self.lost = 0
+
+        self._held: Dict[str, Tuple[str, str]] = {}  # name -> (token, version)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._renewer = threading.Thread(
+            target=self._renew_loop, name="lease-renewer", daemon=True
+        )
+        self._renewer.start()
+
+    def claim(self, name: str, version: str = "") -> bool:
+        """
+        Claim an object for this node.
+
+        Args:
+            name: Object key
+            version: Version of the work (see module docstring)
+
+        Returns:
+            True if this node may process the object, False if another node
+            holds or finished it
+
+        Raises:
+            Exception: If the lease store fails (the object is neither held
+                elsewhere nor claimed, so the caller should retry it later)
+        """
+        token = self.store.acquire(name, self.owner, self.ttl, version)
+        if token is None:
+            if self.stats is not None:
+                self.stats.record_claimed_elsewhere()
+            return False
+        with self._lock:
+            self._held[name] = (token, version)
+        return True
+
+    def release(self, name: str, done: bool):
+        """
+        Release a claimed object (no-op for objects this node does not hold).
+
+        Args:
+            name: Object key
+            done: The result is stored (leaves a done marker)
+        """
+        with self._lock:
+            held = self._held.pop(name, None)
+        if held is None:
+            return
+
+        token, version = held
+        try:
+            self.store.release(name, self.owner, token, done, version)
+        except Exception as e:
+            logger.warning(f"⚠️  Could not release lease of {name}: {e}")
+
+    @property
+    def held(self) -> int:
+        """Number of leases this node holds."""
+        return len(self._held)
+
+    def _renew_loop(self):
+        while not self._stop.wait(self.ttl / 3):
+            self.renew_all()
+
+    def renew_all(self):
+        """Renew every held lease, dropping the ones that were lost."""
+        with self._lock:
+            held = list(self._held.items())
+
+        for name, (token, version) in held:
+            try:
+                new_token = self.store.renew(name, self.owner, token, self.ttl, version)
+            except Exception as e:
+                logger.warning(f"⚠️  Could not renew lease of {name}: {e}")
+                continue  # Retried next round; the lease may still be valid
+
+            with self._lock:
+                if self._held.get(name, (None,))[0] != token:
+                    continue  # Released meanwhile
+                if new_token is None:
+                    del self._held[name]
+                    self.lost += 1
+                else:
+                    self._held[name] = (new_token, version)
+            if new_token is None:
+                logger.warning(f"⚠️  Lost lease of {name}; another node may redo it")
+
+    def close(self):
+        """Stop renewing and release every remaining lease for a retry."""
+        self._stop.set()
+        self._renewer.join(timeout=5)
+        with self._lock:
+            names = list(self._held)
+        for name in names:
+            self.release(name, done=False)
+        if hasattr(self.store, "close"):
+            self.store.close()
+
+
+def work_leases_from_settings(
+    minio_mgr: MinIOManager, stats: Optional[ExtractionStatistics] = None
+) -> Optional[WorkLeases]:
+    """
+    Create the lease manager configured in settings.
+
+    Args:
+        minio_mgr: MinIOManager of the bucket (for LEASE_BACKEND=minio)
+        stats: Statistics tracker
+
+    Returns:
+        WorkLeases, or None if LEASE_BACKEND is "none"
+
+    Raises:
+        ValueError: If LEASE_BACKEND is unknown
+    """
+    backend = settings.lease_backend.lower()
+    if backend == "none":
+        return None
+    if backend == "minio":
+        store = MinIOLeaseStore(minio_mgr, prefix=settings.lease_prefix)
+    elif backend == "sqlite":
+        store = SQLiteLeaseStore(settings.lease_sqlite_path)
+    else:
+        raise ValueError(f"Unknown LEASE_BACKEND '{settings.lease_backend}'")
+
+    return WorkLeases(store, ttl=settings.lease_ttl, stats=stats)
@@ -0,0 +1,15 @@
+"""
+Shared test fixtures.
+"""
+
+import pytest
+
+from src.modules.minio_manager import reset_clients
+
+
+@pytest.fixture(autouse=True)
+def fresh_minio_clients():
+    """Give every test its own MinIO client, so patching Minio takes effect."""
+    reset_clients()
+    yield
+    reset_clients()
@@ -0,0 +1,133 @@
+"""
+Test the sequential LangGraph workflow state.
+"""
+
+import importlib
+from contextlib import ExitStack
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.models.schemas import CompanyInfoLite
+from src.modules.graph_checkpoints import (
+    latest_thread_id,
+    open_checkpointer,
+    thread_config,
+)
+
+
+def _load_module():
+    """Import about_graph without touching MinIO."""
+    with patch("src.modules.minio_manager.Minio"):
+        return importlib.import_module("src.agents.about_graph")
+
+
+def _patched(module, names, done=(), failing=()):
+    """Patch the module globals with fakes serving `names`."""
+
+    def iter_objects(prefix, suffix, start_after=None, page_size=None):
+        for name in names:
+            if start_after is None or name > start_after:
+                yield {"object_name": name}
+
+    minio_mgr = Mock()
+    minio_mgr.iter_objects.side_effect = iter_objects
+    minio_mgr.download_object.side_effect = lambda name, as_text: f"Impressum {name}"
+    minio_mgr.upload_json.return_value = True
+
+    extractor = Mock()
+    extractor.extract_from_markdown_text.side_effect = lambda md: (
+        None
+        if any(name in md for name in failing)
+        else CompanyInfoLite(company_name="Muster GmbH")
+    )
+
+    completed = set(done)
+    index = Mock()
+    index.__contains__ = lambda self, key: key in completed
+    index.add.side_effect = completed.add
+
+    stack = ExitStack()
+    stack.enter_context(patch.object(module, "minio_mgr", minio_mgr))
+    stack.enter_context(patch.object(module, "extractor", extractor))
+    stack.enter_context(patch.object(module, "listing", None))
+    stack.enter_context(
+        patch.object(module.CompletedIndex, "build", return_value=index)
+    )
+    return stack, minio_mgr
+
+
+def _run(names, done=(), failing=()):
+    """Run the graph over `names` and return every intermediate state."""
+    module = _load_module()
+    stack, minio_mgr = _patched(module, names, done, failing)
+    with stack:
+        states = list(
+            module.build_graph().stream(
+                {"stats": {}}, config={"recursion_limit": 1000}, stream_mode="values"
+            )
+        )
+    return states, minio_mgr
+
+
+class TestScrapeState:
+    """Test cursor-based state and additive counters."""
+
+    def test_counts_and_cursor(self):
+        """Test counters are merged and the cursor reaches the last object."""
+        names = [f"scraped-content/site-{n}/impressum.md" for n in range(5)]
+
+        states, minio_mgr = _run(
+            names,
+            done=["scraped-content/site-1/impressum.about.json"],
+            failing=["site-3"],
+        )
+        final = states[-1]
+
+        assert final["stats"] == {"total": 5, "success": 3, "skipped": 1, "errors": 1}
+        assert final["cursor"] == names[-1]
+        assert minio_mgr.upload_json.call_count == 3
+        assert minio_mgr.download_object.call_count == 4
+
+    def test_state_size_is_constant(self):
+        """Test no state grows with the listing and markdown is dropped."""
+        names = [f"scraped-content/site-{n:03d}/impressum.md" for n in range(50)]
+
+        states, _ = _run(names)
+
+        sizes = [len(repr(state)) for state in states[2:]]
+        assert max(sizes) < 1000
+        assert not any(isinstance(v, list) for s in states for v in s.values())
+        assert states[-1]["markdown"] is None
+        assert states[-1]["stats"]["success"] == 50
+
+
+class TestCheckpointResume:
+    """Test resuming an interrupted run from SQLite checkpoints."""
+
+    def test_resume_continues_after_last_item(self, tmp_path):
+        """Test a resumed run only processes the remaining objects."""
+        module = _load_module()
+        names = [f"scraped-content/site-{n}/impressum.md" for n in range(6)]
+        checkpointer = open_checkpointer(str(tmp_path / "graph.sqlite3"))
+        config = thread_config("run-1", recursion_limit=1000)
+
+        # First process dies while uploading the fourth result
+        stack, minio_mgr = _patched(module, names)
+        minio_mgr.upload_json.side_effect = [True, True, True, RuntimeError("killed")]
+        with stack, pytest.raises(RuntimeError):
+            module.build_graph(checkpointer).invoke({"stats": {}}, config=config)
+
+        assert latest_thread_id(checkpointer) == "run-1"
+
+        # A fresh process resumes the same thread
+        stack, minio_mgr = _patched(module, names)
+        with stack:
+            app = module.build_graph(checkpointer)
+            assert app.get_state(config).next == ("save_result",)
+            final = app.invoke(None, config=config)
+
+        assert final["stats"] == {"total": 6, "success": 6}
+        assert minio_mgr.download_object.call_count == 2
+        assert minio_mgr.upload_json.call_count == 3
+        assert not app.get_state(config).next
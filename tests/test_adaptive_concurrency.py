@@ -0,0 +1,200 @@
+"""
+Test the adaptive (AIMD) concurrency controller.
+"""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.agents.about_extractor_v2 import AboutExtractorV2
+from src.modules.adaptive_concurrency import AdaptiveConcurrency
+from src.modules.llm_backends import FakeExtractionBackend
+from src.modules.retry_handler import RateLimiter
+from src.modules.statistics import TRAJECTORY_LIMIT, ExtractionStatistics
+
+RATE_LIMITED = RuntimeError("429 RESOURCE_EXHAUSTED: Resource has been exhausted")
+
+
+def _controller(**kwargs):
+    """Create a controller with a private rate limiter and statistics."""
+    kwargs.setdefault("limiter", RateLimiter(requests_per_minute=20))
+    kwargs.setdefault("stats", ExtractionStatistics())
+    kwargs.setdefault("cooldown", 0)
+    return AdaptiveConcurrency(min_limit=1, max_limit=8, **kwargs)
+
+
+def _call(controller, latency=1.0, error=None):
+    controller.acquire()
+    controller.release(latency, error)
+
+
+class TestAdaptiveConcurrency:
+    """Test additive increase, multiplicative decrease and reporting."""
+
+    def test_starts_from_static_settings(self):
+        """Test the first step starts from the configured limit and rate."""
+        controller = _controller(initial_limit=4)
+
+        assert controller.limit == 4
+        assert controller.requests_per_minute == 20
+        assert controller.stats.concurrency_trajectory[0]["reason"] == "start"
+
+    def test_additive_increase_within_bounds(self):
+        """Test each full window of successes adds one slot and a rate step."""
+        controller = _controller(initial_limit=2, max_requests_per_minute=24)
+
+        for _ in range(2):
+            _call(controller)
+        assert controller.limit == 3
+        assert controller.requests_per_minute == 22
+        assert controller.limiter.requests_per_minute == 22
+
+        for _ in range(100):
+            _call(controller)
+        assert controller.limit == 8
+        assert controller.requests_per_minute == 24
+
+    def test_rate_limit_halves_limit_and_rate(self):
+        """Test a 429 cuts both, and a burst within the cooldown counts once."""
+        controller = _controller(initial_limit=8, cooldown=60)
+
+        _call(controller, error=RATE_LIMITED)
+        _call(controller, error=RATE_LIMITED)
+
+        assert controller.limit == 4
+        assert controller.requests_per_minute == 10
+        assert controller.limiter.requests_per_minute == 10
+        assert controller.decreases == 1
+
+        summary = controller.stats.get_summary()["concurrency"]
+        assert summary["limit"] == 4
+        assert summary["decreases"] == 1
+        assert controller.stats.concurrency_trajectory[-1]["reason"] == "rate_limited"
+
+    def test_latency_spike_backs_off(self):
+        """Test a smoothed latency far above the best seen counts as overload."""
+        controller = _controller(initial_limit=8)
+
+        _call(controller, latency=1.0)
+        for _ in range(5):
+            _call(controller, latency=10.0)
+
+        assert controller.limit < 8
+        assert controller.stats.concurrency_trajectory[1]["reason"] == "latency"
+
+    def test_lucky_fast_window_does_not_ratchet_down(self):
+        """Test the latency baseline forgets an outlier and growth resumes."""
+        controller = _controller(initial_limit=8)
+
+        _call(controller, latency=0.1)
+        for _ in range(200):
+            _call(controller, latency=1.0)
+
+        assert controller.decreases > 0
+        assert controller.limit == 8
+
+    def test_rate_increase_speeds_up_reservations(self):
+        """Test a higher rate also shortens the spacing between requests."""
+        limiter = RateLimiter(
+            requests_per_minute=20, delay_between_requests=3, tokens_per_minute=0
+        )
+        controller = _controller(
+            initial_limit=1,
+            limiter=limiter,
+            rate_step=40,
+            max_requests_per_minute=60,
+            latency_tolerance=0,
+        )
+
+        _call(controller)
+        assert limiter.requests_per_minute == 60
+
+        delays = [limiter.reserve() for _ in range(5)]
+        assert delays[-1] == pytest.approx(4.0, abs=0.1)
+
+    def test_trajectory_is_bounded(self):
+        """Test long runs keep the latest steps and exact counts."""
+        stats = ExtractionStatistics()
+        for n in range(TRAJECTORY_LIMIT + 10):
+            stats.record_concurrency(n % 5 + 1, 20, "increase")
+
+        assert len(stats.concurrency_trajectory) == TRAJECTORY_LIMIT
+        summary = stats.concurrency_summary()
+        assert summary["increases"] == TRAJECTORY_LIMIT + 10
+        assert (summary["min_limit"], summary["max_limit"]) == (1, 5)
+
+    def test_low_success_rate_backs_off(self):
+        """Test transient errors only cut the limit below the success floor."""
+        controller = _controller(initial_limit=8, window=10, min_success_rate=0.85)
+
+        for _ in range(9):
+            _call(controller)
+        _call(controller, error=RuntimeError("503 UNAVAILABLE"))
+        assert controller.decreases == 0
+
+        _call(controller, error=RuntimeError("503 UNAVAILABLE"))
+        assert controller.decreases == 1
+        assert controller.stats.concurrency_trajectory[-1]["reason"] == "errors"
+
+    def test_acquire_caps_in_flight_calls(self):
+        """Test callers block once the limit of calls is in flight."""
+        controller = _controller(initial_limit=2, latency_tolerance=0)
+        lock = threading.Lock()
+        active = [0, 0]  # current, peak
+
+        def call():
+            controller.acquire()
+            with lock:
+                active[0] += 1
+                active[1] = max(active[1], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            controller.release(0.02)
+
+        threads = [threading.Thread(target=call) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert active[1] <= 4  # Two increases at most within six calls
+        assert controller.in_flight == 0
+
+    def test_invalid_bounds(self):
+        """Test inconsistent bounds are rejected."""
+        with pytest.raises(ValueError):
+            AdaptiveConcurrency(min_limit=4, max_limit=2)
+
+
+@patch("src.agents.about_extractor_v2.extraction_cache_from_settings", Mock())
+@patch("src.agents.about_extractor_v2.rate_limiter", RateLimiter(60, 0))
+@patch("src.agents.about_extractor_v2.MinIOManager")
+def test_extractor_reports_trajectory(mock_minio):
+    """Test the extractor feeds its model calls to the controller."""
+    stats = ExtractionStatistics()
+    backend = FakeExtractionBackend(latency_distribution="fixed", latency_mean=0.0)
+    with patch("src.modules.adaptive_concurrency.settings") as mock_settings:
+        mock_settings.adaptive_concurrency_enabled = True
+        mock_settings.adaptive_min_concurrency = 1
+        mock_settings.adaptive_max_concurrency = 4
+        mock_settings.extraction_max_workers = 1
+        mock_settings.adaptive_min_requests_per_minute = 2
+        mock_settings.adaptive_max_requests_per_minute = 100
+        mock_settings.adaptive_rate_step = 2
+        mock_settings.adaptive_decrease_factor = 0.5
+        mock_settings.adaptive_latency_tolerance = 0
+        mock_settings.adaptive_min_success_rate = 0.9
+        extractor = AboutExtractorV2(stats=stats, backend=backend)
+    extractor.cache = None
+
+    extractor.extract_from_markdown_text("Impressum\nMuster GmbH Berlin")
+
+    assert extractor.concurrency.limit == 2
+    assert [step["reason"] for step in stats.concurrency_trajectory] == [
+        "start",
+        "increase",
+    ]
+    assert stats.stage_latency["concurrency_wait"].count == 1
@@ -0,0 +1,92 @@
+"""
+Test asyncio pipeline runner.
+"""
+
+import asyncio
+from unittest.mock import Mock
+
+from src.agents.run_batch_async import AsyncPipeline
+from src.models.schemas import CompanyInfoLite
+from src.modules.skip_index import CompletedIndex
+from src.modules.statistics import ExtractionStatistics
+
+
+class TestAsyncPipeline:
+    """Test async download → extract → upload pipeline."""
+
+    def _pipeline(self, extractor, completed=None):
+        minio_mgr = Mock()
+        minio_mgr.download_object.return_value = "Impressum Mustermann GmbH"
+        minio_mgr.upload_json.return_value = True
+        minio_mgr.object_exists.return_value = False
+        stats = ExtractionStatistics()
+        pipeline = AsyncPipeline(
+            extractor,
+            minio_mgr,
+            stats,
+            completed=completed,
+            download_concurrency=4,
+            llm_concurrency=2,
+            upload_concurrency=4,
+        )
+        return pipeline, minio_mgr, stats
+
+    def test_llm_concurrency_bounded(self):
+        """Test the LLM stage never exceeds its semaphore."""
+        in_flight = 0
+        peak = 0
+
+        async def fake_extract(text, executor=None, source=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return CompanyInfoLite(company_name="Mustermann GmbH")
+
+        extractor = Mock()
+        extractor.aextract_from_markdown_text = fake_extract
+        pipeline, minio_mgr, stats = self._pipeline(extractor)
+
+        names = [f"scraped-content/{i}.md" for i in range(20)]
+        asyncio.run(pipeline.run(names, max_in_flight=50))
+        pipeline.close()
+
+        assert peak == 2
+        assert stats.successful == 20
+        assert minio_mgr.upload_json.call_count == 20
+
+    def test_listing_failure_marks_run_incomplete(self):
+        """Test workers drain and the stats record a failed listing."""
+
+        async def fake_extract(text, executor=None, source=None):
+            return CompanyInfoLite(company_name="Mustermann GmbH")
+
+        def listing():
+            yield "scraped-content/0.md"
+            raise RuntimeError("listing gave up")
+
+        extractor = Mock()
+        extractor.aextract_from_markdown_text = fake_extract
+        pipeline, _, stats = self._pipeline(extractor)
+
+        asyncio.run(pipeline.run(listing(), max_in_flight=2))
+        pipeline.close()
+
+        assert stats.successful == 1
+        assert stats.listing_error == "listing gave up"
+        assert stats.get_summary()["complete"] is False
+
+    def test_skips_completed(self):
+        """Test completed objects are skipped without MinIO calls."""
+        extractor = Mock()
+        completed = CompletedIndex({"scraped-content/a.about.json"})
+        pipeline, minio_mgr, stats = self._pipeline(extractor, completed)
+
+        result = asyncio.run(pipeline.process_single_file("scraped-content/a.md"))
+        pipeline.close()
+
+        assert result["status"] == "skipped"
+        assert stats.skipped == 1
+        minio_mgr.download_object.assert_not_called()
+        minio_mgr.object_exists.assert_not_called()
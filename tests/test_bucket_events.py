@@ -0,0 +1,178 @@
+"""
+Test the bucket notification feed and the daemon producer.
+"""
+
+import queue
+import threading
+from unittest.mock import Mock, patch
+
+from src.agents.run_batch_production import _STOP, PendingSet, feed_from_events
+from src.modules.bucket_events import BucketEventFeed, parse_event_records
+from src.modules.skip_index import CompletedIndex
+from src.modules.statistics import ExtractionStatistics
+
+
+def _event(key, name="s3:ObjectCreated:Put"):
+    return {
+        "Records": [
+            {
+                "eventName": name,
+                "eventTime": "2026-01-02T03:04:05.000Z",
+                "s3": {"object": {"key": key, "size": 10, "eTag": "abc"}},
+            }
+        ]
+    }
+
+
+class FakeStream:
+    """Notification stream that yields events, then blocks until closed."""
+
+    def __init__(self, events):
+        self.events = events
+        self.closed = threading.Event()
+
+    def __iter__(self):
+        yield from self.events
+        self.closed.wait()
+
+    def __exit__(self, *exc_info):
+        self.closed.set()
+
+
+def _minio(streams, listed=()):
+    """Create a MinIOManager stand-in with scripted streams and a listing."""
+    minio_mgr = Mock()
+    minio_mgr.listen_notifications.side_effect = streams
+    minio_mgr.iter_objects.side_effect = lambda **kwargs: iter(
+        [{"object_name": name, "etag": "abc"} for name in listed]
+    )
+    return minio_mgr
+
+
+def _run_until(feed, condition):
+    """Run the feed on a thread until `condition()` holds, then stop it."""
+    stop = threading.Event()
+    thread = threading.Thread(target=feed.run, args=(stop,))
+    thread.start()
+    try:
+        for _ in range(200):
+            if condition():
+                break
+            stop.wait(0.01)
+    finally:
+        stop.set()
+        thread.join(timeout=5)
+    assert not thread.is_alive()
+
+
+class TestParseEventRecords:
+    """Test notifications are turned into listing entries."""
+
+    def test_created_objects(self):
+        """Test keys are URL-decoded and other event types ignored."""
+        entries = list(
+            parse_event_records(_event("scraped-content/m%C3%BCller+gmbh.md"))
+        )
+
+        assert len(entries) == 1
+        assert entries[0]["object_name"] == "scraped-content/müller gmbh.md"
+        assert entries[0]["etag"] == "abc"
+        assert entries[0]["last_modified"].year == 2026
+
+        removed = _event("scraped-content/a.md", "s3:ObjectRemoved:Delete")
+        assert list(parse_event_records(removed)) == []
+        assert list(parse_event_records({"Records": None})) == []
+
+
+class TestBucketEventFeed:
+    """Test listening, reconnecting and reconciliation sweeps."""
+
+    def test_events_and_startup_sweep(self):
+        """Test the startup sweep and the stream both submit objects."""
+        submitted = []
+        minio_mgr = _minio(
+            [FakeStream([_event("scraped-content/new.md")])],
+            listed=["scraped-content/old.md"],
+        )
+        feed = BucketEventFeed(minio_mgr, submitted.append, sweep_interval=0)
+
+        _run_until(feed, lambda: len(submitted) == 2)
+
+        assert sorted(obj["object_name"] for obj in submitted) == [
+            "scraped-content/new.md",
+            "scraped-content/old.md",
+        ]
+        assert feed.sweeps == 1
+        assert feed.events_received == 1
+
+    def test_first_sweep_waits_for_stream(self):
+        """Test the startup sweep starts only once the stream is open."""
+        order = []
+        minio_mgr = _minio([])
+
+        def listen(**kwargs):
+            threading.Event().wait(0.05)  # Slow to connect
+            order.append("listen")
+            return FakeStream([])
+
+        minio_mgr.listen_notifications.side_effect = listen
+        minio_mgr.iter_objects.side_effect = lambda **kwargs: (
+            order.append("sweep") or iter([])
+        )
+        feed = BucketEventFeed(minio_mgr, Mock(), sweep_interval=0)
+
+        _run_until(feed, lambda: feed.sweeps == 1)
+
+        assert order == ["listen", "sweep"]
+
+    def test_reconnects_after_failure(self):
+        """Test a failed stream is reopened after the backoff delay."""
+        submitted = []
+        minio_mgr = _minio(
+            [ConnectionError("reset"), FakeStream([_event("scraped-content/a.md")])]
+        )
+        feed = BucketEventFeed(
+            minio_mgr, submitted.append, sweep_interval=0, reconnect_delay=0.01
+        )
+
+        _run_until(feed, lambda: bool(submitted))
+
+        assert feed.reconnects == 1
+        assert submitted[0]["object_name"] == "scraped-content/a.md"
+
+
+@patch("src.modules.bucket_events.settings")
+def test_daemon_queues_only_new_objects(mock_settings):
+    """Test done and already queued objects are not queued again."""
+    mock_settings.daemon_sweep_interval = 0
+    mock_settings.daemon_reconnect_delay = 0.01
+    mock_settings.daemon_max_reconnect_delay = 0.01
+    mock_settings.listing_page_size = None
+    events = [_event("scraped-content/new.md"), _event("scraped-content/done.md")]
+    minio_mgr = _minio(
+        [FakeStream(events)],
+        listed=["scraped-content/new.md", "scraped-content/done.md"],
+    )
+    completed = CompletedIndex({"scraped-content/done.about.json"})
+    stats = ExtractionStatistics()
+    work_queue = queue.Queue()
+    stop = threading.Event()
+
+    thread = threading.Thread(
+        target=feed_from_events,
+        args=(minio_mgr, work_queue, stats, 2, completed, PendingSet(), stop),
+    )
+    thread.start()
+    for _ in range(200):
+        if minio_mgr.iter_objects.called and work_queue.qsize() >= 1:
+            break
+        stop.wait(0.01)
+    stop.wait(0.05)  # Let the stream deliver its events as well
+    stop.set()
+    thread.join(timeout=5)
+
+    items = [work_queue.get_nowait() for _ in range(work_queue.qsize())]
+    assert [item["object_name"] for item in items[:-2]] == ["scraped-content/new.md"]
+    assert items[-2:] == [_STOP, _STOP]
+    assert stats.total_files == 1
+    minio_mgr.listen_notifications.assert_called_once()
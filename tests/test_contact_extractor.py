@@ -0,0 +1,102 @@
+"""
+Test regex contact-field fast path.
+"""
+
+from unittest.mock import Mock, patch
+
+from src.agents.about_extractor_v2 import AboutExtractorV2
+from src.modules.contact_extractor import extract_contact_fields, parse_field_list
+from src.modules.statistics import ExtractionStatistics
+
+IMPRESSUM = """# Impressum
+
+Angaben gemäß § 5 TMG: Zahnärztin Dr. Claudia Becker
+
+**Telefon:** (0441) 560015-0
+**Telefax:** (0441) 560015-4
+E-Mail: info@dr-becker.de, c.becker@dr-becker.de
+Internet: www.dr-becker.de
+"""
+
+
+class TestExtractContactFields:
+    """Test compiled-pattern contact extraction."""
+
+    def test_labeled_fields(self):
+        """Test phone, fax and website are read from their labels."""
+        fields = extract_contact_fields(IMPRESSUM)
+
+        assert fields["phone"] == "(0441) 560015-0"
+        assert fields["fax"] == "(0441) 560015-4"
+        assert fields["website"] == "www.dr-becker.de"
+
+    def test_personal_email_preferred(self):
+        """Test a personal address wins over an earlier generic one."""
+        assert extract_contact_fields(IMPRESSUM)["email"] == "c.becker@dr-becker.de"
+
+    def test_obfuscated_email_and_missing_fields(self):
+        """Test (at) obfuscation and empty strings for absent fields."""
+        fields = extract_contact_fields("Kontakt: kanzlei (at) ra-schmidt.de")
+
+        assert fields["email"] == "kanzlei@ra-schmidt.de"
+        assert fields["phone"] == ""
+        assert fields["fax"] == ""
+        assert extract_contact_fields("praxis [AT] becker.de")["email"] == (
+            "praxis@becker.de"
+        )
+
+    def test_unlabeled_odr_link_is_not_the_website(self):
+        """Test the mandatory EU ODR link is not taken as the website."""
+        text = (
+            "Die Europäische Kommission stellt eine Plattform zur "
+            "Online-Streitbeilegung (OS) bereit: https://ec.europa.eu/consumers/odr/."
+        )
+
+        assert extract_contact_fields(text)["website"] == ""
+        assert extract_contact_fields(IMPRESSUM + text)["website"] == "www.dr-becker.de"
+
+    def test_parse_field_list(self):
+        """Test comma-separated settings values."""
+        assert parse_field_list(" email, phone ,") == {"email", "phone"}
+        assert parse_field_list("") == set()
+
+
+@patch("src.agents.about_extractor_v2.extraction_cache_from_settings", Mock())
+@patch("src.agents.about_extractor_v2.MinIOManager")
+@patch("src.agents.about_extractor_v2.lx.extract")
+class TestExtractorFastPath:
+    """Test extractor integration with the fast path."""
+
+    def test_llm_skipped_when_fields_resolved(self, mock_extract, mock_minio):
+        """Test no LLM call once all configured fields are found locally."""
+        stats = ExtractionStatistics()
+        extractor = AboutExtractorV2(model_id="test-model", stats=stats)
+        extractor.cache = None
+        extractor.skip_llm_fields = {"email", "phone", "website"}
+
+        result = extractor.extract_from_markdown_text(IMPRESSUM)
+
+        mock_extract.assert_not_called()
+        assert result.email == "c.becker@dr-becker.de"
+        assert result.owner_name == ""
+        assert stats.llm_calls_skipped == 1
+
+    def test_llm_asked_only_for_remaining_fields(self, mock_extract, mock_minio):
+        """Test the prompt omits resolved fields and local values win."""
+        extraction = Mock()
+        extraction.extraction_class = "company_info"
+        extraction.attributes = {"owner_name": "Claudia Becker", "email": "x@y.de"}
+        mock_extract.return_value = Mock(extractions=[extraction])
+
+        extractor = AboutExtractorV2(model_id="test-model")
+        extractor.cache = None
+        extractor.skip_llm_fields = set()
+
+        result = extractor.extract_from_markdown_text(IMPRESSUM)
+
+        prompt = mock_extract.call_args.kwargs["prompt_description"]
+        assert "- owner_name:" in prompt
+        assert "- email:" not in prompt
+        assert "- phone:" not in prompt
+        assert result.owner_name == "Claudia Becker"
+        assert result.email == "c.becker@dr-becker.de"
@@ -0,0 +1,179 @@
+"""
+Test multi-document batching per LLM call.
+"""
+
+from unittest.mock import Mock, patch
+
+import langextract as lx
+from langextract.core.data import CharInterval
+
+from src.agents.about_extractor_v2 import BATCH_PROMPT, AboutExtractorV2
+from src.modules.document_batcher import attribute_extractions, pack_documents
+from src.modules.extraction_cache import ExtractionCache
+from src.modules.statistics import ExtractionStatistics
+
+DOCS = [
+    ("a.md", "Impressum\nAlpha GmbH\nGeschäftsführer: Anna Alt"),
+    ("b.md", "Impressum\nBeta AG\nVorstand: Bernd Bach"),
+    ("c.md", "Impressum\nGamma KG\nInhaber: Clara Cordes"),
+]
+
+
+def _extraction_for(batch, text, company_name):
+    """Create a company_info extraction aligned to `text` in the batch."""
+    start = batch.text.index(text)
+    return lx.data.Extraction(
+        extraction_class="company_info",
+        extraction_text=text,
+        char_interval=CharInterval(start_pos=start, end_pos=start + len(text)),
+        attributes={"company_name": company_name},
+    )
+
+
+class TestPackDocuments:
+    """Test greedy packing under budgets."""
+
+    def test_packs_within_budget(self):
+        """Test documents share a batch and spans point at their text."""
+        batches = pack_documents(DOCS, max_chars=1000, max_docs=8)
+
+        assert len(batches) == 1
+        batch = batches[0]
+        assert batch.sources == ["a.md", "b.md", "c.md"]
+        for (_, text), (start, end) in zip(DOCS, batch.spans):
+            assert batch.text[start:end] == text
+
+    def test_budget_and_doc_limit_split(self):
+        """Test char budget and max_docs both start new batches."""
+        assert [len(b) for b in pack_documents(DOCS, 130, 8)] == [2, 1]
+        assert [len(b) for b in pack_documents(DOCS, 1000, 2)] == [2, 1]
+
+    def test_oversized_document_alone(self):
+        """Test a document larger than the budget is sent on its own."""
+        batches = pack_documents([("big.md", "x" * 500)] + DOCS[:1], 100, 8)
+        assert [b.sources for b in batches] == [["big.md"], ["a.md"]]
+
+
+class TestAttributeExtractions:
+    """Test mapping extractions back to their documents."""
+
+    def test_attributed_by_char_interval(self):
+        """Test each aligned extraction maps to the document containing it."""
+        batch = pack_documents(DOCS, 1000, 8)[0]
+        extractions = [
+            _extraction_for(batch, "Beta AG", "Beta AG"),
+            _extraction_for(batch, "Alpha GmbH", "Alpha GmbH"),
+        ]
+
+        resolved, ambiguous = attribute_extractions(batch, extractions, "company_info")
+
+        assert resolved["a.md"].attributes["company_name"] == "Alpha GmbH"
+        assert resolved["b.md"].attributes["company_name"] == "Beta AG"
+        assert "c.md" not in resolved
+        assert ambiguous == set()
+
+    def test_ambiguous_cases(self):
+        """Test duplicates, boundary crossings and unaligned extractions."""
+        batch = pack_documents(DOCS, 1000, 8)[0]
+        a_start = batch.spans[0][0]
+        b_end = batch.spans[1][1]
+        crossing = lx.data.Extraction(
+            extraction_class="company_info",
+            extraction_text="...",
+            char_interval=CharInterval(start_pos=a_start, end_pos=b_end),
+        )
+        unaligned = lx.data.Extraction(
+            extraction_class="company_info", extraction_text="Gamma"
+        )
+
+        resolved, ambiguous = attribute_extractions(
+            batch, [crossing, unaligned], "company_info"
+        )
+
+        assert resolved == {}
+        assert ambiguous == {"a.md", "b.md", "c.md"}
+
+
+@patch("src.agents.about_extractor_v2.extraction_cache_from_settings", Mock())
+@patch("src.agents.about_extractor_v2.MinIOManager")
+@patch("src.agents.about_extractor_v2.lx.extract")
+class TestExtractBatch:
+    """Test AboutExtractorV2.extract_batch."""
+
+    def _extractor(self, stats=None):
+        extractor = AboutExtractorV2(model_id="test-model", stats=stats)
+        extractor.cache = None
+        return extractor
+
+    def test_one_call_for_packed_documents(self, mock_extract, mock_minio):
+        """Test three pages cost a single LLM call and map back by source."""
+        batch = pack_documents(DOCS, 8000, 8)[0]
+        mock_extract.return_value = Mock(
+            extractions=[
+                _extraction_for(batch, text.split("\n")[1], text.split("\n")[1])
+                for _, text in DOCS
+            ]
+        )
+        stats = ExtractionStatistics()
+
+        results = self._extractor(stats).extract_batch(DOCS)
+
+        assert mock_extract.call_count == 1
+        kwargs = mock_extract.call_args.kwargs
+        assert kwargs["prompt_description"] == BATCH_PROMPT
+        assert kwargs["max_char_buffer"] == len(kwargs["text_or_documents"])
+        assert results["a.md"].company_name == "Alpha GmbH"
+        assert results["c.md"].company_name == "Gamma KG"
+        assert stats.batched_documents == 3
+
+    def test_ambiguous_documents_fall_back(self, mock_extract, mock_minio):
+        """Test unattributable documents get their own call."""
+        batch = pack_documents(DOCS, 8000, 8)[0]
+        single = Mock()
+        single.extraction_class = "company_info"
+        single.attributes = {"company_name": "Single"}
+        mock_extract.side_effect = [
+            Mock(
+                extractions=[
+                    _extraction_for(batch, "Alpha GmbH", "Alpha GmbH"),
+                    _extraction_for(batch, "Beta AG", "Beta AG"),
+                    _extraction_for(batch, "Bernd Bach", "Beta AG"),
+                ]
+            ),
+            Mock(extractions=[single]),
+        ]
+
+        results = self._extractor().extract_batch(DOCS)
+
+        assert mock_extract.call_count == 2
+        assert mock_extract.call_args.kwargs["text_or_documents"] == DOCS[1][1]
+        assert results["a.md"].company_name == "Alpha GmbH"
+        assert results["b.md"].company_name == "Single"
+        assert results["c.md"] is None
+
+    def test_batch_results_not_served_to_single_calls(
+        self, mock_extract, mock_minio, tmp_path
+    ):
+        """Test packed results are cached under the batch prompt only."""
+        batch = pack_documents(DOCS, 8000, 8)[0]
+        packed = Mock(
+            extractions=[
+                _extraction_for(batch, text.split("\n")[1], text.split("\n")[1])
+                for _, text in DOCS
+            ]
+        )
+        single = Mock()
+        single.extraction_class = "company_info"
+        single.attributes = {"company_name": "Single"}
+        mock_extract.side_effect = [packed, Mock(extractions=[single])]
+        extractor = self._extractor()
+        extractor.cache = ExtractionCache(str(tmp_path / "cache.sqlite3"), 10**6)
+
+        extractor.extract_batch(DOCS)
+        assert extractor.extract_batch(DOCS)["a.md"].company_name == "Alpha GmbH"
+        assert mock_extract.call_count == 1  # Batch calls reuse batch results
+
+        result = extractor.extract_from_markdown_text(DOCS[0][1])
+
+        assert mock_extract.call_count == 2
+        assert result.company_name == "Single"
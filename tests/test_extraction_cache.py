@@ -0,0 +1,91 @@
+"""
+Test content-addressed extraction cache.
+"""
+
+from unittest.mock import Mock, patch
+
+from src.agents.about_extractor_v2 import AboutExtractorV2
+from src.modules.extraction_cache import (
+    ExtractionCache,
+    cache_key,
+    config_fingerprint,
+)
+from src.modules.statistics import ExtractionStatistics
+
+
+class TestCacheKey:
+    """Test cache key derivation."""
+
+    def test_whitespace_insensitive(self):
+        """Test formatting-only changes map to the same key."""
+        fp = config_fingerprint("prompt", [], "model")
+
+        assert cache_key("Impressum\n\nMustermann  GmbH", fp) == cache_key(
+            "  Impressum Mustermann\tGmbH\n", fp
+        )
+
+    def test_config_changes_key(self):
+        """Test prompt or model changes invalidate keys."""
+        text = "Impressum Mustermann GmbH"
+
+        assert cache_key(text, config_fingerprint("a", [], "m")) != cache_key(
+            text, config_fingerprint("b", [], "m")
+        )
+        assert cache_key(text, config_fingerprint("a", [], "m1")) != cache_key(
+            text, config_fingerprint("a", [], "m2")
+        )
+
+
+class TestExtractionCache:
+    """Test SQLite cache storage and eviction."""
+
+    def test_put_get(self, tmp_path):
+        """Test round trip and persistence across instances."""
+        path = str(tmp_path / "cache.sqlite3")
+        cache = ExtractionCache(path, max_bytes=1024)
+        cache.put("k1", '{"a": 1}', llm_seconds=1.5)
+        cache.close()
+
+        reopened = ExtractionCache(path, max_bytes=1024)
+        assert reopened.get("k1") == ('{"a": 1}', 1.5)
+        assert reopened.get("missing") is None
+
+    def test_lru_eviction(self, tmp_path):
+        """Test least recently used entries are evicted over budget."""
+        cache = ExtractionCache(str(tmp_path / "cache.sqlite3"), max_bytes=30)
+
+        cache.put("k1", "x" * 10)
+        cache.put("k2", "y" * 10)
+        cache.get("k1")  # k2 becomes least recently used
+        cache.put("k3", "z" * 15)
+
+        assert cache.get("k2") is None
+        assert cache.get("k1") is not None
+        assert cache.get("k3") is not None
+        assert cache.total_bytes <= 30
+
+
+class TestExtractorCaching:
+    """Test extractor integration with the cache."""
+
+    @patch("src.agents.about_extractor_v2.MinIOManager")
+    @patch("src.agents.about_extractor_v2.lx.extract")
+    def test_cache_hit_skips_llm(self, mock_extract, mock_minio, tmp_path):
+        """Test second extraction of equivalent text is served from cache."""
+        extraction = Mock()
+        extraction.extraction_class = "company_info"
+        extraction.attributes = {"company_name": "Mustermann GmbH"}
+        mock_extract.return_value = Mock(extractions=[extraction])
+
+        stats = ExtractionStatistics()
+        cache = ExtractionCache(str(tmp_path / "cache.sqlite3"), max_bytes=10_000)
+        extractor = AboutExtractorV2(model_id="test-model", stats=stats, cache=cache)
+
+        first = extractor.extract_from_markdown_text("Impressum\nMustermann GmbH")
+        second = extractor.extract_from_markdown_text("Impressum  Mustermann GmbH\n")
+
+        assert first == second
+        assert second.company_name == "Mustermann GmbH"
+        assert mock_extract.call_count == 1
+        assert stats.cache_hits == 1
+        assert stats.cache_misses == 1
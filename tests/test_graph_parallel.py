@@ -0,0 +1,92 @@
+"""
+Test the parallel fan-out LangGraph workflow.
+"""
+
+import importlib
+import threading
+import time
+from unittest.mock import Mock, patch
+
+from src.modules.graph_reducers import merge_stats
+from src.modules.statistics import ExtractionStatistics
+
+
+def _load_module():
+    """Import about_graph_parallel without touching MinIO or the LLM."""
+    with (
+        patch("src.modules.minio_manager.Minio"),
+        patch(
+            "src.agents.about_extractor_v2.extraction_cache_from_settings",
+            return_value=None,
+        ),
+    ):
+        return importlib.import_module("src.agents.about_graph_parallel")
+
+
+class TestMergeStats:
+    """Test the counter reducer."""
+
+    def test_adds_keys(self):
+        """Test counters are summed key by key."""
+        merged = merge_stats({"success": 2, "total": 5}, {"success": 1, "errors": 1})
+
+        assert merged == {"success": 3, "total": 5, "errors": 1}
+
+    def test_handles_missing_sides(self):
+        """Test None on either side behaves like an empty dict."""
+        assert merge_stats(None, {"total": 1}) == {"total": 1}
+        assert merge_stats({"total": 1}, None) == {"total": 1}
+
+
+class TestParallelGraph:
+    """Test map/reduce over listing waves."""
+
+    def test_processes_every_object_within_concurrency_cap(self):
+        """Test every object gets a branch and branches respect max_concurrency."""
+        module = _load_module()
+        names = [f"scraped-content/site-{n:03d}/impressum.md" for n in range(25)]
+
+        def iter_objects(prefix, suffix, start_after=None, page_size=None):
+            assert page_size == 10
+            for name in names:
+                if start_after is None or name > start_after:
+                    yield {"object_name": name}
+
+        minio_mgr = Mock()
+        minio_mgr.iter_objects.side_effect = iter_objects
+        stats = ExtractionStatistics()
+
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def fake_process(extractor, mgr, object_name, stats, completed, source):
+            nonlocal in_flight, peak
+            assert source["object_name"] == object_name
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            status = (
+                "skipped" if object_name.endswith("000/impressum.md") else "success"
+            )
+            return {"status": status, "file": object_name}
+
+        with (
+            patch.object(module, "minio_mgr", minio_mgr),
+            patch.object(module, "stats", stats),
+            patch.object(module, "completed_index", Mock()),
+            patch.object(module, "process_single_file", fake_process),
+            patch.object(module.settings, "graph_wave_size", 10),
+        ):
+            final_state = module.build_parallel_graph().invoke(
+                {"stats": {}},
+                config={"recursion_limit": 100, "max_concurrency": 3},
+            )
+
+        assert final_state["stats"] == {"total": 25, "success": 24, "skipped": 1}
+        assert final_state["listing_done"] is True
+        assert stats.total_files == 25
+        assert 1 < peak <= 3
@@ -0,0 +1,77 @@
+"""
+Test the shared MinIO connection pool.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from src.modules import minio_manager
+from src.modules.http_pool import build_pool_manager, pool_stats
+
+
+@pytest.fixture
+def slow_server():
+    """Serve keep-alive responses that take 50 ms each."""
+    release = threading.Event()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            release.wait(0.05)
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, format, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+class TestSharedPool:
+    """Test pool sizing, reuse and saturation counters."""
+
+    def test_saturated_pool_waits_and_reuses(self, slow_server):
+        """Test more callers than connections wait instead of opening more."""
+        manager = build_pool_manager(2, connect_timeout=5, read_timeout=5)
+        before = pool_stats.snapshot()
+
+        def fetch():
+            assert manager.request("GET", slow_server + "/").data == b"ok"
+
+        threads = [threading.Thread(target=fetch) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        after = pool_stats.snapshot()
+        pool = manager.connection_from_url(slow_server)
+        assert after["checkouts"] - before["checkouts"] == 6
+        assert after["waits"] > before["waits"]
+        assert after["wait_seconds"] > before["wait_seconds"]
+        assert after["in_use"] == before["in_use"]
+        assert after["max_in_use"] >= 2
+        assert pool.num_connections == 2  # Keep-alive reuse, no extra sockets
+
+    def test_managers_share_one_client(self):
+        """Test every MinIOManager uses the same client and pool."""
+        with patch.object(minio_manager.MinIOManager, "_ensure_bucket_exists"):
+            first = minio_manager.MinIOManager()
+            second = minio_manager.MinIOManager()
+
+        assert first.client is second.client
+        assert first.client._http is minio_manager.shared_pool_manager()
@@ -0,0 +1,84 @@
+"""
+Test Impressum section locator.
+"""
+
+from src.modules.impressum_locator import locate_impressum
+from src.modules.statistics import TRIM_DETAILS_LIMIT, ExtractionStatistics
+
+NAVIGATION = (
+    "[Home](/) | [Leistungen](/leistungen) | [Impressum](/impressum)\n\n"
+    + "Wir verwenden Cookies, um Ihnen das beste Nutzererlebnis zu bieten.\n" * 20
+)
+SERVICES = "## Tätigkeitsbereiche\n\n" + "".join(
+    f"- Leistung {i}: Beschreibung der Leistung\n" for i in range(100)
+)
+IMPRESSUM = """# Impressum
+
+## Angaben gemäß § 5 TMG
+
+**Mustermann Consulting GmbH**
+
+Geschäftsführer: Hans Müller
+
+E-Mail: h.mueller@mustermann-consulting.de
+Telefon: +49 89 123456-0
+"""
+
+
+class TestLocateImpressum:
+    """Test legal-notice trimming."""
+
+    def test_keeps_impressum_and_drops_noise(self):
+        """Test anchors are kept while long unrelated sections are dropped."""
+        text = NAVIGATION + SERVICES + IMPRESSUM + SERVICES
+
+        trimmed = locate_impressum(
+            text, context_before=100, context_after=400, max_chars=1500
+        )
+
+        assert "Geschäftsführer: Hans Müller" in trimmed
+        assert "h.mueller@mustermann-consulting.de" in trimmed
+        assert "+49 89 123456-0" in trimmed
+        assert "Leistung 50" not in trimmed
+        assert len(trimmed) <= 1500 + 20
+        assert len(trimmed) < len(text) / 3
+
+    def test_fallback_without_anchor(self):
+        """Test full text is returned when no anchor is found."""
+        text = "Lorem ipsum dolor sit amet.\n" * 500
+
+        assert locate_impressum(text, max_chars=1000) == text
+
+    def test_navigation_links_are_not_anchors(self):
+        """Test "[Impressum](...)" links alone do not count as anchors."""
+        text = NAVIGATION + SERVICES
+
+        assert locate_impressum(text, max_chars=500) == text
+
+    def test_short_text_untouched(self):
+        """Test pages within the budget are not trimmed."""
+        assert locate_impressum(IMPRESSUM, max_chars=4000) == IMPRESSUM
+
+
+class TestTrimStatistics:
+    """Test reduction ratio reporting."""
+
+    def test_record_trim(self):
+        """Test per-file and aggregate reduction ratios."""
+        stats = ExtractionStatistics()
+        stats.record_trim("a.md", 1000, 250)
+        stats.record_trim("b.md", 1000, 1000)
+
+        assert stats.trim_details[0]["reduction_ratio"] == 0.75
+        assert stats.trim_details[1]["reduction_ratio"] == 0.0
+        assert stats.get_summary()["char_reduction"] == "37.5%"
+
+    def test_trim_details_capped(self):
+        """Test per-file records stay bounded while the totals keep counting."""
+        stats = ExtractionStatistics()
+        for i in range(TRIM_DETAILS_LIMIT + 5):
+            stats.record_trim(f"{i}.md", 100, 50)
+
+        assert len(stats.trim_details) == TRIM_DETAILS_LIMIT
+        assert stats.get_summary()["trimmed_files"] == TRIM_DETAILS_LIMIT + 5
+        assert stats.chars_sent == 50 * (TRIM_DETAILS_LIMIT + 5)
@@ -0,0 +1,221 @@
+"""
+Test pluggable model backends.
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.agents.about_extractor_v2 import AboutExtractorV2, get_examples
+from src.models.schemas import CompanyInfoLite
+from src.modules.document_batcher import attribute_extractions, pack_documents
+from src.modules.llm_backends import (
+    FakeExtractionBackend,
+    OllamaBackend,
+    is_rate_limit_error,
+)
+
+
+def _fake(**kwargs):
+    """Create a fast, seeded fake backend."""
+    kwargs.setdefault("latency_distribution", "fixed")
+    kwargs.setdefault("latency_mean", 0.0)
+    return FakeExtractionBackend(seed=1, **kwargs)
+
+
+class TestFakeExtractionBackend:
+    """Test the offline stand-in LLM."""
+
+    def test_schema_valid_and_deterministic(self):
+        """Test extractions parse into CompanyInfoLite and repeat per text."""
+        backend = _fake()
+        first = backend.extract("Impressum\nMuster GmbH", "prompt", [])
+        second = backend.extract("Impressum\nMuster GmbH", "prompt", [])
+
+        ext = first.extractions[0]
+        assert ext.extraction_class == "company_info"
+        assert CompanyInfoLite(**ext.attributes).company_name
+        assert ext.attributes == second.extractions[0].attributes
+
+    def test_packed_batch_is_attributable(self):
+        """Test each packed document gets its own aligned extraction."""
+        docs = [("a.md", "Impressum\nAlpha"), ("b.md", "Impressum\nBeta")]
+        batch = pack_documents(docs, 1000, 8)[0]
+
+        result = _fake().extract(batch.text, "prompt", [])
+        resolved, ambiguous = attribute_extractions(
+            batch, result.extractions, "company_info"
+        )
+
+        assert set(resolved) == {"a.md", "b.md"}
+        assert not ambiguous
+
+    def test_rate_limit_injection(self):
+        """Test random and quota-based 429 errors are recognizable."""
+        with pytest.raises(Exception) as exc_info:
+            _fake(rate_limit_rate=1.0).extract("text", "prompt", [])
+        assert is_rate_limit_error(exc_info.value)
+
+        quota = _fake(requests_per_minute=2)
+        quota.extract("one", "prompt", [])
+        quota.extract("two", "prompt", [])
+        with pytest.raises(Exception) as exc_info:
+            quota.extract("three", "prompt", [])
+        assert is_rate_limit_error(exc_info.value)
+
+    def test_transient_errors_are_not_rate_limits(self):
+        """Test injected 503 errors are not classified as 429."""
+        with pytest.raises(Exception) as exc_info:
+            _fake(error_rate=1.0).extract("text", "prompt", [])
+        assert not is_rate_limit_error(exc_info.value)
+
+    def test_latency_distribution_mean(self):
+        """Test sampled latencies follow the configured mean."""
+        for distribution in ("uniform", "exponential", "lognormal"):
+            backend = FakeExtractionBackend(
+                latency_distribution=distribution,
+                latency_mean=2.0,
+                latency_sigma=0.5,
+                seed=7,
+            )
+            samples = [backend.sample_latency() for _ in range(5000)]
+            assert min(samples) >= 0
+            assert abs(sum(samples) / len(samples) - 2.0) < 0.15
+
+
+@patch("src.agents.about_extractor_v2.extraction_cache_from_settings", Mock())
+@patch("src.agents.about_extractor_v2.MinIOManager")
+def test_extractor_runs_on_fake_backend(mock_minio):
+    """Test the extractor and its retry decorator run against the fake."""
+    backend = _fake()
+    extractor = AboutExtractorV2(backend=backend)
+    extractor.cache = None
+
+    result = extractor.extract_from_markdown_text("Impressum\nMuster GmbH Berlin")
+
+    assert result.company_name.startswith("Muster")
+    assert backend.calls == 1
+
+
+@pytest.fixture
+def ollama_server():
+    """Serve a mock Ollama /api/generate that records requests."""
+    state = {"requests": [], "ports": set(), "active": 0, "max_active": 0}
+    lock = threading.Lock()
+    answer = json.dumps(
+        {
+            "extractions": [
+                {
+                    "company_info": "Muster GmbH",
+                    "company_info_attributes": {
+                        "company_name": "Muster GmbH",
+                        "owner_name": "Max Mustermann",
+                    },
+                }
+            ]
+        }
+    )
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            with lock:
+                state["requests"].append(payload)
+                state["ports"].add(self.client_address[1])
+                state["active"] += 1
+                state["max_active"] = max(state["max_active"], state["active"])
+            time.sleep(0.05)
+            with lock:
+                state["active"] -= 1
+
+            body = json.dumps({"model": payload["model"], "response": answer})
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body.encode("utf-8"))
+
+        def log_message(self, format, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        state["url"] = f"http://127.0.0.1:{httpd.server_address[1]}"
+        yield state
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+class TestOllamaBackend:
+    """Test the local Ollama backend against a mock server."""
+
+    def test_parallel_requests_share_session(self, ollama_server):
+        """Test in-flight requests are capped and connections reused."""
+        backend = OllamaBackend(
+            "llama3.2:3b", base_url=ollama_server["url"], parallel=2, keep_alive=-1
+        )
+
+        def extract(n):
+            return backend.extract(f"Impressum {n}\nMuster GmbH", "p", get_examples())
+
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            results = list(pool.map(extract, range(12)))
+        backend.close()
+
+        assert all(r.extractions for r in results)
+        assert len(ollama_server["requests"]) == 12
+        assert ollama_server["max_active"] == 2
+        assert len(ollama_server["ports"]) <= 2  # Keep-alive, no new sockets
+        assert all(r["keep_alive"] == -1 for r in ollama_server["requests"])
+
+    def test_preload(self, ollama_server):
+        """Test preloading sends a prompt-less request that loads the model."""
+        backend = OllamaBackend("llama3.2:3b", base_url=ollama_server["url"])
+
+        assert backend.preload()
+        assert ollama_server["requests"] == [
+            {"model": "llama3.2:3b", "keep_alive": 1800}
+        ]
+
+    def test_unpatchable_provider_falls_back(self, caplog):
+        """Test a provider without _requests is used as is, with a warning."""
+        with patch("langextract.providers.ollama.OllamaLanguageModel") as provider:
+            provider.return_value = Mock(spec=["infer"])
+            backend = OllamaBackend("llama3.2:3b")
+
+            assert backend.model is provider.return_value
+        assert backend.pooled is False
+        assert "not pooled" in caplog.text
+
+    def test_preload_failure_is_not_fatal(self):
+        """Test an unreachable server only fails the preload."""
+        backend = OllamaBackend("llama3.2:3b", base_url="http://127.0.0.1:9")
+        assert backend.preload() is False
+
+    @patch("src.agents.about_extractor_v2.extraction_cache_from_settings", Mock())
+    @patch("src.agents.about_extractor_v2.rate_limiter")
+    @patch("src.agents.about_extractor_v2.MinIOManager")
+    def test_extractor_skips_rate_limiter(
+        self, mock_minio, mock_rate_limiter, ollama_server
+    ):
+        """Test local extractions parse and bypass the cloud rate limiter."""
+        backend = OllamaBackend("llama3.2:3b", base_url=ollama_server["url"])
+        extractor = AboutExtractorV2(backend=backend)
+        extractor.cache = None
+
+        result = extractor.extract_from_markdown_text("Impressum\nMuster GmbH Berlin")
+
+        assert result.company_name == "Muster GmbH"
+        assert result.owner_name == "Max Mustermann"
+        mock_rate_limiter.wait_if_needed.assert_not_called()
@@ -0,0 +1,81 @@
+"""
+Test the Prometheus metrics endpoint.
+"""
+
+import urllib.error
+import urllib.request
+
+import pytest
+
+from src.modules.metrics_server import MetricsServer, render_metrics
+from src.modules.statistics import ExtractionStatistics
+
+
+def _stats():
+    stats = ExtractionStatistics()
+    stats.total_files = 3
+    stats.record_success(0.5)
+    stats.record_skip()
+    stats.record_error("a.md", "boom")
+    stats.record_stage("llm_call", 0.02)
+    stats.record_stage("llm_call", 2.0)
+    return stats
+
+
+class TestRenderMetrics:
+    """Test the text exposition format."""
+
+    def test_counters_histograms_and_gauges(self):
+        """Test counters, cumulative buckets and extra gauges are rendered."""
+        page = render_metrics(_stats(), {"extraction_work_queue_depth": lambda: 7})
+        lines = page.splitlines()
+
+        assert "extraction_files_listed_total 3" in lines
+        assert 'extraction_files_total{status="success"} 1' in lines
+        assert 'extraction_files_total{status="skipped"} 1' in lines
+        assert 'extraction_files_total{status="error"} 1' in lines
+        assert 'extraction_stage_in_flight{stage="download"} 0' in lines
+        assert (
+            'extraction_stage_latency_seconds_bucket{stage="llm_call",le="0.025"} 1'
+            in lines
+        )
+        assert (
+            'extraction_stage_latency_seconds_bucket{stage="llm_call",le="+Inf"} 2'
+            in lines
+        )
+        assert 'extraction_stage_latency_seconds_count{stage="llm_call"} 2' in lines
+        assert "# TYPE extraction_work_queue_depth gauge" in lines
+        assert "extraction_work_queue_depth 7" in lines
+        assert any(line.startswith("minio_pool_waits_total ") for line in lines)
+
+    def test_in_flight_tracks_open_stages(self):
+        """Test a stage counts as in flight while its block runs."""
+        stats = ExtractionStatistics()
+
+        with stats.time_stage("upload"):
+            assert (
+                'extraction_stage_in_flight{stage="upload"} 1'
+                in render_metrics(stats).splitlines()
+            )
+
+        assert stats.in_flight["upload"] == 0
+        assert stats.stage_latency["upload"].count == 1
+
+
+class TestMetricsServer:
+    """Test serving metrics over HTTP."""
+
+    def test_serves_metrics(self):
+        """Test /metrics is served and other paths are not."""
+        server = MetricsServer(_stats(), port=0).start()
+        try:
+            url = f"http://127.0.0.1:{server.port}"
+            with urllib.request.urlopen(f"{url}/metrics", timeout=5) as response:
+                body = response.read().decode("utf-8")
+                assert response.headers["Content-Type"].startswith("text/plain")
+            assert 'extraction_files_total{status="success"} 1' in body
+
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(f"{url}/other", timeout=5)
+        finally:
+            server.stop()
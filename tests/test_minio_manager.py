@@ -2,7 +2,9 @@
 Test MinIO manager functionality.
 """
 
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
+
+import pytest
 
 
 from src.modules.minio_manager import MinIOManager
@@ -29,6 +31,7 @@ class TestMinIOManager:
             access_key="test-key",
             secret_key="test-secret",
             secure=False,
+            http_client=ANY,
         )
 
     @patch("src.modules.minio_manager.Minio")
@@ -150,3 +153,93 @@ class TestMinIOManager:
         result = manager.object_exists("nonexistent.md")
 
         assert result is False
+
+    @patch("src.modules.minio_manager.Minio")
+    def test_iter_objects_suffix_and_cursor(self, mock_minio):
+        """Test streaming listing filters by suffix and resumes after a cursor."""
+        names = ["a/x.md", "a/x.about.json", "b/y.md"]
+        manager = MinIOManager()
+        manager.client.list_objects.return_value = iter(
+            [Mock(object_name=n, size=1, last_modified=None, etag="e") for n in names]
+        )
+
+        objects = manager.iter_objects(
+            prefix="scraped-content/", suffix=".md", start_after="a/w.md"
+        )
+
+        assert not isinstance(objects, list)
+        assert [o["object_name"] for o in objects] == ["a/x.md", "b/y.md"]
+        manager.client.list_objects.assert_called_once_with(
+            manager.bucket_name,
+            prefix="scraped-content/",
+            recursive=True,
+            start_after="a/w.md",
+        )
+
+    @patch("src.modules.minio_manager.Minio")
+    def test_iter_objects_page_size(self, mock_minio):
+        """Test page size is forwarded as max-keys."""
+        manager = MinIOManager()
+        manager.client._list_objects.return_value = iter([])
+
+        list(manager.iter_objects(prefix="p/", page_size=100))
+
+        call_kwargs = manager.client._list_objects.call_args[1]
+        assert call_kwargs["max_keys"] == 100
+        assert call_kwargs["prefix"] == "p/"
+        assert call_kwargs["delimiter"] is None
+
+    @patch("src.modules.minio_manager.time.sleep", Mock())
+    @patch("src.modules.minio_manager.Minio")
+    def test_iter_objects_resumes_interrupted_listing(self, mock_minio):
+        """Test a failed page is relisted after the last key, then raised."""
+        from minio.error import S3Error
+
+        error = S3Error("InternalError", "boom", "", "r", "h", Mock())
+
+        def pages(first, then_fail):
+            yield Mock(object_name=first, size=1, last_modified=None, etag="e")
+            if then_fail:
+                raise error
+
+        manager = MinIOManager()
+        manager.client.list_objects.side_effect = [
+            pages("a.md", True),
+            pages("b.md", False),
+        ]
+
+        assert [o["object_name"] for o in manager.iter_objects()] == ["a.md", "b.md"]
+        assert manager.client.list_objects.call_args[1]["start_after"] == "a.md"
+
+        manager.client.list_objects.side_effect = lambda *a, **kw: pages("c.md", True)
+        objects = manager.iter_objects(retries=1)
+        with pytest.raises(S3Error):
+            list(objects)
+
+    @patch("src.modules.minio_manager.Minio")
+    def test_iter_objects_page_size_without_private_api(self, mock_minio):
+        """Test listing falls back to list_objects() without _list_objects()."""
+        manager = MinIOManager()
+        manager.client = Mock(spec=["list_objects"])
+        manager.client.list_objects.return_value = iter([])
+
+        list(manager.iter_objects(prefix="p/", page_size=100))
+
+        manager.client.list_objects.assert_called_once_with(
+            manager.bucket_name, prefix="p/", recursive=True
+        )
+
+    @patch("src.modules.minio_manager.Minio")
+    def test_listen_notifications_sends_request(self, mock_minio):
+        """Test the notification request is sent before the stream is returned."""
+        from minio.datatypes import EventIterable
+
+        response = Mock(closed=False)
+        send = Mock(return_value=response)
+        manager = MinIOManager()
+        manager.client.listen_bucket_notification.return_value = EventIterable(send)
+
+        events = manager.listen_notifications(prefix="p/", suffix=".md")
+
+        send.assert_called_once_with()
+        assert events._response is response
@@ -2,11 +2,13 @@
 Test production features and statistics.
 """
 
+import threading
 from unittest.mock import patch
 
+import pytest
 
-from src.modules.retry_handler import RateLimiter
-from src.modules.statistics import ExtractionStatistics
+from src.modules.retry_handler import RateLimiter, retry_with_backoff
+from src.modules.statistics import ExtractionStatistics, LatencyHistogram
 
 
 class TestExtractionStatistics:
@@ -20,7 +22,8 @@ class TestExtractionStatistics:
         assert stats.successful == 0
         assert stats.skipped == 0
         assert stats.errors == 0
-        assert stats.processing_times == []
+        assert stats.processing_latency.count == 0
+        assert all(h.count == 0 for h in stats.stage_latency.values())
 
     def test_record_success(self):
         """Test success recording."""
@@ -28,7 +31,8 @@ class TestExtractionStatistics:
         stats.record_success(2.5)
 
         assert stats.successful == 1
-        assert stats.processing_times == [2.5]
+        assert stats.processing_latency.count == 1
+        assert stats.processing_latency.max == 2.5
         assert stats.total_files == 1
 
     def test_record_skip(self):
@@ -94,34 +98,78 @@ class TestExtractionStatistics:
             assert stats.files_per_second() == 3 / 10  # 3 files in 10 seconds
 
 
+class TestLatencyHistogram:
+    """Test fixed-memory latency histograms."""
+
+    def test_percentiles_within_one_bucket(self):
+        """Test percentiles land within one bucket of the exact value."""
+        histogram = LatencyHistogram()
+        for ms in range(1, 1001):
+            histogram.record(ms / 1000)
+
+        assert histogram.count == 1000
+        assert histogram.max == 1.0
+        for p, exact in ((50, 0.5), (90, 0.9), (99, 0.99)):
+            assert exact <= histogram.percentile(p) <= exact * LatencyHistogram.GROWTH
+        assert histogram.percentile(100) == 1.0
+
+    def test_empty_and_extremes(self):
+        """Test empty histograms and out-of-range samples."""
+        histogram = LatencyHistogram()
+        assert histogram.percentile(99) == 0.0
+
+        histogram.record(0.0)
+        histogram.record(10_000.0)
+        assert histogram.percentile(50) == LatencyHistogram.MIN_SECONDS
+        assert histogram.percentile(100) == 10_000.0
+
+    def test_thread_safe_stage_summary(self):
+        """Test concurrent recording loses no samples and is summarized."""
+        stats = ExtractionStatistics()
+
+        def work():
+            for _ in range(1000):
+                stats.record_stage("download", 0.01)
+                stats.record_success(0.02)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        summary = stats.get_summary()
+        assert stats.successful == 8000
+        assert summary["stage_latency_ms"]["download"]["count"] == 8000
+        assert 10.0 <= summary["stage_latency_ms"]["download"]["p99"] <= 11.0
+        assert "upload" not in summary["stage_latency_ms"]
+        assert summary["processing_latency_ms"]["count"] == 8000
+
+
 class TestRateLimiter:
     """Test rate limiting functionality."""
 
     def test_init(self):
         """Test rate limiter initialization."""
-        limiter = RateLimiter(requests_per_minute=10, delay_between_requests=6)
+        limiter = RateLimiter(
+            requests_per_minute=10, delay_between_requests=6, tokens_per_minute=0
+        )
 
         assert limiter.requests_per_minute == 10
         assert limiter.delay_between_requests == 6
-        assert limiter.request_times == []
+        assert limiter.tokens_per_minute == 0
+        assert limiter._requests.capacity == 10
+        assert limiter._tokens is None
 
-    @patch("time.time")
-    def test_can_proceed_true(self, mock_time):
+    def test_can_proceed_true(self):
         """Test rate limiter allows request."""
-        mock_time.return_value = 1000.0
-
         limiter = RateLimiter(requests_per_minute=10, delay_between_requests=6)
 
         # First request should always be allowed
         assert limiter.can_proceed() is True
 
-    @patch("time.time")
-    def test_can_proceed_rate_limit(self, mock_time):
+    def test_can_proceed_rate_limit(self):
         """Test rate limiter blocks when rate limit exceeded."""
-        # Simulate 10 requests within 1 minute
-        base_time = 1000.0
-        mock_time.side_effect = [base_time + i for i in range(15)]
-
         limiter = RateLimiter(requests_per_minute=10, delay_between_requests=0)
 
         # First 10 requests should be allowed
@@ -132,29 +180,188 @@ class TestRateLimiter:
         # 11th request should be blocked
         assert limiter.can_proceed() is False
 
-    @patch("time.time")
-    def test_can_proceed_delay(self, mock_time):
+    def test_can_proceed_delay(self):
         """Test rate limiter blocks when delay not passed."""
-        # Simulate requests with insufficient delay
-        base_time = 1000.0
-        mock_time.side_effect = [base_time, base_time + 2]  # Only 2 seconds passed
-
         limiter = RateLimiter(requests_per_minute=10, delay_between_requests=6)
 
         # First request
         assert limiter.can_proceed() is True
         limiter.record_request()
 
-        # Second request should be blocked (need 6 seconds, only 2 passed)
+        # Second request should be blocked until 6 seconds have passed
         assert limiter.can_proceed() is False
 
     def test_record_request(self):
         """Test request recording."""
         limiter = RateLimiter(requests_per_minute=10, delay_between_requests=6)
 
-        assert len(limiter.request_times) == 0
-
         limiter.record_request()
 
-        assert len(limiter.request_times) == 1
-        assert limiter.request_times[0] > 0
+        assert limiter._requests.tokens == pytest.approx(9, abs=0.01)
+        assert 5.9 < limiter.reserve() <= 6.0
+
+    def test_reserve_spacing(self):
+        """Test reservations are spaced by the refill interval once burst is used."""
+        limiter = RateLimiter(requests_per_minute=60, delay_between_requests=0)
+        limiter._requests.tokens = 0
+
+        delays = [limiter.reserve() for _ in range(3)]
+
+        assert delays[0] > 0.9 and delays[0] <= 1.0
+        assert 1.9 < delays[1] <= 2.0
+        assert 2.9 < delays[2] <= 3.0
+
+    def test_token_budget(self):
+        """Test large token estimates wait for the tokens-per-minute budget."""
+        limiter = RateLimiter(
+            requests_per_minute=1000, delay_between_requests=0, tokens_per_minute=600
+        )
+
+        assert limiter.reserve(tokens=600) == 0
+        # Budget refills at 10 tokens/second
+        assert 29.0 < limiter.reserve(tokens=300) <= 30.0
+
+    def test_thread_safe_under_contention(self):
+        """Test concurrent workers never exceed the configured budget."""
+        import time
+
+        limiter = RateLimiter(requests_per_minute=1200, delay_between_requests=0)
+        limiter._requests.tokens = 0
+        sent = []
+
+        def worker():
+            deadline = time.monotonic() + 0.5
+            while True:
+                limiter.wait_if_needed()
+                now = time.monotonic()
+                if now > deadline:
+                    break
+                sent.append(now)
+
+        threads = [threading.Thread(target=worker) for _ in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # 20 requests/second for 0.5 seconds, allow one request of jitter
+        assert len(sent) <= 11
+
+
+class TestRetryWithBackoff:
+    """Test retry decorator."""
+
+    def test_async_retry(self):
+        """Test coroutine functions are retried without blocking the loop."""
+        import asyncio
+
+        calls = []
+
+        @retry_with_backoff(max_retries=2, delay=0)
+        async def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise ValueError("transient")
+            return "ok"
+
+        assert asyncio.run(flaky()) == "ok"
+        assert len(calls) == 3
+
+
+class TestWorkQueue:
+    """Test streaming listing producer."""
+
+    def test_feed_work_queue_bounded(self):
+        """Test the producer fills the queue lazily and stops every worker."""
+        import queue
+        from unittest.mock import Mock
+
+        from src.agents.run_batch_production import _STOP, feed_work_queue
+
+        minio_mgr = Mock()
+        minio_mgr.iter_objects.return_value = (
+            {"object_name": f"scraped-content/{i}.md"} for i in range(10)
+        )
+        stats = ExtractionStatistics()
+        work_queue = queue.Queue(maxsize=2)
+
+        producer = threading.Thread(
+            target=feed_work_queue, args=(minio_mgr, work_queue, stats, 3)
+        )
+        producer.start()
+
+        received = []
+        stops = 0
+        while stops < 3:
+            item = work_queue.get(timeout=5)
+            if item is _STOP:
+                stops += 1
+            else:
+                assert work_queue.qsize() <= 2
+                received.append(item)
+        producer.join(timeout=5)
+
+        assert len(received) == 10
+        assert stats.total_files == 10
+
+    def test_feed_work_queue_records_listing_failure(self):
+        """Test a listing that fails for good marks the run incomplete."""
+        import queue
+        from unittest.mock import Mock
+
+        from src.agents.run_batch_production import _STOP, feed_work_queue
+
+        def listing(**kwargs):
+            yield {"object_name": "scraped-content/0.md"}
+            raise RuntimeError("listing gave up")
+
+        minio_mgr = Mock()
+        minio_mgr.iter_objects.side_effect = listing
+        stats = ExtractionStatistics()
+        work_queue = queue.Queue()
+
+        feed_work_queue(minio_mgr, work_queue, stats, 2)
+
+        assert [work_queue.get_nowait() for _ in range(3)][1:] == [_STOP, _STOP]
+        assert stats.total_files == 1
+        assert stats.errors == 1
+        assert stats.get_summary()["complete"] is False
+
+    @patch.object(ExtractionStatistics, "save_to_file")
+    @patch("src.agents.run_batch_production.AboutExtractorV2")
+    def test_run_fails_after_listing_failure(self, mock_extractor, mock_save):
+        """Test the run still saves its stats but does not end as a success."""
+        from benchmarks.fakes import InMemoryMinio
+        from src.agents.run_batch_production import run_batch_extraction_parallel
+        from src.modules.minio_manager import MinIOManager
+
+        def iter_objects(prefix="", suffix="", **kwargs):
+            if suffix == ".md":
+                raise RuntimeError("gave up")
+            return iter([])
+
+        mock_extractor.return_value.fingerprint = "fp"
+        InMemoryMinio.reset()
+        with (
+            patch(
+                "src.modules.minio_manager.minio_client", return_value=InMemoryMinio()
+            ),
+            patch.object(MinIOManager, "iter_objects", side_effect=iter_objects),
+            pytest.raises(RuntimeError, match="listing failed: gave up"),
+        ):
+            run_batch_extraction_parallel()
+
+        mock_save.assert_called_once()
+
+    def test_take_group_stops_at_marker(self):
+        """Test grouping takes queued names without blocking past a stop."""
+        import queue
+
+        from src.agents.run_batch_production import _STOP, take_group
+
+        work_queue = queue.Queue()
+        for item in ["a.md", "b.md", "c.md", _STOP]:
+            work_queue.put(item)
+
+        assert take_group(work_queue, 2) == ["a.md", "b.md"]
+        assert take_group(work_queue, 8) == ["c.md", _STOP]
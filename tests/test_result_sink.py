@@ -0,0 +1,197 @@
+"""
+Test the sharded result sink.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from src.agents.run_batch_production import mark_saved, process_single_file
+from src.models.schemas import CompanyInfoLite
+from src.modules.result_sink import ShardedResultSink, decompress
+from src.modules.run_journal import EXTRACTED, UPLOADED, RunJournal
+from src.modules.skip_index import CompletedIndex
+from src.modules.statistics import ExtractionStatistics
+
+
+def _minio(fail_puts=False):
+    """Create a MinIOManager stand-in backed by a dictionary."""
+    objects = {}
+    minio_mgr = Mock()
+    minio_mgr.objects = objects
+
+    def put_object(name, data, length, content_type=None):
+        if fail_puts:
+            return False
+        objects[name] = data
+        return True
+
+    def iter_objects(prefix="", suffix="", **kwargs):
+        for name in sorted(objects):
+            if name.startswith(prefix) and name.endswith(suffix):
+                yield {"object_name": name}
+
+    def download_object(name, as_text=True):
+        data = objects.get(name)
+        return data.decode("utf-8") if as_text and data is not None else data
+
+    minio_mgr.put_object.side_effect = put_object
+    minio_mgr.iter_objects.side_effect = iter_objects
+    minio_mgr.download_object.side_effect = download_object
+    return minio_mgr
+
+
+class TestShardedResultSink:
+    """Test shard layout, manifests and commit callbacks."""
+
+    @pytest.mark.parametrize("compression", ["zstd", "gzip"])
+    def test_shards_and_manifest(self, compression):
+        """Test results are split into shards the manifest points into."""
+        minio_mgr = _minio()
+        committed = []
+        sink = ShardedResultSink(
+            minio_mgr,
+            prefix="extracted",
+            compression=compression,
+            max_records=2,
+            on_commit=lambda sources, metadata: committed.append(sources),
+        )
+
+        for n in range(3):
+            assert sink.add(f"scraped-content/{n}.md", {"company_name": f"Ä {n}"})
+        assert committed == [["scraped-content/0.md", "scraped-content/1.md"]]
+
+        sink.close()
+        assert committed[-1] == ["scraped-content/2.md"]
+        assert sink.shards_written == 2
+        assert sink.records_written == 3
+
+        shards = [k for k in minio_mgr.objects if "/manifest/" not in k]
+        assert len(shards) == 2
+        assert all(k.startswith("extracted/part-") for k in shards)
+
+        entries = list(sink.iter_manifest())
+        assert [e["source"] for e in entries] == [
+            f"scraped-content/{n}.md" for n in range(3)
+        ]
+        # Manifest byte ranges address single lines of the uncompressed shard
+        second = entries[1]
+        raw = decompress(minio_mgr.objects[second["shard"]], compression)
+        line = raw[second["offset"] : second["offset"] + second["length"]]
+        assert line.decode("utf-8").startswith('{"source": "scraped-content/1.md"')
+
+        records = list(sink.read_shard(second["shard"]))
+        assert records[1] == {
+            "source": "scraped-content/1.md",
+            "data": {"company_name": "Ä 1"},
+        }
+
+    def test_failed_shard_is_not_committed(self):
+        """Test a failed shard upload reports no sources as saved."""
+        committed = []
+        sink = ShardedResultSink(
+            _minio(fail_puts=True),
+            compression="gzip",
+            max_records=1,
+            on_commit=lambda sources, metadata: committed.append(sources),
+        )
+
+        assert sink.add("scraped-content/a.md", {}) is False
+        assert committed == []
+        assert sink.records_written == 0
+
+    def test_failed_shard_reports_buffered_sources(self):
+        """Test results buffered before a failed write go to on_failure."""
+        failed = []
+        sink = ShardedResultSink(
+            _minio(fail_puts=True),
+            compression="gzip",
+            max_records=3,
+            on_failure=failed.append,
+        )
+
+        assert sink.add("scraped-content/a.md", {})
+        assert sink.add("scraped-content/b.md", {})
+        assert sink.add("scraped-content/c.md", {}) is False
+        assert failed == [["scraped-content/a.md", "scraped-content/b.md"]]
+
+        assert sink.add("scraped-content/d.md", {})
+        assert sink.close() is False
+        assert failed[-1] == ["scraped-content/d.md"]
+
+    def test_unknown_compression(self):
+        """Test an unsupported codec is rejected at construction."""
+        with pytest.raises(ValueError):
+            ShardedResultSink(_minio(), compression="lz4")
+
+
+class TestShardedRunner:
+    """Test the production runner with sharded output."""
+
+    def test_journal_marks_upload_on_shard_commit(self, tmp_path):
+        """Test a buffered result stays pending until its shard is written."""
+        journal = RunJournal(str(tmp_path / "journal.sqlite3"))
+        minio_mgr = _minio()
+        minio_mgr.download_object.side_effect = None
+        minio_mgr.download_object.return_value = "Impressum Mustermann GmbH"
+        extractor = Mock()
+        extractor.extract_from_markdown_text.return_value = CompanyInfoLite(
+            company_name="Mustermann GmbH"
+        )
+        completed = CompletedIndex()
+
+        def on_commit(names, metadata):
+            for name, meta in zip(names, metadata):
+                mark_saved(name, journal, completed, meta)
+
+        sink = ShardedResultSink(minio_mgr, compression="gzip", on_commit=on_commit)
+
+        result = process_single_file(
+            extractor,
+            minio_mgr,
+            "scraped-content/a.md",
+            ExtractionStatistics(),
+            completed,
+            journal,
+            sink,
+        )
+
+        assert result["status"] == "success"
+        minio_mgr.upload_json.assert_not_called()
+        assert journal.get("scraped-content/a.md")[0] == EXTRACTED
+        assert "scraped-content/a.about.json" not in completed
+
+        sink.close()
+        assert journal.get("scraped-content/a.md")[0] == UPLOADED
+        assert "scraped-content/a.about.json" in completed
+
+    def test_failed_shard_turns_successes_into_errors(self):
+        """Test the stats do not count results whose shard was lost."""
+        minio_mgr = _minio(fail_puts=True)
+        minio_mgr.download_object.side_effect = None
+        minio_mgr.download_object.return_value = "Impressum Mustermann GmbH"
+        extractor = Mock()
+        extractor.extract_from_markdown_text.return_value = CompanyInfoLite(
+            company_name="Mustermann GmbH"
+        )
+        stats = ExtractionStatistics()
+
+        def on_failure(sources):
+            for source in sources:
+                stats.record_lost(source, "Shard upload failed")
+
+        sink = ShardedResultSink(
+            minio_mgr, compression="gzip", max_records=2, on_failure=on_failure
+        )
+
+        for name in ("scraped-content/a.md", "scraped-content/b.md"):
+            process_single_file(
+                extractor, minio_mgr, name, stats, CompletedIndex(), None, sink
+            )
+
+        assert stats.successful == 0
+        assert stats.errors == 2
+        assert [e["file"] for e in stats.error_details] == [
+            "scraped-content/a.md",
+            "scraped-content/b.md",
+        ]
@@ -0,0 +1,149 @@
+"""
+Test the crash-safe run journal.
+"""
+
+from unittest.mock import Mock
+
+from src.agents.run_batch_production import (
+    process_batch,
+    process_single_file,
+    replay_pending_uploads,
+)
+from src.models.schemas import CompanyInfoLite
+from src.modules.run_journal import (
+    DOWNLOADED,
+    EXTRACTED,
+    LISTED,
+    UPLOADED,
+    RunJournal,
+)
+from src.modules.statistics import ExtractionStatistics
+
+OBJECT = "scraped-content/a.md"
+
+
+def _minio(upload_ok=True):
+    """Create a MinIOManager stand-in with one markdown page."""
+    minio_mgr = Mock()
+    minio_mgr.download_object.return_value = "Impressum Mustermann GmbH"
+    minio_mgr.object_exists.return_value = False
+    minio_mgr.upload_json.return_value = upload_ok
+    return minio_mgr
+
+
+def _extractor():
+    extractor = Mock()
+    extractor.extract_from_markdown_text.return_value = CompanyInfoLite(
+        company_name="Mustermann GmbH"
+    )
+    extractor.extract_batch.side_effect = lambda docs: {
+        name: CompanyInfoLite(company_name="Mustermann GmbH") for name, _ in docs
+    }
+    return extractor
+
+
+class TestRunJournal:
+    """Test state tracking and persistence."""
+
+    def test_states_and_pending_uploads(self, tmp_path):
+        """Test later states win and extracted payloads are pending."""
+        journal = RunJournal(str(tmp_path / "journal.sqlite3"))
+        journal.mark_listed("a.md")
+        journal.mark_listed("b.md")
+        journal.record("a.md", DOWNLOADED)
+        journal.record("a.md", EXTRACTED, {"company_name": "A"})
+        journal.mark_listed("a.md")  # Relisting never downgrades
+
+        assert journal.get("a.md") == (EXTRACTED, {"company_name": "A"})
+        assert journal.get("b.md") == (LISTED, None)
+        assert journal.get("c.md") == (None, None)
+        assert list(journal.pending_uploads()) == [("a.md", {"company_name": "A"})]
+
+        journal.record("a.md", UPLOADED)
+        assert list(journal.pending_uploads()) == []
+        assert journal.counts() == {LISTED: 1, UPLOADED: 1}
+
+    def test_survives_reopen(self, tmp_path):
+        """Test committed states are visible to a new process."""
+        path = str(tmp_path / "journal.sqlite3")
+        first = RunJournal(path)
+        first.record("a.md", EXTRACTED, {"company_name": "Ä GmbH"})
+        first.close()
+
+        second = RunJournal(path)
+        assert second.get("a.md") == (EXTRACTED, {"company_name": "Ä GmbH"})
+
+
+class TestJournaledRunner:
+    """Test exactly-once uploads across a crash."""
+
+    def test_failed_upload_is_replayed_without_llm(self, tmp_path):
+        """Test a result whose upload failed is replayed, not re-extracted."""
+        journal = RunJournal(str(tmp_path / "journal.sqlite3"))
+        extractor = _extractor()
+
+        result = process_single_file(
+            extractor,
+            _minio(upload_ok=False),
+            OBJECT,
+            ExtractionStatistics(),
+            journal=journal,
+        )
+        assert result["status"] == "error"
+        assert journal.get(OBJECT)[0] == EXTRACTED
+
+        # Restart: replay uploads the journaled payload
+        minio_mgr = _minio()
+        stats = ExtractionStatistics()
+        assert replay_pending_uploads(journal, minio_mgr, stats) == 1
+        minio_mgr.upload_json.assert_called_once_with(
+            "scraped-content/a.about.json",
+            CompanyInfoLite(company_name="Mustermann GmbH").model_dump(),
+        )
+        assert stats.replayed_uploads == 1
+
+        # The listing reaches the object again: skipped without MinIO
+        minio_mgr = _minio()
+        result = process_single_file(extractor, minio_mgr, OBJECT, stats, None, journal)
+        assert result["status"] == "skipped"
+        assert minio_mgr.method_calls == []
+        extractor.extract_from_markdown_text.assert_called_once()
+
+    def test_single_file_uploads_extracted_payload(self, tmp_path):
+        """Test an object journaled as extracted skips download and LLM."""
+        journal = RunJournal(str(tmp_path / "journal.sqlite3"))
+        journal.record(OBJECT, EXTRACTED, {"company_name": "A"})
+        extractor = _extractor()
+        minio_mgr = _minio()
+
+        result = process_single_file(
+            extractor, minio_mgr, OBJECT, ExtractionStatistics(), None, journal
+        )
+
+        assert result["status"] == "success"
+        minio_mgr.download_object.assert_not_called()
+        extractor.extract_from_markdown_text.assert_not_called()
+        minio_mgr.upload_json.assert_called_once_with(
+            "scraped-content/a.about.json", {"company_name": "A"}
+        )
+        assert journal.get(OBJECT) == (UPLOADED, None)
+
+    def test_batch_mixes_replayed_and_fresh(self, tmp_path):
+        """Test batching only sends un-journaled objects to the LLM."""
+        journal = RunJournal(str(tmp_path / "journal.sqlite3"))
+        journal.record("scraped-content/a.md", EXTRACTED, {"company_name": "A"})
+        journal.record("scraped-content/b.md", UPLOADED)
+        extractor = _extractor()
+        minio_mgr = _minio()
+        names = ["scraped-content/a.md", "scraped-content/b.md", "scraped-content/c.md"]
+
+        results = process_batch(
+            extractor, minio_mgr, names, ExtractionStatistics(), None, journal
+        )
+
+        assert [r["status"] for r in results] == ["success", "skipped", "success"]
+        extractor.extract_batch.assert_called_once()
+        assert [name for name, _ in extractor.extract_batch.call_args[0][0]] == [
+            "scraped-content/c.md"
+        ]
+        assert journal.counts() == {UPLOADED: 3}
@@ -0,0 +1,166 @@
+"""
+Test completed-results skip index.
+"""
+
+from unittest.mock import Mock
+
+from src.agents.run_batch_production import process_single_file
+from src.models.schemas import CompanyInfoLite
+from src.modules.skip_index import (
+    CompletedIndex,
+    parse_provenance,
+    provenance_metadata,
+)
+from src.modules.statistics import ExtractionStatistics
+
+RESULT = "scraped-content/a.about.json"
+
+
+def _mock_minio(names):
+    """Create a MinIOManager stand-in listing the given object names."""
+    minio_mgr = Mock()
+
+    def iter_objects(prefix="", recursive=True, suffix=None, **kwargs):
+        for name in names:
+            if name.startswith(prefix) and (not suffix or name.endswith(suffix)):
+                yield {"object_name": name}
+
+    minio_mgr.iter_objects = Mock(side_effect=iter_objects)
+    return minio_mgr
+
+
+class TestCompletedIndex:
+    """Test skip index construction and persistence."""
+
+    def test_build_from_listing(self):
+        """Test only result keys are indexed from a single listing."""
+        minio_mgr = _mock_minio(
+            ["scraped-content/a.md", "scraped-content/a.about.json", "x/b.about.json"]
+        )
+
+        index = CompletedIndex.build(minio_mgr, prefix="scraped-content/")
+
+        assert "scraped-content/a.about.json" in index
+        assert "scraped-content/a.md" not in index
+        assert "x/b.about.json" not in index
+        assert len(index) == 1
+        minio_mgr.iter_objects.assert_called_once()
+        minio_mgr.object_exists.assert_not_called()
+
+    def test_persisted_snapshot_skips_listing(self, tmp_path):
+        """Test a persisted snapshot is reused and extended across runs."""
+        path = str(tmp_path / "completed.txt")
+        first = CompletedIndex.build(_mock_minio(["a.about.json"]), persist_path=path)
+        first.add("b.about.json")
+        first.close()
+
+        minio_mgr = _mock_minio([])
+        second = CompletedIndex.build(minio_mgr, persist_path=path)
+
+        assert "a.about.json" in second
+        assert "b.about.json" in second
+        minio_mgr.iter_objects.assert_not_called()
+
+    def test_refresh_relists(self, tmp_path):
+        """Test refresh ignores the snapshot."""
+        path = str(tmp_path / "completed.txt")
+        CompletedIndex.build(_mock_minio(["old.about.json"]), persist_path=path).close()
+
+        index = CompletedIndex.build(
+            _mock_minio(["new.about.json"]), persist_path=path, refresh=True
+        )
+
+        assert "new.about.json" in index
+        assert "old.about.json" not in index
+
+
+class TestIncremental:
+    """Test provenance-based re-extraction decisions."""
+
+    def _index(self, **kwargs):
+        metadata = {
+            "X-Amz-Meta-Source-Etag": "etag-1",
+            "X-Amz-Meta-Extraction-Fingerprint": "fp-1",
+        }
+        minio_mgr = Mock()
+        minio_mgr.iter_objects.return_value = [
+            {"object_name": RESULT, "metadata": metadata},
+            {"object_name": "scraped-content/old.about.json", "metadata": {}},
+        ]
+        index = CompletedIndex.build(
+            minio_mgr, prefix="scraped-content/", fingerprint="fp-1", **kwargs
+        )
+        assert minio_mgr.iter_objects.call_args.kwargs["include_user_meta"] is True
+        return index
+
+    def test_parse_provenance(self):
+        """Test listing metadata and our own metadata parse alike."""
+        own = provenance_metadata({"etag": "e", "last_modified": None}, "fp")
+
+        assert parse_provenance(own) == ("e", "fp")
+        assert parse_provenance({"X-Amz-Meta-Extraction-Fingerprint": "fp"}) == (
+            "",
+            "fp",
+        )
+        assert parse_provenance({"content-type": "application/json"}) is None
+        assert parse_provenance(None) is None
+
+    def test_is_current(self):
+        """Test only an unchanged source and config keep a result."""
+        index = self._index()
+
+        assert index.incremental
+        assert index.is_current(RESULT, {"etag": "etag-1"})
+        assert not index.is_current(RESULT, {"etag": "etag-2"})
+        assert not index.is_current("scraped-content/b.about.json", {"etag": "x"})
+
+        index.fingerprint = "fp-2"  # Prompt, examples or model changed
+        assert not index.is_current(RESULT, {"etag": "etag-1"})
+
+    def test_unversioned_results(self):
+        """Test results without provenance are kept unless refresh is asked."""
+        old = "scraped-content/old.about.json"
+
+        assert self._index().is_current(old, {"etag": "e"})
+        assert not self._index(refresh_unversioned=True).is_current(old, {"etag": "e"})
+
+    def test_snapshot_keeps_provenance(self, tmp_path):
+        """Test provenance survives the snapshot and later adds override it."""
+        path = str(tmp_path / "completed.txt")
+        first = self._index(persist_path=path)
+        first.add(RESULT, provenance_metadata({"etag": "etag-2"}, "fp-1"))
+        first.close()
+
+        second = CompletedIndex.build(Mock(), persist_path=path, fingerprint="fp-1")
+
+        assert second.is_current(RESULT, {"etag": "etag-2"})
+        assert not second.is_current(RESULT, {"etag": "etag-1"})
+
+    def test_runner_refreshes_stale_result(self):
+        """Test a changed source is re-extracted and stored with provenance."""
+        minio_mgr = Mock()
+        minio_mgr.download_object.return_value = "Impressum Mustermann GmbH"
+        minio_mgr.upload_json.return_value = True
+        extractor = Mock(fingerprint="fp-1")
+        extractor.extract_from_markdown_text.return_value = CompanyInfoLite(
+            company_name="Mustermann GmbH"
+        )
+        stats = ExtractionStatistics()
+        index = self._index()
+        source = {"object_name": "scraped-content/a.md", "etag": "etag-2"}
+
+        result = process_single_file(
+            extractor, minio_mgr, source["object_name"], stats, index, source=source
+        )
+
+        assert result["status"] == "success"
+        assert stats.refreshed == 1
+        metadata = minio_mgr.upload_json.call_args.kwargs["metadata"]
+        assert parse_provenance(metadata) == ("etag-2", "fp-1")
+        assert index.is_current(RESULT, source)
+
+        again = process_single_file(
+            extractor, minio_mgr, source["object_name"], stats, index, source=source
+        )
+        assert again["status"] == "skipped"
+        minio_mgr.object_exists.assert_not_called()
@@ -0,0 +1,35 @@
+"""
+Test that the entry modules import fast and without side effects.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.bench_import import ENTRY_MODULES, LAZY_PACKAGES, import_profile
+from src.modules.minio_manager import MinIOManager
+
+# Generous ceiling for slow CI machines; a regression that loads
+# langextract or langgraph at import costs well over a second on its own
+IMPORT_BUDGET_SECONDS = 2.0
+
+
+@pytest.mark.parametrize("module", ENTRY_MODULES)
+def test_entry_module_imports_lazily(module):
+    """Test importing an entry module skips heavy packages and the network."""
+    # import_profile() points MinIO at a closed port: a bucket check at
+    # import time would make the import fail
+    times = import_profile(module)
+
+    loaded = {name.split(".")[0] for name in times}
+    assert not loaded & set(LAZY_PACKAGES)
+    assert times[module] / 1e6 < IMPORT_BUDGET_SECONDS
+
+
+@patch("src.modules.minio_manager.Minio")
+def test_bucket_checked_once_per_process(mock_minio):
+    """Test only the first MinIOManager checks the bucket."""
+    for _ in range(3):
+        MinIOManager()
+
+    mock_minio.return_value.bucket_exists.assert_called_once()
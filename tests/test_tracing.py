@@ -0,0 +1,101 @@
+"""
+Test span tracing.
+"""
+
+import importlib
+import json
+
+import pytest
+
+from src.modules import tracing
+from src.modules.retry_handler import retry_with_backoff
+from src.modules.tracing import span, start_tracing, stop_tracing
+
+
+@pytest.fixture
+def trace_file(tmp_path):
+    """Enable tracing into a temporary file and load its events."""
+    path = tmp_path / "trace.json"
+    start_tracing(str(path))
+    try:
+        yield lambda: json.loads(path.read_text(encoding="utf-8"))
+    finally:
+        stop_tracing()
+
+
+class TestTracing:
+    """Test Chrome trace output and span hierarchy."""
+
+    def test_disabled_span_is_shared_noop(self):
+        """Test disabled tracing allocates nothing per span."""
+        assert tracing._tracer is None
+        assert span("a") is span("b", object="x")
+
+    def test_nested_spans_and_retries(self, trace_file):
+        """Test retry attempts and backoff nest under their parent span."""
+        calls = []
+
+        @retry_with_backoff(max_retries=2, delay=0)
+        def flaky():
+            with span("minio.download", object="a.md"):
+                calls.append(1)
+                if len(calls) == 1:
+                    raise RuntimeError("503")
+            return "ok"
+
+        with span("file", object="a.md"):
+            assert flaky() == "ok"
+        stop_tracing()
+
+        events = [e for e in trace_file() if e["ph"] == "X"]
+        by_name = {}
+        for event in events:
+            by_name.setdefault(event["name"], []).append(event)
+
+        root = by_name["file"][0]
+        attempts = by_name["retry.attempt"]
+        assert [a["args"]["attempt"] for a in attempts] == [1, 2]
+        assert attempts[0]["args"]["error"] == "RuntimeError"
+        assert all(a["args"]["parent_id"] == root["args"]["span_id"] for a in attempts)
+        assert (
+            by_name["retry.backoff"][0]["args"]["parent_id"] == root["args"]["span_id"]
+        )
+
+        downloads = by_name["minio.download"]
+        assert [d["args"]["parent_id"] for d in downloads] == [
+            a["args"]["span_id"] for a in attempts
+        ]
+        assert root["dur"] >= attempts[0]["dur"] + attempts[1]["dur"]
+        assert "parent_id" not in root["args"]
+
+    def test_flushes_in_chunks(self, tmp_path):
+        """Test a partially written trace still holds flushed events."""
+        path = tmp_path / "trace.json"
+        tracer = tracing.Tracer(str(path), flush_every=2)
+        for n in range(3):
+            with tracer.span("step", n=n):
+                pass
+
+        written = path.read_text(encoding="utf-8")
+        assert written.count('"name": "step"') == 2
+
+        tracer.close()
+        events = json.loads(path.read_text(encoding="utf-8"))
+        assert [e["args"]["n"] for e in events if e["ph"] == "X"] == [0, 1, 2]
+
+    def test_enabled_only_from_settings_call(self, tmp_path, monkeypatch):
+        """Test TRACE_ENABLED takes effect in tracing_from_settings, not on import."""
+        path = tmp_path / "trace.json"
+        monkeypatch.setattr(tracing.settings, "trace_enabled", True)
+        monkeypatch.setattr(tracing.settings, "trace_path", str(path))
+        monkeypatch.setattr(tracing.atexit, "register", lambda fn: None)
+
+        importlib.reload(tracing)
+        assert tracing._tracer is None
+        assert not path.exists()
+
+        try:
+            assert tracing.tracing_from_settings() is tracing._tracer
+            assert path.exists()
+        finally:
+            tracing.stop_tracing()
@@ -0,0 +1,189 @@
+"""
+Test lease-based work claiming across runner nodes.
+"""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from benchmarks.fakes import InMemoryMinio
+from src.agents.run_batch_production import claim_objects
+from src.modules.minio_manager import MinIOManager
+from src.modules.skip_index import CompletedIndex
+from src.modules.statistics import ExtractionStatistics
+from src.modules.work_leases import MinIOLeaseStore, SQLiteLeaseStore, WorkLeases
+
+NAME = "scraped-content/a.md"
+
+
+@pytest.fixture(params=["sqlite", "minio"])
+def store(request, tmp_path):
+    """Both lease stores: SQLite and marker objects with conditional PUTs."""
+    if request.param == "sqlite":
+        store = SQLiteLeaseStore(str(tmp_path / "leases.sqlite3"))
+        yield store
+        store.close()
+        return
+
+    InMemoryMinio.reset()
+    with patch("src.modules.minio_manager.minio_client", return_value=InMemoryMinio()):
+        yield MinIOLeaseStore(MinIOManager())
+    InMemoryMinio.reset()
+
+
+class TestLeaseStores:
+    """Test claim, expiry, done markers and release on both stores."""
+
+    def test_one_claim_wins(self, store):
+        """Test concurrent claims of one object succeed exactly once."""
+        tokens = []
+        barrier = threading.Barrier(8)
+
+        def claim(owner):
+            barrier.wait()
+            tokens.append(store.acquire(NAME, owner, ttl=60))
+
+        threads = [threading.Thread(target=claim, args=(f"n{i}",)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len([token for token in tokens if token]) == 1
+
+    def test_done_marker_blocks_same_version(self, store):
+        """Test finished work is not claimed again unless its version changed."""
+        token = store.acquire(NAME, "a", ttl=60, version="v1")
+        assert store.release(NAME, "a", token, done=True, version="v1")
+
+        assert store.acquire(NAME, "b", ttl=60, version="v1") is None
+        assert store.acquire(NAME, "b", ttl=60, version="v2") is not None
+
+    def test_expired_lease_is_taken_over(self, store):
+        """Test a crashed node's lease expires and its renewal then fails."""
+        stale = store.acquire(NAME, "a", ttl=0.2)
+        assert store.acquire(NAME, "b", ttl=60) is None
+        time.sleep(0.25)
+
+        assert store.acquire(NAME, "b", ttl=60) is not None
+        assert store.renew(NAME, "a", stale, ttl=60) is None
+
+    def test_release_for_retry(self, store):
+        """Test a failed object's lease is removed and can be claimed again."""
+        token = store.acquire(NAME, "a", ttl=60)
+        renewed = store.renew(NAME, "a", token, ttl=60)
+
+        assert renewed is not None
+        assert not store.release(NAME, "a", token, done=False)  # Outdated token
+        assert store.release(NAME, "a", renewed, done=False)
+        assert store.acquire(NAME, "b", ttl=60) is not None
+
+
+class TestWorkLeases:
+    """Test the per-node lease manager."""
+
+    def test_renewal_keeps_claim_until_close(self, tmp_path):
+        """Test held leases outlive their TTL and are freed on close."""
+        path = str(tmp_path / "leases.sqlite3")
+        stats = ExtractionStatistics()
+        first = WorkLeases(SQLiteLeaseStore(path), owner="a", ttl=0.3)
+        second = WorkLeases(SQLiteLeaseStore(path), owner="b", ttl=0.3, stats=stats)
+
+        assert first.claim(NAME)
+        time.sleep(0.5)
+        assert not second.claim(NAME)
+        assert stats.claimed_elsewhere == 1
+        assert first.held == 1
+
+        first.close()
+        assert second.claim(NAME)
+        second.release(NAME, done=True)
+        second.close()
+        assert first.lost == 0
+
+    def test_lost_lease_is_dropped(self, tmp_path):
+        """Test a lease taken over by another node stops being renewed."""
+        store = SQLiteLeaseStore(str(tmp_path / "leases.sqlite3"))
+        leases = WorkLeases(store, owner="a", ttl=60)
+        assert leases.claim(NAME)
+        store._conn.execute("DELETE FROM leases")
+
+        leases.renew_all()
+
+        assert leases.held == 0
+        assert leases.lost == 1
+        leases.close()
+
+
+def test_claim_objects_skips_leases_for_done_results():
+    """Test objects with a current result are kept without a claim."""
+    leases = Mock()
+    leases.claim.side_effect = lambda name, version: name.endswith("b.md")
+    completed = CompletedIndex({"scraped-content/done.about.json"})
+    names = ["scraped-content/done.md", "scraped-content/a.md", "scraped-content/b.md"]
+
+    claimed, failed = claim_objects(leases, names, {}, completed, "fp")
+
+    assert claimed == ["scraped-content/done.md", "scraped-content/b.md"]
+    assert failed == {}
+    assert [c.args[0] for c in leases.claim.call_args_list] == names[1:]
+
+
+def test_store_errors_are_not_contention():
+    """Test a failing lease store is reported as an error, not as held elsewhere."""
+    store = Mock()
+    store.acquire.side_effect = ConnectionError("MinIO unreachable")
+    stats = ExtractionStatistics()
+    leases = WorkLeases(store, owner="a", ttl=60, stats=stats)
+
+    claimed, failed = claim_objects(leases, [NAME], {}, None, "fp")
+    leases.close()
+
+    assert claimed == []
+    assert isinstance(failed[NAME], ConnectionError)
+    assert stats.claimed_elsewhere == 0
+
+
+@patch.object(ExtractionStatistics, "save_to_file", Mock())
+@patch("src.agents.run_batch_production.process_single_file")
+@patch("src.agents.run_batch_production.AboutExtractorV2")
+def test_worker_error_releases_lease_and_run_finishes(
+    mock_extractor, mock_process, tmp_path
+):
+    """Test a raising object is recorded and released without stopping the run."""
+    from src.agents.run_batch_production import run_batch_extraction_parallel
+    from src.config.settings import settings
+
+    InMemoryMinio.reset()
+    InMemoryMinio.seed(settings.minio_bucket_name, 6, 100, "scraped-content/")
+    client = InMemoryMinio()
+    failing = "scraped-content/site-0000003/impressum.md"
+
+    def process(extractor, minio_mgr, name, *args):
+        if name == failing:
+            raise RuntimeError("boom")
+        return {"status": "success", "file": name, "time": 0.0}
+
+    mock_process.side_effect = process
+    mock_extractor.return_value.fingerprint = "fp"
+    path = str(tmp_path / "leases.sqlite3")
+
+    with (
+        patch("src.modules.minio_manager.minio_client", return_value=client),
+        patch.object(settings, "lease_backend", "sqlite"),
+        patch.object(settings, "lease_sqlite_path", path),
+        patch.object(settings, "extraction_max_workers", 1),
+        patch.object(settings, "work_queue_size", 1),
+    ):
+        run_batch_extraction_parallel()
+
+    store = SQLiteLeaseStore(path)
+    states = dict(store._conn.execute("SELECT name, state FROM leases"))
+    store.close()
+    InMemoryMinio.reset()
+
+    assert mock_process.call_count == 6
+    assert len(states) == 5
+    assert failing not in states  # Released for a retry